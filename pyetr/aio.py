@@ -0,0 +1,166 @@
+__all__ = ["AsyncReasoner"]
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from typing import Any, Callable, Optional, Sequence, TypeVar
+
+from .cancellation import CancelToken, cancel_scope
+from .inference import default_inference_procedure
+from .view import View
+
+T = TypeVar("T")
+
+
+def _run_cancellable(token: CancelToken, call: Callable[[], T]) -> T:
+    with cancel_scope(token):
+        return call()
+
+
+class AsyncReasoner:
+    """
+    Runs View operations and inference procedures from asyncio code, without
+    blocking the event loop, by running them in an executor.
+
+    At most max_in_flight operations run at once, and further calls wait for one
+    to finish. Cancelling a call stops its operation at the next operator step,
+    such as between the steps of View.update.
+    """
+
+    def __init__(
+        self, executor: Optional[Executor] = None, max_in_flight: int = 8
+    ) -> None:
+        """
+        Args:
+            executor (Optional[Executor], optional): The executor to run operations
+                in. If None, a thread pool of max_in_flight threads is created,
+                and shut down by close. With a ProcessPoolExecutor, the operations
+                and their arguments must be picklable, and an operation that has
+                already started runs to completion when cancelled, although its
+                result is discarded. Defaults to None.
+            max_in_flight (int, optional): The most operations run at once.
+                Defaults to 8.
+
+        Raises:
+            ValueError: max_in_flight is less than 1
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.max_in_flight = max_in_flight
+        self._owns_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        self._executor = executor
+        self._slots = asyncio.Semaphore(max_in_flight)
+
+    async def __aenter__(self) -> "AsyncReasoner":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shuts down the executor, if it was created by the reasoner.
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """
+        Runs a function in the executor, once fewer than max_in_flight
+        operations are running.
+
+        Args:
+            func (Callable[..., T]): The function
+            *args (Any): The positional arguments of the function
+            **kwargs (Any): The keyword arguments of the function
+
+        Raises:
+            asyncio.CancelledError: The call was cancelled
+
+        Returns:
+            T: The result of the function
+        """
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            if isinstance(self._executor, ProcessPoolExecutor):
+                return await loop.run_in_executor(
+                    self._executor, partial(func, *args, **kwargs)
+                )
+            token = CancelToken()
+            context = copy_context()
+            call = partial(func, *args, **kwargs)
+
+            def run_in_context() -> T:
+                return context.run(_run_cancellable, token, call)
+
+            future = loop.run_in_executor(self._executor, run_in_context)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                token.cancel()
+                # The operation counts as in flight until it has stopped
+                try:
+                    await future
+                except BaseException:
+                    pass
+                raise
+
+    async def apply(self, view: View, operator: str, *args: Any, **kwargs: Any) -> View:
+        """
+        Applies a View operator.
+
+        Args:
+            view (View): The view to apply the operator to
+            operator (str): The name of the operator, such as "update"
+            *args (Any): The positional arguments of the operator
+            **kwargs (Any): The keyword arguments of the operator
+
+        Returns:
+            View: The result of the operator
+        """
+        return await self.run(getattr(View, operator), view, *args, **kwargs)
+
+    async def update(self, view: View, other: View) -> View:
+        return await self.apply(view, "update", other)
+
+    async def merge(self, view: View, other: View) -> View:
+        return await self.apply(view, "merge", other)
+
+    async def factor(self, view: View, other: View) -> View:
+        return await self.apply(view, "factor", other)
+
+    async def suppose(self, view: View, other: View) -> View:
+        return await self.apply(view, "suppose", other)
+
+    async def query(self, view: View, other: View) -> View:
+        return await self.apply(view, "query", other)
+
+    async def which(self, view: View, other: View) -> View:
+        return await self.apply(view, "which", other)
+
+    async def infer(
+        self,
+        premises: Sequence[View],
+        target: Optional[View] = None,
+        procedure: Callable[..., Any] = default_inference_procedure,
+    ) -> Any:
+        """
+        Runs an inference procedure, such as those in pyetr.inference.
+
+        Args:
+            premises (Sequence[View]): The premises
+            target (Optional[View], optional): The target of the procedure, for
+                procedures that take one. Defaults to None.
+            procedure (Callable[..., Any], optional): The procedure, called as
+                procedure(premises) or procedure(premises, target). Defaults to
+                default_inference_procedure.
+
+        Returns:
+            Any: The result of the procedure
+        """
+        if target is None:
+            return await self.run(procedure, premises)
+        return await self.run(procedure, premises, target)
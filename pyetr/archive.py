@@ -0,0 +1,528 @@
+__all__ = ["ViewArchive", "ArchiveKey"]
+
+import hashlib
+import marshal
+import mmap
+import os
+import struct
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Iterable, Iterator, Literal, NamedTuple, Optional
+
+from pyetr.parsing.binary_parser import MARSHAL_VERSION, encode_view
+from pyetr.parsing.binary_parser.codec import (
+    SymbolEntry,
+    ViewDecoder,
+    ViewEncoder,
+    ViewRecord,
+)
+
+from .view import View
+
+"""
+An archive file is a header followed by a series of frames, each of which is a
+kind and a length followed by a payload. A symbol frame continues the symbol table
+shared by every view in the archive, and a view frame holds the key and record of
+a single view. Frames are only ever appended, so the file is valid after each one.
+
+An index frame, written when an archive is closed after adding to it, holds the
+keys of the views and the symbol frames added since the previous index frame,
+and the position of that frame. The index frames form a chain from the last,
+which ends the file, so an archive is opened without reading its other frames.
+"""
+
+ArchiveKey = int | str
+
+MAGIC = b"PYETRA"
+FORMAT_VERSION = 1
+_HEADER = MAGIC + bytes([FORMAT_VERSION])
+
+SYMBOL_FRAME = 0
+VIEW_FRAME = 1
+INDEX_FRAME = 2
+# kind, payload length
+_FRAME = struct.Struct("<BI")
+# symbol count in a symbol frame, key length in a view frame, view count in an
+# index frame
+_COUNT = struct.Struct("<I")
+# previous index frame, symbol frame count, then the views and symbols in the
+# archive up to the index frame
+_INDEX = struct.Struct("<QIQQ")
+# key hash and payload offset of a view, sorted by hash
+_INDEX_VIEW = struct.Struct("<QQ")
+# first symbol, payload offset and payload length of a symbol frame
+_INDEX_SYMBOLS = struct.Struct("<QQI")
+# payload offset of the index frame, ending the file
+_FOOTER = struct.Struct("<Q6s")
+FOOTER_MAGIC = b"PYETRI"
+
+DEFAULT_CACHE_SIZE = 65536
+# The most symbol frames kept once read
+_LOADED_FRAMES = 64
+
+
+class _Segment(NamedTuple):
+    """
+    The views and symbol frames listed by an index frame.
+    """
+
+    start: int
+    views: int
+    view_count: int
+    symbols: int
+    symbol_frame_count: int
+    first_symbol: int
+
+
+def _key_hash(key: ArchiveKey) -> int:
+    # Unlike hash, this is the same in every process
+    if isinstance(key, str):
+        data = b"s" + key.encode("utf-8", "surrogatepass")
+    else:
+        data = b"i" + str(key).encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def _bisect_left(
+    buffer: mmap.mmap, offset: int, count: int, item: struct.Struct, value: int
+) -> int:
+    # The first of count items at offset whose first field is at least value
+    low, high = 0, count
+    while low < high:
+        mid = (low + high) // 2
+        if item.unpack_from(buffer, offset + mid * item.size)[0] < value:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+class ViewArchive:
+    """
+    An append only file of views, each stored under a key and decoded only when
+    requested. The file is memory mapped, so only the parts read are loaded.
+
+    Predicates, functions, terms and atoms are stored once for the whole archive,
+    in the binary form of View.to_bytes, and shared by the views decoded from it.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        mode: Literal["r", "a", "w"] = "r",
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """
+        Opens an archive, reading its index.
+
+        Args:
+            path (str | os.PathLike[str]): The path of the archive file
+            mode (Literal["r", "a", "w"], optional): "r" to read an existing archive,
+                "a" to also append to it, creating it if missing, and "w" to create
+                a new empty archive, replacing any existing file. Defaults to "r".
+            cache_size (int, optional): The most decoded predicates, functions,
+                terms and atoms kept for later views. Defaults to 65536.
+
+        Raises:
+            ValueError: Invalid mode or cache size, or the file is not a view
+                archive
+        """
+        if mode not in ("r", "a", "w"):
+            raise ValueError(f"Invalid mode {mode}, expected r, a or w")
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
+        self.mode = mode
+        self._decoder = ViewDecoder(self._entry, maxsize=cache_size)
+        if mode == "w" or (mode == "a" and not os.path.exists(path)):
+            with open(path, "wb") as f:
+                f.write(_HEADER)
+        self._file = open(path, "rb" if mode == "r" else "r+b")
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._map: Optional[mmap.mmap] = None
+        # The index frames, oldest first, and those listing symbol frames
+        self._segments: list[_Segment] = []
+        self._symbol_segments: list[_Segment] = []
+        self._view_count = 0
+        self._symbol_count = 0
+        # Views and symbol frames added since the last index frame, by payload
+        # offset, with the first symbol and payload length of each symbol frame
+        self._recent: dict[ArchiveKey, int] = {}
+        self._recent_symbol_frames: list[tuple[int, int, int]] = []
+        # Symbol frames read, by payload offset
+        self._loaded: OrderedDict[int, tuple[SymbolEntry, ...]] = OrderedDict()
+        try:
+            self._open()
+        except BaseException:
+            self._close_file()
+            raise
+        self._encoder: Optional[ViewEncoder] = None
+
+    def __enter__(self) -> "ViewArchive":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the archive file, first writing an index of the views added to it.
+        """
+        if self._file.closed:
+            return
+        try:
+            if self.mode != "r" and (self._recent or self._recent_symbol_frames):
+                self._write_index()
+        finally:
+            self._close_file()
+
+    def _close_file(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def _buffer(self) -> mmap.mmap:
+        # The file may have grown since it was mapped
+        if self._map is None or len(self._map) < self._size:
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _open(self) -> None:
+        if self._size < len(_HEADER) or self._buffer()[: len(MAGIC)] != MAGIC:
+            raise ValueError("File is not a view archive")
+        buffer = self._buffer()
+        if buffer[len(MAGIC) : len(_HEADER)] != _HEADER[len(MAGIC) :]:
+            raise ValueError(
+                f"Unsupported view archive version, expected {FORMAT_VERSION}"
+            )
+        if self._size >= len(_HEADER) + _FRAME.size + _FOOTER.size:
+            start, magic = _FOOTER.unpack_from(buffer, self._size - _FOOTER.size)
+            if (
+                magic == FOOTER_MAGIC
+                and len(_HEADER) + _FRAME.size <= start < self._size
+                and _FRAME.unpack_from(buffer, start - _FRAME.size)
+                == (INDEX_FRAME, self._size - start)
+            ):
+                self._read_index(start)
+                return
+        # The archive was not closed after adding to it, so the frames after its
+        # last index are found by reading every frame
+        self._scan()
+
+    def _read_index(self, start: int) -> None:
+        # Follows the chain of index frames from the last
+        buffer = self._buffer()
+        segments: list[_Segment] = []
+        totals: list[tuple[int, int]] = []
+        while start:
+            if segments and start >= segments[-1].start:
+                raise ValueError("Malformed view archive index")
+            (view_count,) = _COUNT.unpack_from(buffer, start)
+            previous, symbol_frame_count, views, symbols = _INDEX.unpack_from(
+                buffer, start + _COUNT.size
+            )
+            view_table = start + _COUNT.size + _INDEX.size
+            segments.append(
+                _Segment(
+                    start=start,
+                    views=view_table,
+                    view_count=view_count,
+                    symbols=view_table + view_count * _INDEX_VIEW.size,
+                    symbol_frame_count=symbol_frame_count,
+                    first_symbol=0,
+                )
+            )
+            totals.append((views, symbols))
+            start = previous
+        segments.reverse()
+        self._view_count, self._symbol_count = totals[0]
+        first_symbol = 0
+        for segment, (_, symbols) in zip(segments, reversed(totals)):
+            self._segments.append(segment._replace(first_symbol=first_symbol))
+            first_symbol = symbols
+        self._symbol_segments = [s for s in self._segments if s.symbol_frame_count]
+
+    def _scan(self) -> None:
+        buffer = self._buffer()
+        offset = len(_HEADER)
+        last_index = 0
+        while offset + _FRAME.size <= self._size:
+            kind, length = _FRAME.unpack_from(buffer, offset)
+            start = offset + _FRAME.size
+            if start + length > self._size:
+                break
+            (count,) = _COUNT.unpack_from(buffer, start)
+            if kind == SYMBOL_FRAME:
+                self._recent_symbol_frames.append((self._symbol_count, start, length))
+                self._symbol_count += count
+            elif kind == VIEW_FRAME:
+                self._recent[self._view_key(start)] = start
+                self._view_count += 1
+            elif kind == INDEX_FRAME:
+                # Only the frames after the last index are kept
+                last_index = start
+                _, _, self._view_count, self._symbol_count = _INDEX.unpack_from(
+                    buffer, start + _COUNT.size
+                )
+                self._recent.clear()
+                self._recent_symbol_frames.clear()
+            else:
+                raise ValueError(f"Unknown archive frame kind {kind}")
+            offset = start + length
+        if last_index:
+            view_count, symbol_count = self._view_count, self._symbol_count
+            self._read_index(last_index)
+            self._view_count, self._symbol_count = view_count, symbol_count
+        if offset != self._size:
+            # An incomplete frame, left by a write that did not finish
+            if self.mode == "r":
+                raise ValueError("View archive ends with an incomplete frame")
+            self._size = offset
+            buffer.close()
+            self._map = None
+            self._file.truncate(offset)
+
+    def _symbol_frame(self, i: int) -> tuple[int, int, int]:
+        # The first symbol, payload offset and payload length of the frame of i
+        recent = self._recent_symbol_frames
+        if recent and i >= recent[0][0]:
+            return recent[bisect_right(recent, i, key=lambda f: f[0]) - 1]
+        segments = self._symbol_segments
+        segment = segments[bisect_right(segments, i, key=lambda s: s.first_symbol) - 1]
+        buffer = self._buffer()
+        frame = (
+            _bisect_left(
+                buffer,
+                segment.symbols,
+                segment.symbol_frame_count,
+                _INDEX_SYMBOLS,
+                i + 1,
+            )
+            - 1
+        )
+        return _INDEX_SYMBOLS.unpack_from(
+            buffer, segment.symbols + frame * _INDEX_SYMBOLS.size
+        )
+
+    def _symbol_entries(self, start: int, length: int) -> tuple[SymbolEntry, ...]:
+        loaded = self._loaded
+        if start in loaded:
+            loaded.move_to_end(start)
+            return loaded[start]
+        entries = marshal.loads(self._buffer()[start + _COUNT.size : start + length])
+        loaded[start] = entries
+        if len(loaded) > _LOADED_FRAMES:
+            loaded.popitem(last=False)
+        return entries
+
+    def _entry(self, i: int) -> SymbolEntry:
+        if i < 0 or i >= self._symbol_count:
+            raise IndexError(i)
+        first, start, length = self._symbol_frame(i)
+        return self._symbol_entries(start, length)[i - first]
+
+    def _view_key(self, start: int) -> ArchiveKey:
+        buffer = self._buffer()
+        (count,) = _COUNT.unpack_from(buffer, start)
+        return marshal.loads(buffer[start + _COUNT.size : start + _COUNT.size + count])
+
+    def _find(self, key: object) -> Optional[int]:
+        # The payload offset of the view stored under the key
+        if isinstance(key, bool) or not isinstance(key, (int, str)):
+            return None
+        if key in self._recent:
+            return self._recent[key]
+        key_hash = _key_hash(key)
+        buffer = self._buffer()
+        for segment in self._segments:
+            i = _bisect_left(
+                buffer, segment.views, segment.view_count, _INDEX_VIEW, key_hash
+            )
+            while i < segment.view_count:
+                found_hash, start = _INDEX_VIEW.unpack_from(
+                    buffer, segment.views + i * _INDEX_VIEW.size
+                )
+                if found_hash != key_hash:
+                    break
+                if self._view_key(start) == key:
+                    return start
+                i += 1
+        return None
+
+    def __len__(self) -> int:
+        return self._view_count
+
+    def __contains__(self, key: object) -> bool:
+        return self._find(key) is not None
+
+    def __iter__(self) -> Iterator[ArchiveKey]:
+        return iter(self.keys())
+
+    def keys(self) -> list[ArchiveKey]:
+        """
+        Returns:
+            list[ArchiveKey]: The keys of the views, in the order they were added.
+        """
+        buffer = self._buffer()
+        starts = sorted(
+            _INDEX_VIEW.unpack_from(buffer, segment.views + i * _INDEX_VIEW.size)[1]
+            for segment in self._segments
+            for i in range(segment.view_count)
+        )
+        return [self._view_key(start) for start in starts] + list(self._recent)
+
+    def __getitem__(self, key: ArchiveKey) -> View:
+        """
+        Decodes the view stored under a key.
+
+        Args:
+            key (ArchiveKey): The key
+
+        Raises:
+            KeyError: No view is stored under the key
+
+        Returns:
+            View: The view
+        """
+        start = self._find(key)
+        if start is None:
+            raise KeyError(key)
+        return self._view(start)
+
+    def get(self, key: ArchiveKey, default: Optional[View] = None) -> Optional[View]:
+        """
+        Args:
+            key (ArchiveKey): The key
+            default (Optional[View], optional): Returned if no view is stored under
+                the key. Defaults to None.
+
+        Returns:
+            Optional[View]: The view stored under the key, or the default.
+        """
+        start = self._find(key)
+        if start is None:
+            return default
+        return self._view(start)
+
+    def _view(self, start: int) -> View:
+        buffer = self._buffer()
+        _, length = _FRAME.unpack_from(buffer, start - _FRAME.size)
+        (count,) = _COUNT.unpack_from(buffer, start)
+        record: ViewRecord = marshal.loads(
+            buffer[start + _COUNT.size + count : start + length]
+        )
+        return View._from_view_storage(self._decoder.view(record))
+
+    def _write_frame(self, kind: int, count: int, payload: bytes) -> int:
+        self._file.seek(self._size)
+        self._file.write(
+            _FRAME.pack(kind, _COUNT.size + len(payload)) + _COUNT.pack(count) + payload
+        )
+        start = self._size + _FRAME.size
+        self._size += _FRAME.size + _COUNT.size + len(payload)
+        return start
+
+    def _write_index(self) -> None:
+        previous = self._segments[-1].start if self._segments else 0
+        views = sorted((_key_hash(key), start) for key, start in self._recent.items())
+        start = self._size + _FRAME.size
+        self._write_frame(
+            INDEX_FRAME,
+            len(views),
+            _INDEX.pack(
+                previous,
+                len(self._recent_symbol_frames),
+                self._view_count,
+                self._symbol_count,
+            )
+            + b"".join([_INDEX_VIEW.pack(*view) for view in views])
+            + b"".join([_INDEX_SYMBOLS.pack(*f) for f in self._recent_symbol_frames])
+            + _FOOTER.pack(start, FOOTER_MAGIC),
+        )
+        self._file.flush()
+        self._segments = []
+        self._recent.clear()
+        self._recent_symbol_frames.clear()
+        self._read_index(start)
+
+    def _get_encoder(self) -> ViewEncoder:
+        # Appending to an existing archive continues its symbol table, from the
+        # entries alone
+        if self._encoder is None:
+            encoder = ViewEncoder()
+            i = 0
+            while i < self._symbol_count:
+                first, start, length = self._symbol_frame(i)
+                entries = marshal.loads(
+                    self._buffer()[start + _COUNT.size : start + length]
+                )
+                for entry in entries[i - first :]:
+                    encoder.add_written(entry)
+                i = first + len(entries)
+            self._encoder = encoder
+        return self._encoder
+
+    def append(self, view: View, key: Optional[ArchiveKey] = None) -> ArchiveKey:
+        """
+        Adds a view to the end of the archive.
+
+        Args:
+            view (View): The view
+            key (Optional[ArchiveKey], optional): The key to store it under. If
+                None, the number of views already in the archive is used.
+                Defaults to None.
+
+        Raises:
+            ValueError: The archive is read only, or the key is invalid or
+                already used
+
+        Returns:
+            ArchiveKey: The key the view is stored under
+        """
+        if self.mode == "r":
+            raise ValueError("Cannot append to an archive opened in read mode")
+        if key is None:
+            key = self._view_count
+        if isinstance(key, bool) or not isinstance(key, (int, str)):
+            raise ValueError(f"Archive keys must be int or str, received {key!r}")
+        if key in self:
+            raise ValueError(f"Key {key!r} is already in the archive")
+        encoder = self._get_encoder()
+        record = encode_view(encoder, view)
+        # The encoder would otherwise hold every view added
+        encoder.forget_objects()
+        symbols = encoder.new_symbols()
+        if symbols:
+            start = self._write_frame(
+                SYMBOL_FRAME,
+                len(symbols),
+                marshal.dumps(tuple(symbols), MARSHAL_VERSION),
+            )
+            self._recent_symbol_frames.append(
+                (self._symbol_count, start, self._size - start)
+            )
+            self._symbol_count += len(symbols)
+        encoded_key = marshal.dumps(key, MARSHAL_VERSION)
+        self._recent[key] = self._write_frame(
+            VIEW_FRAME,
+            len(encoded_key),
+            encoded_key + marshal.dumps(record, MARSHAL_VERSION),
+        )
+        self._view_count += 1
+        self._file.flush()
+        return key
+
+    def extend(self, views: Iterable[View]) -> list[ArchiveKey]:
+        """
+        Adds views to the end of the archive, each under the number of views
+        before it.
+
+        Args:
+            views (Iterable[View]): The views
+
+        Returns:
+            list[ArchiveKey]: The keys the views are stored under
+        """
+        return [self.append(view) for view in views]
@@ -12,6 +12,8 @@ class AbstractAtom(ABC):
     The abstract base class of all atoms and open atoms.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def detailed(self) -> str: ...
@@ -42,6 +44,8 @@ class Atom(AbstractAtom):
     The abstract base class of all atoms (not opens).
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def arb_objects(self) -> set[ArbitraryObject]:
@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar
+from typing import Generic, Hashable, TypeVar
 
 from .abstract import AbstractAtom
 from .predicate import Predicate
@@ -17,6 +17,8 @@ class PredicateAtomLike(Generic[TermType]):
     with PredicateAtom and PredicateOpenAtom
     """
 
+    __slots__ = ("predicate", "terms", "_hash")
+
     predicate: Predicate
     terms: tuple[TermType, ...]
 
@@ -31,18 +33,33 @@ class PredicateAtomLike(Generic[TermType]):
             )
         self.predicate = predicate
         self.terms = terms
+        self._hash = hash((type(self).__name__, self.predicate, self.terms))
+
+    def _intern_key(self) -> Hashable:
+        return (
+            type(self),
+            self.predicate.name,
+            self.predicate.arity,
+            self.predicate.verifier,
+            tuple(id(t) for t in self.terms),
+        )
+
+    def __reduce__(self):
+        return (type(self), (self.predicate, self.terms))
 
     @property
     def detailed(self) -> str:
         return f"<{type(self).__name__} predicate={self.predicate.detailed} terms=({','.join(t.detailed for t in self.terms)})>"
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, type(self)):
             return False
         return self.predicate == other.predicate and self.terms == other.terms
 
     def __hash__(self) -> int:
-        return hash((type(self).__name__, self.predicate, self.terms))
+        return self._hash
 
     def __repr__(self) -> str:
         terms = ",".join([repr(i) for i in self.terms])
@@ -65,4 +82,8 @@ class PredicateAtomLike(Generic[TermType]):
             assert isinstance(new_predicate, Predicate)
         else:
             new_predicate = self.predicate
+        if new_predicate is self.predicate and all(
+            n is o for n, o in zip(new_terms, self.terms)
+        ):
+            return self
         return self.__class__(predicate=new_predicate, terms=tuple(new_terms))
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Hashable, Iterable
+
+from pyetr.interning import InternMeta
 
 from .abstract import Atom
 from .predicate_atom import PredicateAtom
@@ -8,30 +10,41 @@ if TYPE_CHECKING:  # pragma: not covered
     from pyetr.types import MatchCallback, MatchItem
 
 
-class DoAtom(Atom):
+class DoAtom(Atom, metaclass=InternMeta):
     """
     This "AtomLike" is a mixin for the doatom-like properties associated
     with DoAtom and OpenDoAtom
     """
 
-    atoms: set[PredicateAtom]
+    __slots__ = ("atoms", "polarity", "_hash", "__weakref__")
+
+    atoms: frozenset[PredicateAtom]
     polarity: bool
 
     def __init__(self, atoms: Iterable[PredicateAtom], polarity: bool = True) -> None:
-        self.atoms = set(atoms)
+        self.atoms = frozenset(atoms)
         self.polarity = polarity
+        self._hash = hash((type(self).__name__, self.atoms, self.polarity))
+
+    def _intern_key(self) -> Hashable:
+        return (type(self), self.polarity, frozenset(id(a) for a in self.atoms))
+
+    def __reduce__(self):
+        return (type(self), (self.atoms, self.polarity))
 
     @property
     def detailed(self) -> str:
         return f"<{type(self).__name__} polarity={self.polarity} atoms=({','.join(a.detailed for a in self.sorted_iter_atoms())})>"
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, type(self)):
             return False
         return self.atoms == other.atoms and self.polarity == other.polarity
 
     def __hash__(self) -> int:
-        return hash((type(self).__name__, frozenset(self.atoms), self.polarity))
+        return self._hash
 
     def __repr__(self) -> str:
         terms = "".join([repr(i) for i in self.sorted_iter_atoms()])
@@ -51,22 +64,31 @@ class DoAtom(Atom):
             output_objs |= atom.arb_objects
         return output_objs
 
+    def _with_atoms(self, new_atoms: list[PredicateAtom]) -> "DoAtom":
+        if all(n is o for n, o in zip(new_atoms, self.atoms)):
+            return self
+        return DoAtom(new_atoms, polarity=self.polarity)
+
     def _replace_arbs(self, replacements: dict[ArbitraryObject, Term]) -> "DoAtom":
-        return DoAtom({atom._replace_arbs(replacements) for atom in self.atoms})
+        return self._with_atoms(
+            [atom._replace_arbs(replacements) for atom in self.atoms]
+        )
 
     def replace_term(
         self,
         old_term: Term,
         new_term: Term,
     ) -> "DoAtom":
-        return DoAtom({atom.replace_term(old_term, new_term) for atom in self.atoms})
+        return self._with_atoms(
+            [atom.replace_term(old_term, new_term) for atom in self.atoms]
+        )
 
     def match(
         self,
         old_item: "MatchItem",
         callback: "MatchCallback",
     ) -> "DoAtom":
-        return DoAtom({atom.match(old_item, callback) for atom in self.atoms})
+        return self._with_atoms([atom.match(old_item, callback) for atom in self.atoms])
 
     def sorted_iter_atoms(self):
         return sorted(self.atoms, key=str)
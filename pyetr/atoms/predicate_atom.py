@@ -2,12 +2,16 @@ __all__ = ["PredicateAtom"]
 
 from typing import cast
 
+from pyetr.interning import InternMeta
+
 from .abstract import Atom
 from .atom_likes import PredicateAtomLike
 from .terms import ArbitraryObject, FunctionalTerm, Term
 
 
-class PredicateAtom(PredicateAtomLike[Term], Atom):
+class PredicateAtom(PredicateAtomLike[Term], Atom, metaclass=InternMeta):
+    __slots__ = ("__weakref__",)
+
     @property
     def arb_objects(self) -> set[ArbitraryObject]:
         output_objs: set[ArbitraryObject] = set()
@@ -26,6 +30,8 @@ class PredicateAtom(PredicateAtomLike[Term], Atom):
     def _replace_arbs(
         self, replacements: dict[ArbitraryObject, Term]
     ) -> "PredicateAtom":
+        if not replacements:
+            return self
         new_terms: list[Term] = []
         for term in self.terms:
             if term in replacements:
@@ -38,6 +44,8 @@ class PredicateAtom(PredicateAtomLike[Term], Atom):
                 else:
                     assert False
             new_terms.append(replacement)
+        if all(n is o for n, o in zip(new_terms, self.terms)):
+            return self
         return PredicateAtom(predicate=self.predicate, terms=tuple(new_terms))
 
     def replace_term(
@@ -49,4 +57,6 @@ class PredicateAtom(PredicateAtomLike[Term], Atom):
             term.replace_term(old_term=old_term, new_term=new_term)
             for term in self.terms
         ]
+        if all(n is o for n, o in zip(new_terms, self.terms)):
+            return self
         return PredicateAtom(predicate=self.predicate, terms=tuple(new_terms))
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Generic, Iterable, Self, TypeVar
+from typing import TYPE_CHECKING, Generic, Hashable, Iterable, Self, TypeVar
 
 from .function import Function
 from .multiset import Multiset
@@ -13,6 +13,8 @@ class AbstractTerm(ABC):
     The abstract base class for all terms.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __eq__(self, other: object) -> bool: ...
 
@@ -42,6 +44,8 @@ class AbstractArbitraryObject(AbstractTerm):
     The abstract base class for all arbitrary objects.
     """
 
+    __slots__ = ("name", "_hash")
+
     name: str
 
     def __init__(self, name: str):
@@ -50,14 +54,23 @@ class AbstractArbitraryObject(AbstractTerm):
             name (str): The name of the arbitrary object.
         """
         self.name = name
+        self._hash = hash(type(self).__name__ + self.name)
+
+    def _intern_key(self) -> Hashable:
+        return (type(self), self.name)
+
+    def __reduce__(self):
+        return (type(self), (self.name,))
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, type(self)):
             return False
         return self.name == other.name
 
     def __hash__(self) -> int:
-        return hash(type(self).__name__ + self.name)
+        return self._hash
 
     def __repr__(self) -> str:
         return f"{self.name}"
@@ -84,6 +97,8 @@ class AbstractFunctionalTerm(Generic[TermType], AbstractTerm):
     The abstract base class for all functional terms.
     """
 
+    __slots__ = ("f", "t", "_hash")
+
     f: Function
     t: tuple[TermType, ...] | Multiset[TermType]
 
@@ -115,14 +130,30 @@ class AbstractFunctionalTerm(Generic[TermType], AbstractTerm):
         if out is not None:
             self.f = out.f
             self.t = out.t
+        self._hash = hash((type(self).__name__, self.f, self.t))
+
+    def _intern_key(self) -> Hashable:
+        return (
+            type(self),
+            type(self.f),
+            self.f.name,
+            self.f.arity,
+            self.f.func_caller,
+            tuple(id(t) for t in self.t),
+        )
+
+    def __reduce__(self):
+        return (type(self), (self.f, tuple(self.t)))
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, type(self)):
             return False
         return self.f == other.f and self.t == other.t
 
     def __hash__(self) -> int:
-        return hash((type(self).__name__, self.f, self.t))
+        return self._hash
 
     def __repr__(self) -> str:
         if self.f.arity == 0:
@@ -150,4 +181,6 @@ class AbstractFunctionalTerm(Generic[TermType], AbstractTerm):
         new_terms = [
             term.match(old_item=old_item, callback=callback) for term in self.t
         ]
+        if new_f is self.f and all(n is o for n, o in zip(new_terms, self.t)):
+            return self
         return self.__class__(f=new_f, t=tuple(new_terms))
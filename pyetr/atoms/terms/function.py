@@ -167,6 +167,7 @@ class RealNumber(Function):
 
     def __init__(self, num: float) -> None:
         super().__init__(str(num), 0)
+        self._num = float(self.name)
 
     @property
     def num(self) -> float:
@@ -176,7 +177,7 @@ class RealNumber(Function):
         Returns:
             float: The number
         """
-        return float(self.name)
+        return self._num
 
     def __hash__(self) -> int:
         return hash(self.name) + hash(self.arity) + hash("num")
@@ -1,4 +1,4 @@
-from typing import Generic, Hashable, Iterable, TypeVar, cast
+from typing import Generic, Hashable, Iterable, Optional, TypeVar, cast
 
 T = TypeVar("T", bound=Hashable)
 
@@ -9,9 +9,14 @@ class Multiset(Generic[T]):
     """
 
     _items: list[T]
+    _hash: Optional[int]
 
     def __init__(self, items: Iterable[T]) -> None:
         self._items = sorted(items, key=hash)
+        self._hash = None
+
+    def __reduce__(self):
+        return (type(self), (self._items,))
 
     def __iter__(self):
         return iter(self._items)
@@ -26,7 +31,9 @@ class Multiset(Generic[T]):
             return self._items == cast(Multiset[T], __value)._items
 
     def __hash__(self) -> int:
-        return hash(type(self).__name__) + hash(tuple(self._items))
+        if self._hash is None:
+            self._hash = hash(type(self).__name__) + hash(tuple(self._items))
+        return self._hash
 
     def __len__(self):
         return len(self._items)
@@ -36,6 +43,11 @@ class Multiset(Generic[T]):
         return f"<{type(self).__name__} items={self._items.__repr__()}>"
 
     def __add__(self, other: "Multiset[T]") -> "Multiset[T]":
+        # Multisets are not changed once built, so an empty side can be skipped
+        if not other._items:
+            return self
+        if not self._items:
+            return other
         return Multiset(self._items + other._items)
 
     def sorted_iter(self):
@@ -1,6 +1,6 @@
 from pyetr.atoms.terms.term import FunctionalTerm, Term
 
-from .function import Function
+from .function import Function, RealNumber
 from .multiset import Multiset
 
 
@@ -16,6 +16,19 @@ XBar = Function("x̄", 2, func_caller=multi_func_new)
 Summation = Function("σ", None, func_caller=sum_func_new)
 
 
+def _product_term(s: Term, t: Term) -> Term:
+    # The product of two numbers is folded directly, rather than by building the
+    # x̄ term and folding it on construction
+    if (
+        isinstance(s, FunctionalTerm)
+        and isinstance(t, FunctionalTerm)
+        and isinstance(s.f, RealNumber)
+        and isinstance(t.f, RealNumber)
+    ):
+        return FunctionalTerm(f=RealNumber(multi_func_new(s.f.num, t.f.num)), t=())
+    return FunctionalTerm(f=XBar, t=(s, t))
+
+
 def multiset_product(m1: Multiset[Term], m2: Multiset[Term]) -> Multiset[Term]:
     """
     Based on Definition 5.15, p208-209
@@ -32,6 +45,4 @@ def multiset_product(m1: Multiset[Term], m2: Multiset[Term]) -> Multiset[Term]:
     elif len(m2) == 0:
         return m1
     else:
-        return Multiset(
-            [FunctionalTerm(f=XBar, t=(s_i, t_j)) for s_i in m1 for t_j in m2]
-        )
+        return Multiset([_product_term(s_i, t_j) for s_i in m1 for t_j in m2])
@@ -3,10 +3,14 @@ __all__ = ["Term", "ArbitraryObject", "FunctionalTerm"]
 from abc import abstractmethod
 from typing import cast
 
+from pyetr.interning import InternMeta
+
 from .abstract_term import AbstractArbitraryObject, AbstractFunctionalTerm, AbstractTerm
 
 
 class Term(AbstractTerm):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def arb_objects(self) -> set["ArbitraryObject"]:
@@ -53,7 +57,9 @@ class Term(AbstractTerm):
         ...
 
 
-class ArbitraryObject(AbstractArbitraryObject, Term):
+class ArbitraryObject(AbstractArbitraryObject, Term, metaclass=InternMeta):
+    __slots__ = ("__weakref__",)
+
     @property
     def arb_objects(self) -> set["ArbitraryObject"]:
         return {self}
@@ -77,7 +83,9 @@ class ArbitraryObject(AbstractArbitraryObject, Term):
             return self
 
 
-class FunctionalTerm(AbstractFunctionalTerm[Term], Term):
+class FunctionalTerm(AbstractFunctionalTerm[Term], Term, metaclass=InternMeta):
+    __slots__ = ("__weakref__",)
+
     @property
     def arb_objects(self) -> set[ArbitraryObject]:
         output_set: set[ArbitraryObject] = set()
@@ -94,6 +102,8 @@ class FunctionalTerm(AbstractFunctionalTerm[Term], Term):
         self,
         replacements: dict[ArbitraryObject, Term],
     ) -> "FunctionalTerm":
+        if not replacements:
+            return self
         new_terms: list[Term] = []
         for term in self.t:
             if term in replacements:
@@ -106,6 +116,8 @@ class FunctionalTerm(AbstractFunctionalTerm[Term], Term):
                 else:
                     assert False
             new_terms.append(replacement)
+        if all(n is o for n, o in zip(new_terms, self.t)):
+            return self
         return FunctionalTerm(f=self.f, t=tuple(new_terms))
 
     def replace_term(
@@ -120,6 +132,8 @@ class FunctionalTerm(AbstractFunctionalTerm[Term], Term):
                 term.replace_term(old_term=old_term, new_term=new_term)
                 for term in self.t
             ]
+            if all(n is o for n, o in zip(new_terms, self.t)):
+                return self
             return FunctionalTerm(f=self.f, t=tuple(new_terms))
 
 
@@ -0,0 +1,194 @@
+__all__ = [
+    "CacheInfo",
+    "OperatorCache",
+    "enable_operator_cache",
+    "disable_operator_cache",
+    "clear_operator_cache",
+    "operator_cache_info",
+    "cached_operator",
+]
+
+import inspect
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable, NamedTuple, Optional, TypeVar
+
+from .validation import validation_debug_enabled
+
+DEFAULT_MAXSIZE = 1024
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class OperatorCache:
+    """
+    A bounded mapping from operator calls to their results, evicting the least
+    recently used entry once full. It may be shared between threads.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """
+        Args:
+            maxsize (int, optional): The most entries held at once. Defaults to 1024.
+
+        Raises:
+            ValueError: maxsize is less than 1
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> tuple[bool, Any]:
+        """
+        Args:
+            key (Hashable): The key of the call
+
+        Returns:
+            tuple[bool, Any]: Whether the key was found, and the cached result if so.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def store(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a result, evicting the least recently used entry if full.
+
+        Args:
+            key (Hashable): The key of the call
+            value (Any): The result of the call
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+            )
+
+
+_cache: Optional[OperatorCache] = None
+
+
+def enable_operator_cache(maxsize: int = DEFAULT_MAXSIZE) -> None:
+    """
+    Turns on caching of View operator results. Each call of a cached operator with
+    equal views and options returns the same result as the first call. Enabling
+    again replaces the cache with an empty one of the new size.
+
+    Args:
+        maxsize (int, optional): The most results held at once. Defaults to 1024.
+    """
+    global _cache
+    _cache = OperatorCache(maxsize)
+
+
+def disable_operator_cache() -> None:
+    """
+    Turns off caching of View operator results, discarding the cache.
+    """
+    global _cache
+    _cache = None
+
+
+def clear_operator_cache() -> None:
+    """
+    Empties the operator cache and resets its statistics, if enabled.
+    """
+    if _cache is not None:
+        _cache.clear()
+
+
+def operator_cache_info() -> Optional[CacheInfo]:
+    """
+    Returns:
+        Optional[CacheInfo]: The hits, misses, maximum size and current size of
+            the operator cache, or None if it is not enabled.
+    """
+    if _cache is None:
+        return None
+    return _cache.info()
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)  # pyright: ignore
+    return value
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def cached_operator(func: F) -> F:
+    """
+    Decorates a View operator so that, when the operator cache is enabled, its
+    results are looked up by operator name, views and options. Calls in verbose
+    mode always run the operator, so their output is still printed, as do calls
+    while validation debug mode is on, so that the views they build are checked.
+
+    Args:
+        func (F): The operator
+
+    Returns:
+        F: The cached operator
+    """
+    name = func.__name__
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        cache = _cache
+        if cache is None or validation_debug_enabled():
+            return func(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+        if arguments.get("verbose", False):
+            return func(*args, **kwargs)
+        key = (
+            name,
+            tuple((k, _freeze(v)) for k, v in arguments.items() if k != "verbose"),
+        )
+        found, value = cache.lookup(key)
+        if found:
+            return value
+        value = func(*args, **kwargs)
+        cache.store(key, value)
+        return value
+
+    return wrapper  # pyright: ignore
@@ -0,0 +1,85 @@
+__all__ = ["CancelToken", "cancel_scope", "check_cancelled", "cancellable_operator"]
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from .exceptions import OperationCancelledError
+
+
+class CancelToken:
+    """
+    A flag that is set to cancel running operations. Operations check the token
+    of their context between steps, and stop once it is set.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """
+        Sets the token, so that operations using it stop at their next step.
+        """
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+_token: ContextVar[Optional[CancelToken]] = ContextVar("cancel_token", default=None)
+
+
+@contextmanager
+def cancel_scope(token: CancelToken) -> Iterator[CancelToken]:
+    """
+    Makes the operations run within the scope stop once the token is set.
+
+    Args:
+        token (CancelToken): The token
+
+    Returns:
+        Iterator[CancelToken]: The token
+    """
+    reset = _token.set(token)
+    try:
+        yield token
+    finally:
+        _token.reset(reset)
+
+
+def check_cancelled() -> None:
+    """
+    Called by operations between their steps.
+
+    Raises:
+        OperationCancelledError: The token of the current scope is set
+    """
+    token = _token.get()
+    if token is not None and token.cancelled:
+        raise OperationCancelledError("Operation cancelled")
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def cancellable_operator(func: F) -> F:
+    """
+    Decorates a View operator so that each call first checks whether the
+    operation it is part of has been cancelled.
+
+    Args:
+        func (F): The operator
+
+    Returns:
+        F: The cancellable operator
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        check_cancelled()
+        return func(*args, **kwargs)
+
+    return wrapper  # pyright: ignore
@@ -0,0 +1,333 @@
+__all__ = ["CanonicalKey", "canonical_key"]
+
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from .atoms import DoAtom
+from .atoms.abstract import AbstractAtom
+from .atoms.atom_likes import PredicateAtomLike
+from .atoms.terms import Multiset, QuestionMark, RealNumber
+from .atoms.terms.abstract_term import (
+    AbstractArbitraryObject,
+    AbstractFunctionalTerm,
+    AbstractTerm,
+)
+from .stateset import State
+from .weight import Weight
+
+if TYPE_CHECKING:  # pragma: not covered
+    from .view import View
+
+CanonicalKey = tuple[Any, ...]
+Labeller = Callable[[str], int]
+Colouring = dict[str, int]
+
+
+def _term_key(term: AbstractTerm, label: Labeller) -> tuple[Any, ...]:
+    """
+    Encodes a term (or open term) as a comparable tuple, where arbitrary objects
+    are represented only by their label.
+
+    Args:
+        term (AbstractTerm): The term to encode
+        label (Labeller): Gives the label of an arbitrary object from its name.
+
+    Returns:
+        tuple[Any, ...]: The encoded term.
+    """
+    if isinstance(term, AbstractArbitraryObject):
+        return (0, label(term.name))
+    elif isinstance(term, QuestionMark):
+        return (1,)
+    elif isinstance(term, AbstractFunctionalTerm):
+        sub_keys = [_term_key(t, label) for t in term.t]
+        if isinstance(term.t, Multiset):
+            sub_keys.sort()
+        arity = -1 if term.f.arity is None else term.f.arity
+        return (
+            2,
+            term.f.name,
+            arity,
+            isinstance(term.f, RealNumber),
+            tuple(sub_keys),
+        )
+    else:
+        assert False
+
+
+def _atom_key(atom: AbstractAtom, label: Labeller) -> tuple[Any, ...]:
+    if isinstance(atom, PredicateAtomLike):
+        return (
+            0,
+            atom.predicate.name,
+            atom.predicate.arity,
+            atom.predicate.verifier,
+            tuple(_term_key(t, label) for t in atom.terms),
+        )
+    elif isinstance(atom, DoAtom):
+        return (
+            1,
+            atom.polarity,
+            tuple(sorted(_atom_key(a, label) for a in atom.atoms)),
+        )
+    else:
+        assert False
+
+
+def _state_key(state: State, label: Labeller) -> tuple[Any, ...]:
+    return tuple(sorted(_atom_key(atom, label) for atom in state))
+
+
+def _weight_key(weight: Weight, label: Labeller) -> tuple[Any, ...]:
+    return (
+        tuple(sorted(_term_key(t, label) for t in weight.multiplicative)),
+        tuple(sorted(_term_key(t, label) for t in weight.additive)),
+    )
+
+
+def _term_names(term: AbstractTerm) -> set[str]:
+    if isinstance(term, AbstractArbitraryObject):
+        return {term.name}
+    elif isinstance(term, AbstractFunctionalTerm):
+        names: set[str] = set()
+        for t in term.t:
+            names |= _term_names(t)
+        return names
+    else:
+        return set()
+
+
+def _atom_names(atom: AbstractAtom) -> set[str]:
+    names: set[str] = set()
+    if isinstance(atom, PredicateAtomLike):
+        for t in atom.terms:
+            names |= _term_names(t)
+    elif isinstance(atom, DoAtom):
+        for a in atom.atoms:
+            names |= _atom_names(a)
+    return names
+
+
+def _rank(values: dict[str, Any]) -> Colouring:
+    """
+    Compresses arbitrary comparable colours into consecutive integers, preserving
+    their order.
+    """
+    ordered = sorted(set(values.values()))
+    ranks = {v: i for i, v in enumerate(ordered)}
+    return {name: ranks[v] for name, v in values.items()}
+
+
+class _Canonicaliser:
+    """
+    Computes a canonical labelling of the arbitrary objects of a view, by colour
+    refinement on the occurrences of each arbitrary object, with backtracking only
+    over arbitrary objects that refinement cannot tell apart.
+    """
+
+    def __init__(self, view: "View") -> None:
+        dep_rel = view.dependency_relation
+        self.universals = {u.name for u in dep_rel.universals}
+        self.existentials = {e.name for e in dep_rel.existentials}
+        self.dependencies = [
+            (d.existential.name, d.universal.name) for d in dep_rel.dependencies
+        ]
+        self.stage = [(s, view.weights[s]) for s in view.stage]
+        self.supposition = list(view.supposition)
+        self.issues = list(view.issue_structure)
+
+        # Each item is an encoder taking a labeller; occurrences maps each arbitrary
+        # object name to the items it appears in.
+        self.items: list[Callable[[Labeller], tuple[Any, ...]]] = []
+        self.occurrences: dict[str, list[int]] = {}
+        names = self.universals | self.existentials
+        for s, w in self.stage:
+            s_names: set[str] = set()
+            for atom in s:
+                s_names |= _atom_names(atom)
+            for t in w.multiplicative + w.additive:
+                s_names |= _term_names(t)
+            self._add_item(
+                lambda label, s=s, w=w: (
+                    0,
+                    _state_key(s, label),
+                    _weight_key(w, label),
+                ),
+                s_names,
+            )
+            names |= s_names
+        for s in self.supposition:
+            s_names = set()
+            for atom in s:
+                s_names |= _atom_names(atom)
+            self._add_item(lambda label, s=s: (1, _state_key(s, label)), s_names)
+            names |= s_names
+        for t, a in self.issues:
+            i_names = _term_names(t) | _atom_names(a)
+            self._add_item(
+                lambda label, t=t, a=a: (2, _term_key(t, label), _atom_key(a, label)),
+                i_names,
+            )
+            names |= i_names
+        for e, u in self.dependencies:
+            self._add_item(lambda label, e=e, u=u: (3, label(e), label(u)), {e, u})
+        self.names = names
+
+    def _add_item(
+        self, encoder: Callable[[Labeller], tuple[Any, ...]], names: set[str]
+    ) -> None:
+        index = len(self.items)
+        self.items.append(encoder)
+        for name in names:
+            self.occurrences.setdefault(name, []).append(index)
+
+    def initial_colouring(self) -> Colouring:
+        def kind(name: str) -> int:
+            if name in self.universals:
+                return 0
+            elif name in self.existentials:
+                return 1
+            else:
+                return 2
+
+        return _rank({name: kind(name) for name in self.names})
+
+    def refine(self, colouring: Colouring) -> Colouring:
+        """
+        Refines the colouring until it is equitable; each arbitrary object is
+        recoloured by its current colour and the multiset of the items it occurs in,
+        where it is marked out from the other arbitrary objects.
+
+        Args:
+            colouring (Colouring): The colouring to refine
+
+        Returns:
+            Colouring: The refined colouring
+        """
+        cell_count = len(set(colouring.values()))
+        while cell_count < len(colouring):
+            signatures: dict[str, Any] = {}
+            for name, colour in colouring.items():
+
+                def label(n: str, name: str = name) -> int:
+                    return -1 if n == name else colouring.get(n, -2)
+
+                occurrences = sorted(
+                    self.items[i](label) for i in self.occurrences.get(name, [])
+                )
+                signatures[name] = (colour, tuple(occurrences))
+            new_colouring = _rank(signatures)
+            new_count = len(set(new_colouring.values()))
+            colouring = new_colouring
+            if new_count == cell_count:
+                break
+            cell_count = new_count
+        return colouring
+
+    def key(self, colouring: Colouring) -> CanonicalKey:
+        """
+        The encoding of the whole view under a discrete colouring.
+        """
+
+        def label(n: str) -> int:
+            return colouring.get(n, -2)
+
+        return (
+            tuple(
+                sorted(
+                    (_state_key(s, label), _weight_key(w, label)) for s, w in self.stage
+                )
+            ),
+            tuple(sorted(_state_key(s, label) for s in self.supposition)),
+            tuple(
+                sorted(
+                    (_term_key(t, label), _atom_key(a, label)) for t, a in self.issues
+                )
+            ),
+            tuple(sorted(label(u) for u in self.universals)),
+            tuple(sorted(label(e) for e in self.existentials)),
+            tuple(sorted((label(e), label(u)) for e, u in self.dependencies)),
+        )
+
+    def search(self) -> CanonicalKey:
+        """
+        Explores the search tree of individualisations, returning the smallest key
+        over all leaves. Subtrees known to be equivalent under an automorphism
+        already found are pruned.
+        """
+        best_key: Optional[CanonicalKey] = None
+        best_colouring: Optional[Colouring] = None
+        automorphisms: list[dict[str, str]] = []
+
+        def orbit_representatives(cell: list[str], path: list[str]) -> list[str]:
+            # Orbits of the cell under automorphisms fixing the path pointwise
+            parent = {name: name for name in cell}
+
+            def find(x: str) -> str:
+                while parent[x] != x:
+                    parent[x] = parent[parent[x]]
+                    x = parent[x]
+                return x
+
+            for aut in automorphisms:
+                if all(aut[p] == p for p in path):
+                    for name in cell:
+                        image = aut[name]
+                        if image in parent:
+                            parent[find(name)] = find(image)
+            seen: set[str] = set()
+            reps: list[str] = []
+            for name in cell:
+                root = find(name)
+                if root not in seen:
+                    seen.add(root)
+                    reps.append(name)
+            return reps
+
+        def visit(colouring: Colouring, path: list[str]) -> None:
+            nonlocal best_key, best_colouring
+            colouring = self.refine(colouring)
+            cells: dict[int, list[str]] = {}
+            for name, colour in colouring.items():
+                cells.setdefault(colour, []).append(name)
+            targets = [(len(c), colour) for colour, c in cells.items() if len(c) > 1]
+            if not targets:
+                leaf_key = self.key(colouring)
+                if best_key is None or leaf_key < best_key:
+                    best_key = leaf_key
+                    best_colouring = colouring
+                elif leaf_key == best_key:
+                    assert best_colouring is not None
+                    inverse = {c: n for n, c in best_colouring.items()}
+                    automorphisms.append({n: inverse[c] for n, c in colouring.items()})
+                return
+            _, target_colour = min(targets)
+            cell = sorted(cells[target_colour])
+            explored: list[str] = []
+            for name in cell:
+                if explored and name not in orbit_representatives(cell, path):
+                    continue
+                individualised = {
+                    n: (c, 0 if n == name else 1) for n, c in colouring.items()
+                }
+                visit(_rank(individualised), path + [name])
+                explored.append(name)
+
+        visit(self.initial_colouring(), [])
+        assert best_key is not None
+        return best_key
+
+
+def canonical_key(view: "View") -> CanonicalKey:
+    """
+    Produces a key for the view that is invariant under renaming its arbitrary
+    objects (universals to universals and existentials to existentials). Two views
+    have the same key if and only if they are equivalent under arbitrary object
+    substitution.
+
+    Args:
+        view (View): The view to produce the key for.
+
+    Returns:
+        CanonicalKey: The hashable canonical key.
+    """
+    return _Canonicaliser(view).search()
@@ -1,10 +1,11 @@
 __all__ = ["Dependency", "DependencyRelation"]
 
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, AbstractSet, Iterable, Optional
 
 from pyetr.atoms.terms.open_term import OpenArbitraryObject
 
 from .atoms.terms import ArbitraryObject
+from .validation import ValidationLevel, current_validation_level
 
 if TYPE_CHECKING:  # pragma: not covered
     from .types import MatchCallback, MatchItem
@@ -84,16 +85,36 @@ def transitive_closure(
     D_initial: set[tuple[ArbitraryObject, ArbitraryObject]],
     arb_objects: frozenset[ArbitraryObject],
 ) -> set[tuple[ArbitraryObject, ArbitraryObject]]:
-    d_current = D_initial
+    """
+    Closes the relation under composition, adding the pairs <x,z> for z in the arb
+    objects, where z can be reached from x.
 
-    while True:
-        D_next_set = {
-            (x, z) for x, y in d_current for z in arb_objects if (y, z) in d_current
-        }
-        D_next_set |= d_current
-        if D_next_set == d_current:
-            return d_current
-        d_current = D_next_set
+    Args:
+        D_initial (set[tuple[ArbitraryObject, ArbitraryObject]]): The relation
+        arb_objects (frozenset[ArbitraryObject]): The arb objects pairs may be added
+            towards.
+
+    Returns:
+        set[tuple[ArbitraryObject, ArbitraryObject]]: The closed relation
+    """
+    # Warshall's algorithm, holding the objects reachable from each object as a bitset
+    objects = list(arb_objects | {x for pair in D_initial for x in pair})
+    bits = {x: 1 << i for i, x in enumerate(objects)}
+    reach = dict.fromkeys(objects, 0)
+    for x, y in D_initial:
+        reach[x] |= bits[y]
+    for k in objects:
+        k_bit = bits[k]
+        k_reach = reach[k]
+        for x in objects:
+            if reach[x] & k_bit:
+                reach[x] |= k_reach
+    out = set(D_initial)
+    for x in objects:
+        x_reach = reach[x]
+        if x_reach:
+            out.update((x, z) for z in arb_objects if x_reach & bits[z])
+    return out
 
 
 def dependencies_from_sets(
@@ -167,6 +188,8 @@ class DependencyRelation:
         universals: Iterable[Universal],
         existentials: Iterable[Existential],
         dependencies: Iterable[Dependency],
+        *,
+        validate: bool = True,
     ) -> None:
         """
         A dependency relation, containing information about the dependencies
@@ -176,31 +199,66 @@ class DependencyRelation:
             universals (Iterable[Universal]): The set of universals.
             existentials (Iterable[Existential]): The set of existentials.
             dependencies (Iterable[Dependency]): The set of dependencies.
+            validate (bool, optional): If False, the relation is assumed to be valid
+                and is not checked. Only for relations produced by operations known
+                to preserve validity. The relation is also not checked when the
+                validation level is OFF. Defaults to True.
         """
         self.universals = frozenset(universals)
         self.existentials = frozenset(existentials)
         self.dependencies = frozenset(dependencies)
-        self._validate()
-        self._test_matryoshka()
+        self._bits: Optional[dict[ArbitraryObject, int]] = None
+        self._depends_on: dict[ArbitraryObject, int] = {}
+        self._depended_on_by: dict[ArbitraryObject, int] = {}
+        if validate and current_validation_level() is not ValidationLevel.OFF:
+            self._validate()
+            self._test_matryoshka()
+
+    def _index(self) -> dict[ArbitraryObject, int]:
+        """
+        Builds the bitset indexes of the dependencies, if not already built. Each arb
+        object is given a bit, and for each arb object x the bitsets of the arb objects
+        in {y : <x,y> ∈ D} and {y : <y,x> ∈ D} are stored.
+
+        Returns:
+            dict[ArbitraryObject, int]: The bit of each arb object.
+        """
+        if self._bits is None:
+            arb_objects = self.universals | self.existentials
+            bits = {x: 1 << i for i, x in enumerate(arb_objects)}
+            depends_on = dict.fromkeys(arb_objects, 0)
+            depended_on_by = dict.fromkeys(arb_objects, 0)
+            for dep in self.dependencies:
+                depends_on[dep.existential] |= bits[dep.universal]
+                depended_on_by[dep.universal] |= bits[dep.existential]
+            self._depends_on = depends_on
+            self._depended_on_by = depended_on_by
+            self._bits = bits
+        return self._bits
 
     def _test_matryoshka(self):
         """
         Based on the Matryoshka condition, p141
 
+        The existential sets of the universals must form a chain under inclusion;
+        sorted by size, each must be a subset of the next.
+
         Raises:
             ValueError: Raised if the dependencies fail the Matryoshka condition.
         """
-        existentials: list[frozenset[ArbitraryObject]] = [
-            frozenset(e) for _, e in dependencies_to_sets(self.ordered_deps())
-        ]
-        stack = existentials.copy()
-        while stack:
-            set1 = stack.pop(0)
-            for set2 in stack:
-                if not (set1.issubset(set2) or set2.issubset(set1)):
-                    raise ValueError(
-                        f"Existential sets do not meet Matryoshka condition. \nSet1: {set1}\nSet2: {set2}"
-                    )
+        self._index()
+        existential_sets = sorted(
+            (e for e in self._depended_on_by.values() if e), key=int.bit_count
+        )
+        for set1, set2 in zip(existential_sets, existential_sets[1:]):
+            if set1 & ~set2:
+                raise ValueError(
+                    f"Existential sets do not meet Matryoshka condition. \nSet1: {self._from_bitset(set1)}\nSet2: {self._from_bitset(set2)}"
+                )
+
+    def _from_bitset(self, bitset: int) -> frozenset[ArbitraryObject]:
+        bits = self._index()
+        return frozenset(x for x, bit in bits.items() if bitset & bit)
 
     def ordered_exis(self):
         return sorted(self.existentials, key=str)
@@ -315,13 +373,13 @@ class DependencyRelation:
             )
 
     def validate_against_states(
-        self, arb_objects: set[ArbitraryObject], pre_view: bool = False
+        self, arb_objects: AbstractSet[ArbitraryObject], pre_view: bool = False
     ):
         """
         Validates the dependency against the provided arb_objects
 
         Args:
-            arb_objects (set[ArbitraryObject]): The set of arbitrary provided
+            arb_objects (AbstractSet[ArbitraryObject]): The set of arbitrary provided
             pre_view (bool, optional): If the view under validation is a pre-view (Incomplete view, with
                 lower restrictions on validation). Defaults to False.
 
@@ -358,13 +416,15 @@ class DependencyRelation:
                 f"Existentials {self.universals | self.existentials} is not superset of dependency arb objects {dep_arb_objs}"
             )
 
-    def restriction(self, arb_objects: set[ArbitraryObject]) -> "DependencyRelation":
+    def restriction(
+        self, arb_objects: AbstractSet[ArbitraryObject]
+    ) -> "DependencyRelation":
         """
         Based on definition 4.24, p155
 
         [R]_X = <U_R ∩ X, E_R ∩ X, D_R ∩ ((E_R ∩ X) × (U_R ∩ X))
         Args:
-            arb_objects (set[ArbitraryObject]): X
+            arb_objects (AbstractSet[ArbitraryObject]): X
 
         Returns:
             DependencyRelation: The new dependency relation
@@ -378,7 +438,10 @@ class DependencyRelation:
             universals=universals, existentials=existentials
         )
 
-        return DependencyRelation(universals, existentials, dependencies=new_deps)
+        # Restricting a valid relation leaves it valid
+        return DependencyRelation(
+            universals, existentials, dependencies=new_deps, validate=False
+        )
 
     def related_universals(self, existential: Existential) -> set[Universal]:
         """
@@ -391,9 +454,8 @@ class DependencyRelation:
             set[Universal]: The related universals.
         """
         assert self.is_existential(arb_object=existential)
-        return {
-            dep.universal for dep in self.dependencies if dep.existential == existential
-        }
+        self._index()
+        return set(self._from_bitset(self._depends_on[existential]))
 
     def related_existentials(self, universal: Universal) -> set[Existential]:
         """
@@ -406,9 +468,8 @@ class DependencyRelation:
             set[Existential]: The related existentials.
         """
         assert not self.is_existential(arb_object=universal)
-        return {
-            dep.existential for dep in self.dependencies if dep.universal == universal
-        }
+        self._index()
+        return set(self._from_bitset(self._depended_on_by[universal]))
 
     def triangle(
         self, arb_object1: ArbitraryObject, arb_object2: ArbitraryObject
@@ -430,50 +491,39 @@ class DependencyRelation:
         Returns:
             bool: The result of a ◁_R b
         """
-        if (arb_object1 not in (self.universals | self.existentials)) or (
-            arb_object2 not in (self.universals | self.existentials)
-        ):
+        bits = self._index()
+        if arb_object1 not in bits or arb_object2 not in bits:
             return False
+        is_exi1 = self.is_existential(arb_object1)
+        is_exi2 = self.is_existential(arb_object2)
 
-        if self.is_existential(arb_object1) and self.is_existential(arb_object2):
+        if is_exi1 and is_exi2:
             # Case 1
             # B.7, (iii), (b): e ◁_R e' iff ∃u ∈ U_R.<e',u> ∉ D_R ∧ <e,u> ∈ D_R
 
             # There is X that E (arb_obj1) depends on and that e prime (arb_obj2) does not depend on
-            unis_e_depends_on = self.related_universals(arb_object1)
-            unis_e_prime_depends_on = self.related_universals(arb_object2)
-            return len(unis_e_depends_on.difference(unis_e_prime_depends_on)) != 0
-        elif self.is_existential(arb_object1) and not self.is_existential(arb_object2):
+            return (self._depends_on[arb_object1] & ~self._depends_on[arb_object2]) != 0
+        elif is_exi1 and not is_exi2:
             # Case 2
 
             # (i) e ◁_R u iff <e,u> ∈ D_R
             # There is a dependency of this structure
-            return (
-                Dependency(existential=arb_object1, universal=arb_object2)
-                in self.dependencies
-            )
+            return (self._depends_on[arb_object1] & bits[arb_object2]) != 0
 
-        elif not self.is_existential(arb_object1) and self.is_existential(arb_object2):
+        elif not is_exi1 and is_exi2:
             # Case 3
             # (i) u ◁_R e iff ¬(e ◁_R u) iff ¬(<e,u> ∈ D_R)
             # There is not a dependency of this structure
-            return (
-                Dependency(existential=arb_object2, universal=arb_object1)
-                not in self.dependencies
-            )
+            return (self._depends_on[arb_object2] & bits[arb_object1]) == 0
 
-        elif not self.is_existential(arb_object1) and not self.is_existential(
-            arb_object2
-        ):
+        else:
             # Case 4
             # B.7, (ii), (b): u ◁_R u' iff ∃e ∈ E_R.<e,u> ∉ D_R ∧ <e,u'> ∈ D_R
 
             # There is X that does depend on u prime (arb_obj2) and does not depend on u (arb_obj 1)
-            exis_depending_on_u = self.related_existentials(arb_object1)
-            exis_depending_on_u_prime = self.related_existentials(arb_object2)
-            return len(exis_depending_on_u_prime.difference(exis_depending_on_u)) != 0
-        else:
-            assert False
+            return (
+                self._depended_on_by[arb_object2] & ~self._depended_on_by[arb_object1]
+            ) != 0
 
     def less_sim(
         self, arb_object1: ArbitraryObject, arb_object2: ArbitraryObject
@@ -495,56 +545,42 @@ class DependencyRelation:
         Returns:
             bool: The result of a ◁_R b
         """
-
-        if (arb_object1 not in (self.universals | self.existentials)) or (
-            arb_object2 not in (self.universals | self.existentials)
-        ):  # pragma: not covered
+        bits = self._index()
+        if arb_object1 not in bits or arb_object2 not in bits:  # pragma: not covered
             return False
+        is_exi1 = self.is_existential(arb_object1)
+        is_exi2 = self.is_existential(arb_object2)
 
-        if self.is_existential(arb_object1) and self.is_existential(arb_object2):
+        if is_exi1 and is_exi2:
             # Case 1
             # (iii), (a): e ≲_R e' iff ∃u ∈ U_R.<e',u> ∈ D_R => <e,u> ∈ D_R
             # not(There is an X that E prime (arb_obj2) deps on and that e (arb_obj1)does not depend upon)
-            unis_e_depends_on = self.related_universals(arb_object1)
-            unis_e_prime_depends_on = self.related_universals(arb_object2)
-            return len(unis_e_prime_depends_on.difference(unis_e_depends_on)) == 0
+            return (self._depends_on[arb_object2] & ~self._depends_on[arb_object1]) == 0
 
-        elif self.is_existential(arb_object1) and not self.is_existential(arb_object2):
+        elif is_exi1 and not is_exi2:
             # Case 2
 
             # (i) e ≲_R u iff <e,u> ∈ D_R
             # There is a dependency of this structure
-            return (
-                Dependency(existential=arb_object1, universal=arb_object2)
-                in self.dependencies
-            )
+            return (self._depends_on[arb_object1] & bits[arb_object2]) != 0
 
-        elif not self.is_existential(arb_object1) and self.is_existential(
-            arb_object2
-        ):  # pragma: not covered
+        elif not is_exi1 and is_exi2:  # pragma: not covered
             # Case 3
 
             # Not actually used but here for completeness
             # (i) u ≲_R e iff ¬(e ≲_R u) iff ¬(<e,u> ∈ D_R)
             # There is not a dependency of this structure
-            return (
-                Dependency(existential=arb_object2, universal=arb_object1)
-                not in self.dependencies
-            )
+            return (self._depends_on[arb_object2] & bits[arb_object1]) == 0
 
-        elif not self.is_existential(arb_object1) and not self.is_existential(
-            arb_object2
-        ):  # pragma: not covered
+        else:  # pragma: not covered
             # Case 4
 
             # Not actually used but here for completeness
             # (ii), (a): u ≲_R u' iff ∀e ∈ E_R.<e,u> ∈ D_R => <e,u'> ∈ D_R
             # not(There is an X that depends on u (arb_obj 1) but does not depend on u_prime (arb_obj2))
-            exis_depending_on_u = self.related_existentials(arb_object1)
-            exis_depending_on_u_prime = self.related_existentials(arb_object2)
-            return len(exis_depending_on_u.difference(exis_depending_on_u_prime)) == 0
-        else:
-            assert False
+            return (
+                self._depended_on_by[arb_object1] & ~self._depended_on_by[arb_object2]
+            ) == 0
 
     @property
     def is_empty(self) -> bool:
@@ -677,7 +713,7 @@ class DependencyRelation:
             u_0 = self.U0(other, e_triangle_u, e_0)
 
             # <U₀, E₀, Ø>
-            initial_relation = DependencyRelation(u_0, e_0, frozenset())
+            initial_relation = DependencyRelation(u_0, e_0, frozenset(), validate=False)
             a_r = self.universals | self.existentials
             a_s = other.universals | other.existentials
 
@@ -719,8 +755,11 @@ class DependencyRelation:
                 not in self.dependencies
             }
         )
+        # The existential sets of the negation are the complements of the universal
+        # sets of self, which form a chain if those do, so it is left unchecked
         return DependencyRelation(
             universals=self.existentials,
             existentials=self.universals,
             dependencies=new_deps,
+            validate=False,
         )
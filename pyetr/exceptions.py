@@ -1,3 +1,8 @@
 class OperationUndefinedError(ValueError):
     def __init__(self, message, *args: object) -> None:  # pragma: not covered
         super().__init__(message, *args)
+
+
+class OperationCancelledError(RuntimeError):
+    def __init__(self, message, *args: object) -> None:
+        super().__init__(message, *args)
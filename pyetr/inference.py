@@ -4,8 +4,31 @@ __all__ = [
     "default_procedure_what_is_prob",
     "default_decision",
     "default_procedure_does_it_follow",
+    "BatchResult",
+    "batch_inference",
+    "ReasonerState",
+    "StreamingReasoner",
 ]
-from typing import Iterable, Optional, Sequence
+import asyncio
+import os
+import pickle
+import signal
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
 
 from pyetr.atoms.terms.function import RealNumber
 from pyetr.atoms.terms.multiset import Multiset
@@ -57,14 +80,7 @@ def default_inference_procedure(v: Sequence[View], verbose: bool = False) -> Vie
     def _default_inference_step1(rel_v: Sequence[View]):
         g_prime = basic_step(v=rel_v, verbose=verbose)
         # Step (1)
-        for i, view in enumerate(rel_v):
-            if i == 0:
-                # G'[P₁[]ᴰ]ꟳ
-                g_prime = g_prime.factor(view.depose(verbose=verbose), verbose=verbose)
-            else:
-                # G'[Pₙ]ꟳ
-                g_prime = g_prime.factor(view, verbose=verbose)
-        return g_prime
+        return _factor_premises(g_prime, rel_v, verbose=verbose)
 
     g_prime = _default_inference_step1(v)
     if g_prime.is_verum or g_prime.is_falsum:
@@ -78,6 +94,30 @@ def default_inference_procedure(v: Sequence[View], verbose: bool = False) -> Vie
     return g_prime
 
 
+def _factor_premises(g_prime: View, v: Sequence[View], verbose: bool = False) -> View:
+    """
+    Based Definition 4.47 p179-180
+
+    G'' = G'[P₁[]ᴰ]ꟳ...[Pₙ]ꟳ
+
+    Args:
+        g_prime (View): G'
+        v (Sequence[View]): (P₁,..., Pₙ)
+        verbose (bool, optional): Enables verbose mode. Defaults to False.
+
+    Returns:
+        View: G''
+    """
+    for i, view in enumerate(v):
+        if i == 0:
+            # G'[P₁[]ᴰ]ꟳ
+            g_prime = g_prime.factor(view.depose(verbose=verbose), verbose=verbose)
+        else:
+            # G'[Pₙ]ꟳ
+            g_prime = g_prime.factor(view, verbose=verbose)
+    return g_prime
+
+
 def default_procedure_does_it_follow(
     v: Sequence[View], target: View, verbose: bool = False
 ) -> bool:
@@ -203,14 +243,14 @@ def default_procedure_what_is_prob(
         # ...[Δ^Ψ]ꟴ
         g_prime_prime = res.query(prob_of, verbose=verbose)
         # G''[Δ]^𝔼P
-        out = g_prime_prime.stage.equilibrium_answer_potential(
+        out = g_prime_prime.stage.numeric_answer_potential(
             prob_of.stage,
             g_prime_prime.weights,
         )
         if verbose:
             print(f"EquilibriumAnswerOut: {out}")
         # ... ∈ [0,100]
-        if isinstance(out.f, RealNumber) and out.f.num >= 0 and out.f.num <= 100:
+        if out is not None and out >= 0 and out <= 100:
             return g_prime_prime
         else:
             return View.get_falsum()
@@ -250,3 +290,451 @@ def default_decision(
     for v in pr:
         result = result.update(v, verbose=verbose)
     return dq.answer(result, verbose=verbose)
+
+
+Problem = tuple[Sequence[View], Optional[View]]
+_Chunk = list[tuple[int, Problem]]
+
+
+class BatchResult(NamedTuple):
+    """
+    The outcome of one problem in a batch.
+
+    Attributes:
+        position (int): The position of the problem in the input.
+        value (Any): The result of the procedure, or None if it failed.
+        error (Optional[BaseException]): The exception raised by the procedure, or
+            None if it succeeded.
+    """
+
+    position: int
+    value: Any
+    error: Optional[BaseException]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@contextmanager
+def _time_limit(timeout: Optional[float]) -> Iterator[None]:
+    """
+    Raises TimeoutError in the enclosed block once timeout seconds have passed.
+    The limit is only applied where an interval timer can be used, that is on
+    platforms with SIGALRM and in the main thread; elsewhere it has no effect.
+    """
+    if (
+        timeout is None
+        or not hasattr(signal, "SIGALRM")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def _on_alarm(signum: int, frame: Any) -> None:
+        raise TimeoutError(f"Problem exceeded timeout of {timeout}s")
+
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _portable_error(error: BaseException) -> BaseException:
+    # Exceptions are sent back from worker processes, so those that cannot be
+    # pickled are replaced by a description of themselves.
+    try:
+        pickle.dumps(error)
+    except Exception:
+        return RuntimeError(repr(error))
+    return error
+
+
+def _run_chunk(
+    procedure: Callable[..., Any],
+    chunk: list[tuple[int, Problem]],
+    timeout: Optional[float],
+    portable: bool,
+) -> list[BatchResult]:
+    results: list[BatchResult] = []
+    for index, (premises, target) in chunk:
+        try:
+            with _time_limit(timeout):
+                if target is None:
+                    value = procedure(premises)
+                else:
+                    value = procedure(premises, target)
+        except Exception as e:
+            results.append(
+                BatchResult(index, None, _portable_error(e) if portable else e)
+            )
+        else:
+            results.append(BatchResult(index, value, None))
+    return results
+
+
+def _chunked(
+    problems: Iterable[Problem], chunksize: int
+) -> Iterator[list[tuple[int, Problem]]]:
+    numbered = enumerate(problems)
+    while chunk := list(islice(numbered, chunksize)):
+        yield chunk
+
+
+def batch_inference(
+    problems: Iterable[Problem],
+    procedure: Callable[..., Any] = default_inference_procedure,
+    max_workers: Optional[int] = None,
+    chunksize: int = 8,
+    timeout: Optional[float] = None,
+    ordered: bool = True,
+) -> Iterator[BatchResult]:
+    """
+    Runs a procedure over many independent problems, spread over a pool of
+    worker processes, yielding a result for each problem as it becomes available.
+
+    Each problem is a pair (premises, target). If target is None the procedure is
+    called as procedure(premises), otherwise as procedure(premises, target); for
+    example default_inference_procedure takes no target, while
+    default_procedure_does_it_follow and default_procedure_what_is_prob do.
+
+    Problems are sent to the workers in chunks, so that each chunk of views is
+    pickled together and shared subterms are only sent once per chunk. Problems
+    are read from the input lazily, with at most two chunks per worker in flight.
+
+    An exception raised for one problem is recorded in its result, and does not
+    affect the other problems. If a worker process dies, the pool is restarted
+    and the chunks that were in flight are run again one at a time, splitting a
+    chunk into single problems if it kills a worker again, so that only the
+    problem that killed the worker is given the resulting BrokenProcessPool.
+
+    Args:
+        problems (Iterable[Problem]): The (premises, target) pairs to solve.
+        procedure (Callable[..., Any], optional): The procedure to run on each
+            problem. Must be picklable, e.g. a module level function. Defaults to
+            default_inference_procedure.
+        max_workers (Optional[int], optional): The number of worker processes. If
+            1, problems are run serially in this process. Defaults to None, one per
+            CPU.
+        chunksize (int, optional): The number of problems sent to a worker at once.
+            Defaults to 8.
+        timeout (Optional[float], optional): The maximum number of seconds spent on
+            each problem, after which its result holds a TimeoutError. Only
+            enforced on platforms supporting SIGALRM. Defaults to None.
+        ordered (bool, optional): If True, results are yielded in the order of the
+            problems, otherwise in the order they complete. Defaults to True.
+
+    Raises:
+        ValueError: max_workers or chunksize is less than 1
+
+    Returns:
+        Iterator[BatchResult]: The result of each problem.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    chunks = _chunked(problems, chunksize)
+    if max_workers == 1:
+        for chunk in chunks:
+            yield from _run_chunk(procedure, chunk, timeout, False)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        pending: dict[Future[list[BatchResult]], tuple[int, _Chunk]] = {}
+        completed: dict[int, list[BatchResult]] = {}
+        # The chunks in flight when a worker died, which took the pool with it
+        lost: list[tuple[int, _Chunk]] = []
+        next_chunk = 0
+        submitted = 0
+
+        def submit() -> bool:
+            nonlocal submitted
+            chunk = next(chunks, None)
+            if chunk is None:
+                return False
+            chunk_number = submitted
+            submitted += 1
+            try:
+                future = executor.submit(_run_chunk, procedure, chunk, timeout, True)
+            except BrokenProcessPool:
+                lost.append((chunk_number, chunk))
+            else:
+                pending[future] = (chunk_number, chunk)
+            return True
+
+        def collect(future: Future[list[BatchResult]]) -> None:
+            chunk_number, chunk = pending.pop(future)
+            try:
+                completed[chunk_number] = future.result()
+            except BrokenProcessPool:
+                lost.append((chunk_number, chunk))
+            except Exception as e:
+                completed[chunk_number] = [
+                    BatchResult(index, None, e) for index, _ in chunk
+                ]
+
+        def restart() -> None:
+            nonlocal executor
+            executor.shutdown(wait=True, cancel_futures=True)
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+
+        def rerun(chunk: _Chunk) -> list[BatchResult]:
+            # Runs a lost chunk on its own, so that if a worker dies again the
+            # chunk is known to have killed it
+            try:
+                return executor.submit(
+                    _run_chunk, procedure, chunk, timeout, True
+                ).result()
+            except BrokenProcessPool as e:
+                restart()
+                if len(chunk) == 1:
+                    return [BatchResult(chunk[0][0], None, e)]
+                return [result for problem in chunk for result in rerun([problem])]
+            except Exception as e:
+                return [BatchResult(index, None, e) for index, _ in chunk]
+
+        while not lost and len(pending) < 2 * max_workers and submit():
+            pass
+        while pending or lost:
+            if lost:
+                for future in list(pending):
+                    collect(future)
+                restart()
+                while lost:
+                    chunk_number, chunk = lost.pop()
+                    completed[chunk_number] = rerun(chunk)
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future)
+            while not lost and len(pending) < 2 * max_workers and submit():
+                pass
+            if ordered:
+                while next_chunk in completed:
+                    yield from completed.pop(next_chunk)
+                    next_chunk += 1
+            else:
+                for chunk_number in list(completed):
+                    yield from completed.pop(chunk_number)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class ReasonerState(NamedTuple):
+    """
+    A checkpoint of a StreamingReasoner, from which it can be restored.
+    """
+
+    current: View
+    steps: int
+    premises: Optional[tuple[View, ...]]
+
+
+class StreamingReasoner:
+    """
+    Applies the updates of basic_step one premise at a time, for premises that
+    arrive over time rather than as a sequence.
+
+    After premises P₁,...,Pₖ, the reasoner holds T[P₁[]ᴰ]^↻[P₂]^↻...[Pₖ]^↻, and
+    G' is this view factored by ⊥. Unless asked to keep the premises, only this
+    view is held, however many premises are consumed.
+    """
+
+    def __init__(
+        self,
+        premises: Iterable[View] = (),
+        *,
+        keep_premises: bool = False,
+        verbose: bool = False,
+    ) -> None:
+        """
+        Args:
+            premises (Iterable[View], optional): Premises to consume straight away.
+                Defaults to ().
+            keep_premises (bool, optional): Keep the consumed premises, so that
+                conclusion can be found without passing them again. Defaults to
+                False.
+            verbose (bool, optional): Enables verbose mode. Defaults to False.
+        """
+        self.verbose = verbose
+        self._current = View.get_verum()
+        self._steps = 0
+        self._premises: Optional[list[View]] = [] if keep_premises else None
+        self._g_prime: Optional[View] = None
+        for premise in premises:
+            self.add(premise)
+
+    @property
+    def current(self) -> View:
+        """
+        Returns:
+            View: T[P₁[]ᴰ]^↻[P₂]^↻...[Pₖ]^↻
+        """
+        return self._current
+
+    @property
+    def steps(self) -> int:
+        """
+        Returns:
+            int: The number of premises consumed
+        """
+        return self._steps
+
+    @property
+    def premises(self) -> Optional[tuple[View, ...]]:
+        """
+        Returns:
+            Optional[tuple[View, ...]]: The premises consumed, or None if they are
+                not kept.
+        """
+        if self._premises is None:
+            return None
+        return tuple(self._premises)
+
+    @property
+    def g_prime(self) -> View:
+        """
+        Based Definition 4.47 p179-180
+
+        G' = T[P₁[]ᴰ]^↻[P₂]^↻...[Pₖ]^↻[⊥]ꟳ
+
+        Returns:
+            View: G', as returned by basic_step for the premises consumed so far
+        """
+        if self._g_prime is None:
+            self._g_prime = self._current.factor(
+                View.get_falsum(), verbose=self.verbose
+            )
+        return self._g_prime
+
+    def add(self, premise: View) -> View:
+        """
+        Updates with the next premise.
+
+        Args:
+            premise (View): Pₖ₊₁
+
+        Returns:
+            View: G' after the premise
+        """
+        if self._steps == 0:
+            premise_to_update = premise.depose(verbose=self.verbose)
+        else:
+            premise_to_update = premise
+        self._current = self._current.update(premise_to_update, verbose=self.verbose)
+        self._steps += 1
+        self._g_prime = None
+        if self._premises is not None:
+            self._premises.append(premise)
+        return self.g_prime
+
+    def consume(self, premises: Iterable[View]) -> Iterator[View]:
+        """
+        Updates with each premise in turn, as they arrive.
+
+        Args:
+            premises (Iterable[View]): The premises
+
+        Returns:
+            Iterator[View]: G' after each premise
+        """
+        for premise in premises:
+            yield self.add(premise)
+
+    async def aconsume(self, premises: AsyncIterable[View]) -> AsyncIterator[View]:
+        """
+        Updates with each premise in turn, as they arrive from an async iterable.
+        Each update runs in a separate thread, so the event loop is not blocked.
+
+        Args:
+            premises (AsyncIterable[View]): The premises
+
+        Returns:
+            AsyncIterator[View]: G' after each premise
+        """
+        async for premise in premises:
+            yield await asyncio.to_thread(self.add, premise)
+
+    def conclusion(self, premises: Optional[Sequence[View]] = None) -> View:
+        """
+        Based Definition 4.47 p179-180
+
+        G'' = G'[P₁[]ᴰ]ꟳ...[Pₙ]ꟳ
+
+        Gives the same result as default_inference_procedure for the premises
+        consumed. The pass over the premises in reverse is only made if G'' is
+        verum or falsum.
+
+        Args:
+            premises (Optional[Sequence[View]], optional): The premises consumed,
+                (P₁,..., Pₙ). If None, the kept premises are used. Defaults to None.
+
+        Raises:
+            ValueError: No premises were given and none were kept, or the wrong
+                number were given
+
+        Returns:
+            View: G''
+        """
+        if premises is None:
+            if self._premises is None:
+                raise ValueError(
+                    "Premises were not kept, so must be passed to conclusion"
+                )
+            premises = self._premises
+        if len(premises) != self._steps:
+            raise ValueError(
+                f"Expected {self._steps} premises, received {len(premises)}"
+            )
+        # Step (1)
+        g_prime = _factor_premises(self.g_prime, premises, verbose=self.verbose)
+        if g_prime.is_verum or g_prime.is_falsum:
+            # Step (2)
+            reversed_v = tuple(reversed(premises))
+            g_prime = _factor_premises(
+                basic_step(reversed_v, verbose=self.verbose),
+                reversed_v,
+                verbose=self.verbose,
+            )
+            if g_prime.is_verum or g_prime.is_falsum:
+                # Step (3)
+                return View.get_verum()
+        # Step (4)
+        return g_prime
+
+    def checkpoint(self) -> ReasonerState:
+        """
+        Returns:
+            ReasonerState: The state of the reasoner, which can be pickled or
+                passed to restore.
+        """
+        return ReasonerState(
+            current=self._current, steps=self._steps, premises=self.premises
+        )
+
+    @classmethod
+    def restore(
+        cls, state: ReasonerState, *, verbose: bool = False
+    ) -> "StreamingReasoner":
+        """
+        Args:
+            state (ReasonerState): A checkpoint of a reasoner
+            verbose (bool, optional): Enables verbose mode. Defaults to False.
+
+        Returns:
+            StreamingReasoner: A reasoner continuing from the checkpoint
+        """
+        reasoner = cls(keep_premises=state.premises is not None, verbose=verbose)
+        reasoner._current = state.current
+        reasoner._steps = state.steps
+        if state.premises is not None:
+            reasoner._premises = list(state.premises)
+        return reasoner
@@ -0,0 +1,69 @@
+__all__ = [
+    "InternMeta",
+    "enable_interning",
+    "disable_interning",
+    "interning_enabled",
+    "clear_interned",
+]
+
+from abc import ABCMeta
+from typing import Any, Hashable
+from weakref import WeakValueDictionary
+
+_enabled: bool = True
+_table: WeakValueDictionary[Hashable, Any] = WeakValueDictionary()
+
+
+def enable_interning() -> None:
+    """
+    Turns on interning, so that structurally identical terms and atoms share a
+    single instance. Interning is on by default.
+    """
+    global _enabled
+    _enabled = True
+
+
+def disable_interning() -> None:
+    """
+    Turns off interning; newly created terms and atoms are always fresh
+    instances. Existing interned instances are unaffected.
+    """
+    global _enabled
+    _enabled = False
+
+
+def interning_enabled() -> bool:
+    """
+    Returns:
+        bool: True if interning is currently on.
+    """
+    return _enabled
+
+
+def clear_interned() -> None:
+    """
+    Empties the intern table. Instances already created remain valid, but will no
+    longer be shared with instances created afterwards.
+    """
+    _table.clear()
+
+
+class InternMeta(ABCMeta):
+    """
+    Metaclass that makes construction return one canonical instance per structure.
+
+    Classes using it define `_intern_key`, returning a hashable key identifying
+    the constructed instance's structure. Keys identify children by id, so that
+    they can only match instances built from the very same (alive) children.
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        instance = super().__call__(*args, **kwargs)
+        if not _enabled:
+            return instance
+        key = instance._intern_key()
+        existing = _table.get(key)
+        if existing is not None:
+            return existing
+        _table[key] = instance
+        return instance
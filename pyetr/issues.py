@@ -16,6 +16,9 @@ class IssueStructure(frozenset[tuple[Term, OpenPredicateAtom]]):
     has exactly one question mark
     """
 
+    _atoms: Optional[list[tuple[tuple[Term, OpenPredicateAtom], Atom]]] = None
+    _by_open_atom: Optional[dict[OpenPredicateAtom, list[Term]]] = None
+
     def __new__(
         cls, __iterable: Optional[Iterable[tuple[Term, OpenPredicateAtom]]] = None, /
     ) -> "IssueStructure":
@@ -68,18 +71,84 @@ class IssueStructure(frozenset[tuple[Term, OpenPredicateAtom]]):
     ) -> "IssueStructure":
         return IssueStructure(super().__xor__(__value))  # pragma: not covered
 
-    def restriction(self, atoms: set[Atom]) -> "IssueStructure":
-        new_issues: list[tuple[Term, OpenPredicateAtom]] = []
-        for term, open_atom in self:
-            atom_bools: list[bool] = []
-            for atom in atoms:
-                if isinstance(atom, DoAtom):
-                    for a in atom.atoms:
-                        atom_bools.append(open_atom.context_equals(a, term))
+    def _issue_atoms(self) -> list[tuple[tuple[Term, OpenPredicateAtom], Atom]]:
+        """
+        Returns:
+            list[tuple[tuple[Term, OpenPredicateAtom], Atom]]: Each issue <t,x> with
+                the atom x(t) it asks about, found once per issue structure.
+        """
+        if self._atoms is None:
+            self._atoms = [((t, a), a(t)) for t, a in self]
+        return self._atoms
+
+    def _index(self) -> dict[OpenPredicateAtom, list[Term]]:
+        """
+        Returns:
+            dict[OpenPredicateAtom, list[Term]]: The terms of the issues, keyed by
+                their open atom with the predicate made positive, so that x and x̄
+                share a key.
+        """
+        if self._by_open_atom is None:
+            index: dict[OpenPredicateAtom, list[Term]] = {}
+            for t, a in self:
+                key = a if a.predicate.verifier else ~a
+                if key in index:
+                    index[key].append(t)
                 else:
-                    atom_bools.append(open_atom.context_equals(atom, term))
-            if any(atom_bools):
-                new_issues.append((term, open_atom))
+                    index[key] = [t]
+            self._by_open_atom = index
+        return self._by_open_atom
+
+    def matches(self, other: "IssueStructure") -> set[tuple[Term, Term]]:
+        """
+        The issue matches M_IJ of definition 4.8, found by joining the issues of
+        each structure on their open atoms, rather than comparing every pair.
+
+        Args:
+            other (IssueStructure): The issue structure J
+
+        Returns:
+            set[tuple[Term, Term]]: The set of term matches.
+        """
+        if not self or not other:
+            return set()
+        other_index = other._index()
+        return {
+            (t1, t2)
+            for key, terms in self._index().items()
+            if key in other_index
+            for t1 in terms
+            for t2 in other_index[key]
+        }
+
+    def restriction(self, atoms: AbstractSet[Atom]) -> "IssueStructure":
+        """
+        Keeps the issues <t,x> where x matches one of the atoms given, or one of
+        the atoms of a do atom given, in the context of t.
+
+        Args:
+            atoms (AbstractSet[Atom]): The atoms
+
+        Returns:
+            IssueStructure: The restricted issue structure
+        """
+        if not self:
+            return self
+        predicate_atoms: set[Atom] = set()
+        for atom in atoms:
+            if isinstance(atom, DoAtom):
+                predicate_atoms |= atom.atoms
+            else:
+                predicate_atoms.add(atom)
+        # x(t) equal to an atom is necessary for x to match it in the context of
+        # t, so only those atoms are checked, rather than every atom given
+        new_issues = [
+            (t, a)
+            for (t, a), atom in self._issue_atoms()
+            if atom in predicate_atoms and a.context_equals(atom, t)
+        ]
+        if len(new_issues) == len(self):
+            return self
         return IssueStructure(new_issues)
 
     @classmethod
@@ -91,9 +160,7 @@ class IssueStructure(frozenset[tuple[Term, OpenPredicateAtom]]):
                 )
 
     def validate_against_states(self, states: SetOfStates):
-        for t, a in self:
-            atom = a(t)
-
+        for (t, a), atom in self._issue_atoms():
             if (
                 atom not in states.predicate_atoms
                 and ~atom not in states.predicate_atoms
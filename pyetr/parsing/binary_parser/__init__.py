@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+__all__ = ["view_to_bytes", "bytes_to_view", "views_to_bytes", "bytes_to_views"]
+
+import marshal
+import typing
+from typing import Iterable
+
+from pyetr.parsing.view_storage import ViewStorage
+
+if typing.TYPE_CHECKING:
+    from pyetr.view import View
+
+from .codec import ViewDecoder, ViewEncoder, ViewRecord
+
+MAGIC = b"PYETR"
+FORMAT_VERSION = 1
+MARSHAL_VERSION = 4
+_HEADER = MAGIC + bytes([FORMAT_VERSION])
+
+
+def encode_view(encoder: ViewEncoder, v: View) -> ViewRecord:
+    """
+    Encodes a view with the given encoder, adding its symbols to the table.
+
+    Args:
+        encoder (ViewEncoder): The encoder holding the symbol table
+        v (View): The input view
+
+    Returns:
+        ViewRecord: The record of the view
+    """
+    return encoder.view(
+        stage=v.stage,
+        supposition=v.supposition,
+        weights=v.weights,
+        issue_structure=v.issue_structure,
+        dependency_relation=v.dependency_relation,
+    )
+
+
+def views_to_bytes(views: Iterable[View]) -> bytes:
+    """
+    Parses from View form to the binary form of a series of views, in which
+    each symbol is stored once and shared between the views.
+
+    Args:
+        views (Iterable[View]): The input views
+
+    Returns:
+        bytes: The output bytes
+    """
+    encoder = ViewEncoder()
+    records = tuple([encode_view(encoder, v) for v in views])
+    return _HEADER + marshal.dumps((tuple(encoder.symbols), records), MARSHAL_VERSION)
+
+
+def bytes_to_views(data: bytes) -> list[ViewStorage]:
+    """
+    Parses from the binary form of a series of views to View form
+
+    Args:
+        data (bytes): The input bytes
+
+    Raises:
+        ValueError: The bytes are not in the binary view format
+
+    Returns:
+        list[ViewStorage]: The parsed views, in order
+    """
+    if not data.startswith(MAGIC):
+        raise ValueError("Data is not in the binary view format")
+    if data[len(MAGIC) : len(_HEADER)] != _HEADER[len(MAGIC) :]:
+        raise ValueError(
+            f"Unsupported binary view format version, expected {FORMAT_VERSION}"
+        )
+    try:
+        symbols, records = marshal.loads(data[len(_HEADER) :])
+    except (EOFError, TypeError, ValueError) as e:
+        raise ValueError("Malformed binary view data") from e
+    decoder = ViewDecoder()
+    decoder.add_symbols(symbols)
+    return [decoder.view(record) for record in records]
+
+
+def view_to_bytes(v: View) -> bytes:
+    """
+    Parses from View form to binary form
+
+    Args:
+        v (View): The input view
+
+    Returns:
+        bytes: The output bytes
+    """
+    return views_to_bytes([v])
+
+
+def bytes_to_view(data: bytes) -> ViewStorage:
+    """
+    Parses from binary form to View form
+
+    Args:
+        data (bytes): The input bytes, holding a single view
+
+    Raises:
+        ValueError: The bytes are not the binary form of a single view
+
+    Returns:
+        ViewStorage: The parsed view
+    """
+    views = bytes_to_views(data)
+    if len(views) != 1:
+        raise ValueError(f"Expected a single view, received {len(views)}")
+    return views[0]
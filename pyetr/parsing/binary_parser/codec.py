@@ -0,0 +1,457 @@
+__all__ = ["ViewEncoder", "ViewDecoder", "SymbolEntry", "ViewRecord"]
+
+import marshal
+import types
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional
+
+from pyetr.atoms.abstract import AbstractAtom
+from pyetr.atoms.doatom import DoAtom
+from pyetr.atoms.open_predicate_atom import OpenPredicateAtom
+from pyetr.atoms.predicate import Predicate
+from pyetr.atoms.predicate_atom import PredicateAtom
+from pyetr.atoms.terms.abstract_term import AbstractTerm
+from pyetr.atoms.terms.function import Function, NumFunc, RealNumber
+from pyetr.atoms.terms.multiset import Multiset
+from pyetr.atoms.terms.open_term import (
+    OpenArbitraryObject,
+    OpenFunctionalTerm,
+    QuestionMark,
+)
+from pyetr.atoms.terms.term import ArbitraryObject, FunctionalTerm, Term
+from pyetr.dependency import Dependency, DependencyRelation
+from pyetr.issues import IssueStructure
+from pyetr.parsing.view_storage import ViewStorage
+from pyetr.stateset import SetOfStates, State
+from pyetr.weight import Weight, Weights
+
+"""
+The symbol table and view records of the binary view format.
+
+Each predicate, function, term and atom is written once, as an entry in a symbol
+table, and referred to everywhere else by its position in the table. An entry
+only refers to entries before it, so a table can be decoded in a single pass.
+"""
+
+# Kinds of symbol table entry
+PREDICATE = 0
+FUNCTION = 1
+REAL_NUMBER = 2
+ARBITRARY_OBJECT = 3
+FUNCTIONAL_TERM = 4
+PREDICATE_ATOM = 5
+DO_ATOM = 6
+QUESTION_MARK = 7
+OPEN_ARBITRARY_OBJECT = 8
+OPEN_FUNCTIONAL_TERM = 9
+OPEN_PREDICATE_ATOM = 10
+
+SymbolEntry = tuple[Any, ...]
+# stage, supposition, weights, issues, universals, existentials, dependencies
+ViewRecord = tuple[Any, ...]
+
+
+def _func_to_code(func: NumFunc) -> bytes:
+    if not callable(func):
+        raise ValueError("Input must be a callable function")
+    return marshal.dumps(func.__code__)
+
+
+def _code_to_func(code: bytes, name: str) -> NumFunc:
+    return types.FunctionType(marshal.loads(code), globals(), name)
+
+
+def _real_number(name: str) -> RealNumber:
+    # RealNumber names are str(num), so rebuild num with the same str
+    try:
+        return RealNumber(num=int(name))
+    except ValueError:
+        return RealNumber(num=float(name))
+
+
+class ViewEncoder:
+    """
+    Builds the symbol table and view records for a series of views, adding each
+    distinct symbol to the table the first time it is seen.
+    """
+
+    def __init__(self) -> None:
+        self.symbols: list[SymbolEntry] = []
+        self._ids: dict[SymbolEntry, int] = {}
+        self._states: dict[tuple[int, ...], tuple[int, ...]] = {}
+        # The ids found for each symbol and state object, by identity. The object
+        # is held so that its identity is not reused.
+        self._objects: dict[int, tuple[Any, Any]] = {}
+        self._written = 0
+
+    def _add(self, obj: Any, entry: SymbolEntry) -> int:
+        # Symbols are keyed by their entries, which hold the ids of their parts,
+        # rather than by equality, as equal terms may still differ in the
+        # func_caller of their functions
+        if entry in self._ids:
+            i = self._ids[entry]
+        else:
+            i = self._ids[entry] = len(self.symbols)
+            self.symbols.append(entry)
+        self._objects[id(obj)] = (obj, i)
+        return i
+
+    def _known(self, obj: Any) -> Optional[int]:
+        known = self._objects.get(id(obj))
+        if known is None:
+            return None
+        return known[1]
+
+    def new_symbols(self) -> list[SymbolEntry]:
+        """
+        Returns:
+            list[SymbolEntry]: The entries added to the table since this was last
+                called.
+        """
+        out = self.symbols[self._written :]
+        self._written = len(self.symbols)
+        return out
+
+    def add_written(self, entry: SymbolEntry) -> None:
+        """
+        Continues the table with an entry that has already been written, so that
+        later views can refer to it.
+
+        Args:
+            entry (SymbolEntry): The entry
+        """
+        self._ids[entry] = len(self.symbols)
+        self.symbols.append(entry)
+        self._written = len(self.symbols)
+
+    def forget_objects(self) -> None:
+        """
+        Drops the symbols found for each predicate, function, term, atom and
+        state object, so that the objects can be freed. Their symbols are still
+        found from their entries.
+        """
+        self._objects.clear()
+        self._states.clear()
+
+    def predicate(self, p: Predicate) -> int:
+        i = self._known(p)
+        if i is not None:
+            return i
+        return self._add(p, (PREDICATE, p.name, p.arity, p.verifier))
+
+    def function(self, f: Function) -> int:
+        i = self._known(f)
+        if i is not None:
+            return i
+        if isinstance(f, RealNumber):
+            return self._add(f, (REAL_NUMBER, f.name))
+        if f.func_caller is None:
+            code = None
+            func_name = None
+        else:
+            code = _func_to_code(f.func_caller)
+            func_name = f.func_caller.__name__
+        return self._add(f, (FUNCTION, f.name, f.arity, code, func_name))
+
+    def term(self, t: AbstractTerm) -> int:
+        """
+        Args:
+            t (AbstractTerm): A term or open term
+
+        Returns:
+            int: The position of the term in the symbol table
+        """
+        if isinstance(t, FunctionalTerm):
+            kind = FUNCTIONAL_TERM
+        elif isinstance(t, ArbitraryObject):
+            kind = ARBITRARY_OBJECT
+        elif isinstance(t, OpenFunctionalTerm):
+            kind = OPEN_FUNCTIONAL_TERM
+        elif isinstance(t, OpenArbitraryObject):
+            kind = OPEN_ARBITRARY_OBJECT
+        elif isinstance(t, QuestionMark):
+            kind = QUESTION_MARK
+        else:
+            assert False
+        i = self._known(t)
+        if i is not None:
+            return i
+        if isinstance(t, (FunctionalTerm, OpenFunctionalTerm)):
+            entry = (
+                kind,
+                self.function(t.f),
+                tuple([self.term(i) for i in t.t]),
+            )
+        elif isinstance(t, (ArbitraryObject, OpenArbitraryObject)):
+            entry = (kind, t.name)
+        else:
+            entry = (kind,)
+        return self._add(t, entry)
+
+    def atom(self, a: AbstractAtom) -> int:
+        """
+        Args:
+            a (AbstractAtom): An atom or open atom
+
+        Returns:
+            int: The position of the atom in the symbol table
+        """
+        if isinstance(a, PredicateAtom):
+            kind = PREDICATE_ATOM
+        elif isinstance(a, OpenPredicateAtom):
+            kind = OPEN_PREDICATE_ATOM
+        elif isinstance(a, DoAtom):
+            kind = DO_ATOM
+        else:
+            assert False
+        i = self._known(a)
+        if i is not None:
+            return i
+        if isinstance(a, DoAtom):
+            entry = (
+                kind,
+                a.polarity,
+                tuple([self.atom(i) for i in a.sorted_iter_atoms()]),
+            )
+        else:
+            assert isinstance(a, (PredicateAtom, OpenPredicateAtom))
+            entry = (
+                kind,
+                self.predicate(a.predicate),
+                tuple([self.term(t) for t in a.terms]),
+            )
+        return self._add(a, entry)
+
+    def state(self, s: State) -> tuple[int, ...]:
+        known = self._objects.get(id(s))
+        if known is not None:
+            return known[1]
+        # The same tuple is reused for equal states, which marshal writes once
+        ids = tuple([self.atom(a) for a in s.sorted_iter()])
+        ids = self._states.setdefault(ids, ids)
+        self._objects[id(s)] = (s, ids)
+        return ids
+
+    def weight(self, w: Weight) -> tuple[tuple[int, ...], tuple[int, ...]]:
+        return (
+            tuple([self.term(t) for t in w.multiplicative.sorted_iter()]),
+            tuple([self.term(t) for t in w.additive.sorted_iter()]),
+        )
+
+    def view(
+        self,
+        stage: SetOfStates,
+        supposition: SetOfStates,
+        weights: Weights,
+        issue_structure: IssueStructure,
+        dependency_relation: DependencyRelation,
+    ) -> ViewRecord:
+        """
+        Encodes the parts of a view, adding any new symbols to the table.
+
+        Args:
+            stage (SetOfStates): The stage
+            supposition (SetOfStates): The supposition
+            weights (Weights): The weights
+            issue_structure (IssueStructure): The issue structure
+            dependency_relation (DependencyRelation): The dependency relation
+
+        Returns:
+            ViewRecord: The record of the view, referring to the symbol table.
+        """
+        return (
+            tuple([self.state(s) for s in stage.sorted_iter()]),
+            tuple([self.state(s) for s in supposition.sorted_iter()]),
+            tuple(
+                [(self.state(s), *self.weight(w)) for s, w in weights.sorted_items()]
+            ),
+            tuple(
+                [(self.term(t), self.atom(a)) for t, a in issue_structure.sorted_iter()]
+            ),
+            tuple(
+                [self.term(u) for u in sorted(dependency_relation.universals, key=str)]
+            ),
+            tuple(
+                [
+                    self.term(e)
+                    for e in sorted(dependency_relation.existentials, key=str)
+                ]
+            ),
+            tuple(
+                [
+                    (self.term(d.existential), self.term(d.universal))
+                    for d in sorted(dependency_relation.dependencies, key=str)
+                ]
+            ),
+        )
+
+
+class ViewDecoder:
+    """
+    Rebuilds the symbols of a symbol table, and the views whose records refer to
+    them. Each symbol is built the first time a view refers to it, and shared by
+    every view using it.
+    """
+
+    def __init__(
+        self,
+        entry: Optional[Callable[[int], SymbolEntry]] = None,
+        maxsize: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            entry (Optional[Callable[[int], SymbolEntry]], optional): Looks up the
+                entry at a position in the table, for tables that are not held in
+                memory. If None, the entries given to add_symbols are used.
+                Defaults to None.
+            maxsize (Optional[int], optional): The most symbols kept once built,
+                discarding the least recently used when full, after which they are
+                built again if needed. Defaults to None, keeping every symbol.
+
+        Raises:
+            ValueError: maxsize is less than 1
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._entries: list[SymbolEntry] = []
+        if entry is None:
+            self._entry = self._entries.__getitem__
+        else:
+            self._entry = entry
+        self.maxsize = maxsize
+        self._objects: OrderedDict[int, Any] = OrderedDict()
+
+    def add_symbols(self, symbols: Iterable[SymbolEntry]) -> None:
+        """
+        Continues the table with the given entries.
+
+        Args:
+            symbols (Iterable[SymbolEntry]): The entries to add
+        """
+        self._entries.extend(symbols)
+
+    def symbol(self, i: int) -> Any:
+        """
+        Args:
+            i (int): The position of the symbol in the table
+
+        Raises:
+            ValueError: The entry of the symbol, or of a symbol it refers to, is
+                malformed
+
+        Returns:
+            Any: The symbol
+        """
+        objects = self._objects
+        if i in objects:
+            if self.maxsize is not None:
+                objects.move_to_end(i)
+            return objects[i]
+        entry = self._entry(i)
+        symbol = self.symbol
+        try:
+            kind = entry[0]
+            if kind == PREDICATE_ATOM:
+                obj = PredicateAtom(
+                    predicate=symbol(entry[1]),
+                    terms=tuple([symbol(j) for j in entry[2]]),
+                )
+            elif kind == FUNCTIONAL_TERM:
+                obj = FunctionalTerm(
+                    f=symbol(entry[1]), t=tuple([symbol(j) for j in entry[2]])
+                )
+            elif kind == ARBITRARY_OBJECT:
+                obj = ArbitraryObject(name=entry[1])
+            elif kind == PREDICATE:
+                obj = Predicate(name=entry[1], arity=entry[2], _verifier=entry[3])
+            elif kind == FUNCTION:
+                func_caller: Optional[NumFunc]
+                if entry[3] is None:
+                    func_caller = None
+                else:
+                    func_caller = _code_to_func(entry[3], entry[4])
+                obj = Function(name=entry[1], arity=entry[2], func_caller=func_caller)
+            elif kind == REAL_NUMBER:
+                obj = _real_number(entry[1])
+            elif kind == DO_ATOM:
+                obj = DoAtom([symbol(j) for j in entry[2]], polarity=entry[1])
+            elif kind == OPEN_PREDICATE_ATOM:
+                obj = OpenPredicateAtom(
+                    predicate=symbol(entry[1]),
+                    terms=tuple([symbol(j) for j in entry[2]]),
+                )
+            elif kind == OPEN_FUNCTIONAL_TERM:
+                obj = OpenFunctionalTerm(
+                    f=symbol(entry[1]), t=tuple([symbol(j) for j in entry[2]])
+                )
+            elif kind == OPEN_ARBITRARY_OBJECT:
+                obj = OpenArbitraryObject(name=entry[1])
+            elif kind == QUESTION_MARK:
+                obj = QuestionMark()
+            else:
+                raise ValueError(f"Unknown symbol kind {kind}")
+        except (IndexError, TypeError) as e:
+            raise ValueError(f"Malformed symbol table entry {entry}") from e
+        objects[i] = obj
+        if self.maxsize is not None and len(objects) > self.maxsize:
+            objects.popitem(last=False)
+        return obj
+
+    def view(self, record: ViewRecord) -> ViewStorage:
+        """
+        Args:
+            record (ViewRecord): The record of a view, referring to symbols already
+                added.
+
+        Raises:
+            ValueError: The record is malformed
+
+        Returns:
+            ViewStorage: The decoded view
+        """
+        symbol = self.symbol
+        states: dict[tuple[int, ...], State] = {}
+
+        def state(ids: tuple[int, ...]) -> State:
+            if ids not in states:
+                states[ids] = State([symbol(i) for i in ids])
+            return states[ids]
+
+        def terms(ids: tuple[int, ...]) -> Multiset[Term]:
+            return Multiset[Term]([symbol(i) for i in ids])
+
+        try:
+            (
+                stage,
+                supposition,
+                weights,
+                issues,
+                universals,
+                existentials,
+                dependencies,
+            ) = record
+            return ViewStorage(
+                stage=SetOfStates([state(s) for s in stage]),
+                supposition=SetOfStates([state(s) for s in supposition]),
+                weights=Weights(
+                    {
+                        state(s): Weight(multiplicative=terms(m), additive=terms(a))
+                        for s, m, a in weights
+                    }
+                ),
+                issue_structure=IssueStructure(
+                    [(symbol(t), symbol(a)) for t, a in issues]
+                ),
+                dependency_relation=DependencyRelation(
+                    universals={symbol(u) for u in universals},
+                    existentials={symbol(e) for e in existentials},
+                    dependencies=frozenset(
+                        [
+                            Dependency(existential=symbol(e), universal=symbol(u))
+                            for e, u in dependencies
+                        ]
+                    ),
+                ),
+            )
+        except (IndexError, TypeError) as e:
+            raise ValueError("Malformed view record") from e
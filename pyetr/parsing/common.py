@@ -3,6 +3,7 @@ from collections import OrderedDict
 from copy import copy
 from typing import Any, Iterable, NotRequired, Optional, TypedDict
 
+from pyetr.atoms.predicate import Predicate
 from pyetr.atoms.terms import ArbitraryObject, OpenTerm, Term, get_open_equivalent
 from pyetr.atoms.terms.function import Function, NumFunc
 from pyetr.dependency import (
@@ -290,6 +291,44 @@ def funcs_converter(f_iter: Iterable[Function | NumFunc]) -> list[Function]:
     return output
 
 
+class SymbolTable:
+    """
+    Shares predicate and function objects between parsed views, so that each
+    distinct predicate or function is represented by a single object.
+    """
+
+    def __init__(self) -> None:
+        self._predicates: dict[tuple[str, int, bool], Predicate] = {}
+        self._functions: dict[tuple[type, str, Optional[int]], Function] = {}
+
+    def predicate(self, name: str, arity: int, verifier: bool) -> Predicate:
+        """
+        Args:
+            name (str): The name of the predicate
+            arity (int): The arity of the predicate
+            verifier (bool): True if the predicate is not negated.
+
+        Returns:
+            Predicate: The shared predicate
+        """
+        key = (name, arity, verifier)
+        predicate = self._predicates.get(key)
+        if predicate is None:
+            predicate = Predicate(name=name, arity=arity, _verifier=verifier)
+            self._predicates[key] = predicate
+        return predicate
+
+    def function(self, f: Function) -> Function:
+        """
+        Args:
+            f (Function): A function without a func caller
+
+        Returns:
+            Function: The shared function equal to f
+        """
+        return self._functions.setdefault((type(f), f.name, f.arity), f)
+
+
 ctx = decimal.Context()
 ctx.prec = 20
 
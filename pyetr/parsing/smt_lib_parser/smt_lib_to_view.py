@@ -1,8 +1,9 @@
 import typing
 from io import StringIO
-from typing import Optional
+from typing import Iterator, Optional, TextIO
 
 from pysmt.environment import Environment
+from pysmt.fnode import FNode
 from pysmt.smtlib.parser import SmtLibParser
 
 from pyetr.atoms.terms.function import Function, NumFunc
@@ -23,13 +24,30 @@ def smt_lib_to_view(
     return smt_to_view(formula, custom_functions=custom_functions)
 
 
+def smt_lib_to_smts(smt_lib: str | TextIO, parser: SmtLibParser) -> Iterator[FNode]:
+    """
+    Reads the formula of each assertion of an SMT Lib script, in a single pass
+    as the script is read.
+
+    Args:
+        smt_lib (str | TextIO): The script, or a file to read it from
+        parser (SmtLibParser): The parser, which keeps the declarations read
+
+    Returns:
+        Iterator[FNode]: The formula of each assertion, in order
+    """
+    if isinstance(smt_lib, str):
+        smt_lib = StringIO(smt_lib)
+    for command in parser.get_command_generator(smt_lib):
+        if command.name == "assert":
+            yield command.args[0]
+
+
 def smt_lib_to_view_stores(
     smt_lib: str, custom_functions: Optional[list[NumFunc | Function]] = None
 ) -> list[ViewStorage]:
     parser = SmtLibParser(Environment())
-    script = parser.get_script(StringIO(smt_lib))
-    current = script.get_last_formula()
-    if current.is_and():
-        return [smt_to_view(i, custom_functions) for i in current.args()]
-    else:
-        return [smt_to_view(current, custom_functions)]
+    return [
+        smt_to_view(formula, custom_functions)
+        for formula in smt_lib_to_smts(smt_lib, parser)
+    ]
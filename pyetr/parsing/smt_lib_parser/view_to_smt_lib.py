@@ -68,7 +68,40 @@ def get_main_string(formula):
     return res
 
 
-def _with_setup(statements: list[str], env: Environment):
+def used_symbols(formulas: typing.Iterable[FNode]) -> set[FNode]:
+    """
+    Finds the symbols used in formulas, including the functions applied and
+    the variables bound by quantifiers.
+
+    Args:
+        formulas (typing.Iterable[FNode]): The formulas
+
+    Returns:
+        set[FNode]: The symbols
+    """
+    symbols: set[FNode] = set()
+    seen: set[FNode] = set()
+    stack = list(formulas)
+    while stack:
+        node = stack.pop()
+        if node in seen:
+            continue
+        seen.add(node)
+        if node.is_symbol():
+            symbols.add(node)
+        elif node.is_function_application():
+            symbols.add(node.function_name())
+        elif node.is_quantifier():
+            symbols.update(node.quantifier_vars())
+        stack.extend(node.args())
+    return symbols
+
+
+def _with_setup(
+    statements: list[str],
+    env: Environment,
+    symbols: typing.Optional[set[FNode]] = None,
+):
     ret = []
     for x in env.type_manager._custom_types_decl.values():
         out = convert_type(x)
@@ -76,6 +109,8 @@ def _with_setup(statements: list[str], env: Environment):
             ret.append(out)
 
     for x in env.formula_manager.get_all_symbols():
+        if symbols is not None and x not in symbols:
+            continue
         out = convert_symbol(x)
         if out is not None:
             ret.append(out)
@@ -89,8 +124,26 @@ def smt_to_smt_lib(smt: FNode, env: Environment) -> str:
     return _with_setup([main_string], env)
 
 
-def smts_to_smt_lib(smts: list[FNode], env: Environment) -> str:
+def smts_to_smt_lib(
+    smts: list[FNode], env: Environment, used_only: bool = False
+) -> str:
+    """
+    Convert pysmt formulas into a single smt lib string, with an assertion for
+    each formula.
+
+    Args:
+        smts (list[FNode]): The formulas
+        env (Environment): The pysmt environment the formulas are embedded in
+        used_only (bool, optional): Only declare the symbols used by the
+            formulas, rather than every symbol of the environment. Defaults to
+            False.
+
+    Returns:
+        str: The smt lib string
+    """
     statements = [get_main_string(smt) for smt in smts]
+    if used_only:
+        return _with_setup(statements, env, used_symbols(smts))
     return _with_setup(statements, env)
 
 
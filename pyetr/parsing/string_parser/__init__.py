@@ -1,25 +1,31 @@
 from __future__ import annotations
 
-__all__ = ["string_to_view", "view_to_string"]
+__all__ = ["string_to_view", "string_to_views", "view_to_string"]
 
 import typing
-from typing import Optional, Unpack
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional, Unpack
+
+from pyparsing import ParserElement
 
 from pyetr.atoms.terms import Function
 from pyetr.atoms.terms.function import NumFunc
-from pyetr.parsing.common import StringConversion, funcs_converter
+from pyetr.parsing.common import StringConversion, SymbolTable, funcs_converter
 from pyetr.parsing.view_storage import ViewStorage
 
 if typing.TYPE_CHECKING:
     from pyetr.view import View
 
+from .fast_parse_string import fast_parse_string
 from .parse_string import parse_string as ps
 from .parse_view import parse_pv
 from .unparse_view import unparse_view
 
 
 def string_to_view(
-    s: str, custom_functions: Optional[list[NumFunc | Function]] = None
+    s: str,
+    custom_functions: Optional[list[NumFunc | Function]] = None,
+    fast: bool = False,
 ) -> ViewStorage:
     """
     Parses from view string form to view form.
@@ -29,13 +35,80 @@ def string_to_view(
         custom_functions (list[NumFunc | Function] | None, optional): Custom functions used in the
             string. It assumes the name of the function is that used in the string. Useful
             for using func callers. Defaults to None.
+        fast (bool, optional): If True, uses the hand written parser rather than the
+            pyparsing grammar. Defaults to False.
 
     Returns:
         ViewStorage: The output view
     """
     if custom_functions is None:
         custom_functions = []
-    return parse_pv(ps(s), funcs_converter(custom_functions))
+    parse = fast_parse_string if fast else ps
+    return parse_pv(parse(s), funcs_converter(custom_functions))
+
+
+def string_to_views(
+    strings: Iterable[str],
+    custom_functions: Optional[list[NumFunc | Function]] = None,
+    symbols: Optional[SymbolTable] = None,
+    max_workers: int = 1,
+    chunksize: int = 64,
+    fast: bool = False,
+) -> list[ViewStorage]:
+    """
+    Parses many strings from view string form to view form.
+
+    All views are built from one symbol table, so equal predicates and functions
+    are represented by the same objects across views, and repeated strings are only
+    parsed once. With more than one worker, the strings are parsed in a pool of
+    processes, while the views themselves are still built in this process from the
+    one symbol table.
+
+    Args:
+        strings (Iterable[str]): The view strings
+        custom_functions (list[NumFunc | Function] | None, optional): Custom functions used in the
+            strings. It assumes the name of the function is that used in the string. Useful
+            for using func callers. Defaults to None.
+        symbols (Optional[SymbolTable], optional): The symbol table to use, allowing it
+            to be shared across calls. Defaults to None, a new table.
+        max_workers (int, optional): The number of processes to parse in. Defaults to 1,
+            parsing in this process.
+        chunksize (int, optional): The number of strings sent to a process at once.
+            Defaults to 64.
+        fast (bool, optional): If True, uses the hand written parser rather than the
+            pyparsing grammar. Defaults to False.
+
+    Raises:
+        ValueError: max_workers or chunksize is less than 1
+
+    Returns:
+        list[ViewStorage]: The output views, in the order of the strings.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if custom_functions is None:
+        custom_functions = []
+    if symbols is None:
+        symbols = SymbolTable()
+    functions = funcs_converter(custom_functions)
+    parse = fast_parse_string if fast else ps
+
+    strings = list(strings)
+    unique = list(dict.fromkeys(strings))
+    if max_workers == 1 or len(unique) <= chunksize:
+        parsed = {s: parse_pv(parse(s), functions, symbols) for s in unique}
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            parser_views = executor.map(parse, unique, chunksize=chunksize)
+            parsed = {
+                s: parse_pv(pv, functions, symbols)
+                for s, pv in zip(unique, parser_views)
+            }
+    # Release the results held by the packrat cache from the last parse
+    ParserElement.reset_cache()
+    return [parsed[s] for s in strings]
 
 
 def view_to_string(
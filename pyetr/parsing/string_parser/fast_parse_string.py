@@ -0,0 +1,400 @@
+__all__ = ["fast_parse_string"]
+
+import re
+from typing import Callable, Optional, TypeVar
+
+from pyetr.parsing.common import ParsingError, Quantified, Variable
+
+from .parse_string import (
+    AdditiveWeight,
+    Atom,
+    DoAtom,
+    Emphasis,
+    Function,
+    MultiplicativeWeight,
+    ParserView,
+    Real,
+    Stage,
+    State,
+    Summation,
+    Supposition,
+    Term,
+    WeightedState,
+    Xbar,
+    parse_string,
+)
+
+T = TypeVar("T")
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+# Variables may not contain A or E, as these are reserved for quantifiers
+_VARIABLE = re.compile(r"[a-zB-DF-Z_][a-zB-DF-Z0-9_]*")
+_DIGITS = re.compile(r"[0-9]+")
+_KEYWORD_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$"
+)
+_QUANTIFIERS = ("∃", "∀", "E", "A")
+_XBARS = ("**", "x̄")
+
+
+class _Scanner:
+    """
+    A recursive descent parser over the view string syntax, accepting the same
+    strings as the grammar in parse_string and building the same parser
+    representation. Each method either consumes its item and returns it, or
+    leaves the position where it was and returns None. Input that matches the
+    syntax but cannot be represented raises ParsingError.
+    """
+
+    def __init__(self, s: str) -> None:
+        self.s = s
+        self.pos = 0
+
+    def skip(self) -> None:
+        self.pos = _WHITESPACE.match(self.s, self.pos).end()  # pyright: ignore
+
+    def literal(self, text: str) -> bool:
+        self.skip()
+        if self.s.startswith(text, self.pos):
+            self.pos += len(text)
+            return True
+        return False
+
+    def regex(self, pattern: re.Pattern[str]) -> Optional[str]:
+        self.skip()
+        m = pattern.match(self.s, self.pos)
+        if m is None:
+            return None
+        self.pos = m.end()
+        return m.group()
+
+    def attempt(self, func: Callable[[], Optional[T]]) -> Optional[T]:
+        start = self.pos
+        out = func()
+        if out is None:
+            self.pos = start
+        return out
+
+    def at_keyword(self, word: str) -> bool:
+        self.skip()
+        end = self.pos + len(word)
+        return self.s.startswith(word, self.pos) and (
+            end >= len(self.s) or self.s[end] not in _KEYWORD_CHARS
+        )
+
+    def delimited(
+        self, item: Callable[[], Optional[T]], delimiter: str
+    ) -> Optional[list[T]]:
+        first = item()
+        if first is None:
+            return None
+        items = [first]
+        while True:
+            start = self.pos
+            if not self.literal(delimiter):
+                break
+            next_item = item()
+            if next_item is None:
+                self.pos = start
+                break
+            items.append(next_item)
+        return items
+
+    def one_or_more(self, item: Callable[[], Optional[T]]) -> Optional[list[T]]:
+        items: list[T] = []
+        while (next_item := item()) is not None:
+            items.append(next_item)
+        if not items:
+            return None
+        return items
+
+    # Terms
+
+    def arguments(self) -> Optional[list[Term]]:
+        # ( term, ..., term )
+        if not self.literal("("):
+            return None
+        args = self.delimited(self.term, ",")
+        if not self.literal(")"):
+            return None
+        return [] if args is None else args
+
+    def function(self) -> Optional[Term]:
+        name = self.regex(_NAME)
+        if name is None:
+            return None
+        args = self.arguments()
+        if args is None:
+            return None
+        return Function([name, *args])
+
+    def summation(self) -> Optional[Term]:
+        if not (self.literal("++") or self.literal("σ")):
+            return None
+        args = self.arguments()
+        if args is None:
+            return None
+        return Summation(["σ", *args])
+
+    def xbar_prefix(self) -> Optional[Term]:
+        if not any(self.literal(x) for x in _XBARS):
+            return None
+        args = self.arguments()
+        if args is None:
+            return None
+        if len(args) < 2:
+            raise ParsingError(f"x̄ takes two terms, found {len(args)}")
+        return Xbar([args])
+
+    def real(self) -> Optional[Term]:
+        tokens: list[str] = []
+        if self.literal("-"):
+            tokens.append("-")
+        digits = self.regex(_DIGITS)
+        if digits is None:
+            return None
+        tokens.append(digits)
+        start = self.pos
+        if self.literal(".") and (decimals := self.regex(_DIGITS)) is not None:
+            tokens += [".", decimals]
+        else:
+            self.pos = start
+        return Real(tokens)
+
+    def variable(self) -> Optional[Variable]:
+        name = self.regex(_VARIABLE)
+        if name is None:
+            return None
+        return Variable(name)
+
+    def nested(self) -> Optional[Term]:
+        if not self.literal("("):
+            return None
+        term = self.term()
+        if term is None or not self.literal(")"):
+            return None
+        return term
+
+    def operand(self) -> Optional[Term]:
+        for item in (
+            self.function,
+            self.summation,
+            self.xbar_prefix,
+            self.real,
+            self.variable,
+            self.nested,
+        ):
+            out = self.attempt(item)
+            if out is not None:
+                return out  # pyright: ignore
+        return None
+
+    def xbar_emphasis_op(self) -> bool:
+        return self.literal("*") and any(self.literal(x) for x in _XBARS)
+
+    def xbar_op(self) -> bool:
+        return any(self.literal(x) for x in _XBARS)
+
+    def binary(
+        self, operand: Callable[[], Optional[Term]], op: Callable[[], bool]
+    ) -> Optional[list[Term]]:
+        first = operand()
+        if first is None:
+            return None
+        operands = [first]
+        while True:
+            start = self.pos
+            if op() and (next_operand := operand()) is not None:
+                operands.append(next_operand)
+            else:
+                self.pos = start
+                break
+        return operands
+
+    def xbar_emphasis_term(self) -> Optional[Term]:
+        # a*x̄b, read as a* x̄ b
+        operands = self.binary(self.operand, self.xbar_emphasis_op)
+        if operands is None:
+            return None
+        if len(operands) == 1:
+            return operands[0]
+        return Xbar([[Emphasis([[operands[0]]]), operands[1]]])
+
+    def xbar_term(self) -> Optional[Term]:
+        operands = self.binary(self.xbar_emphasis_term, self.xbar_op)
+        if operands is None:
+            return None
+        if len(operands) == 1:
+            return operands[0]
+        return Xbar([operands])
+
+    def term(self) -> Optional[Term]:
+        start = self.pos
+        term = self.xbar_term()
+        if term is None:
+            self.pos = start
+            return None
+        emphasised = False
+        while self.literal("*"):
+            emphasised = True
+        if emphasised:
+            return Emphasis([[term]])
+        return term
+
+    def terms(self) -> Optional[list[Term]]:
+        return self.one_or_more(self.term)
+
+    def term_list(self, delimiter: str) -> Optional[list[Term]]:
+        groups = self.delimited(lambda: self.attempt(self.terms), delimiter)
+        if groups is None:
+            return None
+        return [t for group in groups for t in group]
+
+    # Atoms and states
+
+    def atom(self) -> Optional[Atom]:
+        tokens: list[object] = []
+        if self.literal("~"):
+            tokens.append("~")
+        if self.at_keyword("do") or self.at_keyword("DO"):
+            return None
+        name = self.regex(_NAME)
+        if name is None:
+            if not self.literal("=="):
+                return None
+            name = "=="
+        tokens.append(name)
+        if not self.literal("("):
+            return None
+        args = self.term_list(",")
+        if not self.literal(")"):
+            return None
+        return Atom(tokens + ([] if args is None else args))
+
+    def do_atom(self) -> Optional[DoAtom]:
+        tokens: list[object] = []
+        if self.literal("~"):
+            tokens.append("~")
+        if not (self.literal("do") or self.literal("DO")):
+            return None
+        if not self.literal("("):
+            return None
+        while (atom := self.attempt(self.atom)) is not None:
+            tokens.append(atom)
+        if not self.literal(")"):
+            return None
+        return DoAtom(tokens)
+
+    def state(self) -> Optional[State]:
+        def item() -> Optional[Atom | DoAtom]:
+            out = self.attempt(self.do_atom)
+            if out is None:
+                out = self.attempt(self.atom)
+            return out
+
+        atoms = self.one_or_more(item)
+        if atoms is None:
+            return None
+        return State(atoms)
+
+    def verum_or_state(self) -> Optional[State]:
+        if self.literal("0"):
+            return State([])
+        return self.attempt(self.state)
+
+    def weight(self, marker: str) -> Optional[list[Term]]:
+        terms = self.term_list("|")
+        if terms is None or not self.literal(marker):
+            return None
+        return terms
+
+    def weighted_state(self) -> Optional[WeightedState]:
+        tokens: list[object] = []
+        multiplicative = self.attempt(lambda: self.weight("=*"))
+        if multiplicative is not None:
+            tokens.append(MultiplicativeWeight(multiplicative))
+        additive = self.attempt(lambda: self.weight("=+"))
+        if additive is not None:
+            tokens.append(AdditiveWeight(additive))
+        state = self.verum_or_state()
+        if state is None:
+            return None
+        return WeightedState(tokens + [state])
+
+    # Views
+
+    def quantified(self) -> Optional[Quantified]:
+        for quantifier in _QUANTIFIERS:
+            if self.literal(quantifier):
+                variable = self.variable()
+                if variable is None:
+                    return None
+                return Quantified(variable, quantifier)
+        return None
+
+    def stage(self) -> Optional[Stage]:
+        def states() -> Optional[list[WeightedState]]:
+            if not self.literal("{"):
+                return None
+            out = self.delimited(lambda: self.attempt(self.weighted_state), ",")
+            if out is None or not self.literal("}"):
+                return None
+            return out
+
+        out = self.attempt(states)
+        if out is not None:
+            return Stage(out)
+        if self.literal("{}"):
+            return Stage([])
+        return None
+
+    def supposition(self) -> Optional[Supposition]:
+        if self.literal("{}"):
+            return Supposition([])
+        if not self.literal("{"):
+            return None
+        out = self.delimited(self.verum_or_state, ",")
+        if not self.literal("}"):
+            return None
+        return Supposition([] if out is None else out)
+
+    def view(self) -> Optional[ParserView]:
+        quantifiers: list[Quantified] = []
+        while (q := self.attempt(self.quantified)) is not None:
+            quantifiers.append(q)
+        stage = self.stage()
+        if stage is None:
+            return None
+        start = self.pos
+        supposition = None
+        if self.literal("^"):
+            supposition = self.supposition()
+            if supposition is None:
+                self.pos = start
+        self.skip()
+        if self.pos != len(self.s):
+            return None
+        return ParserView(quantifiers=quantifiers, stage=stage, supposition=supposition)
+
+
+def fast_parse_string(input_string: str) -> ParserView:
+    """
+    Converts an input string to the parser view representation, using a hand
+    written parser that is much faster than the pyparsing grammar. If the string
+    does not match the syntax, the pyparsing grammar is used instead to report
+    where.
+
+    Args:
+        input_string (str): The input string.
+
+    Raises:
+        ParsingError: Issue during parsing.
+
+    Returns:
+        ParserView: The Parser view representation.
+    """
+    out = _Scanner(input_string).view()
+    if out is None:
+        return parse_string(input_string)
+    return out
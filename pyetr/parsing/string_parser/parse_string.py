@@ -17,7 +17,10 @@ from pyetr.parsing.common import (
 
 sys.setrecursionlimit(10000)
 
-ParserElement.enable_packrat(force=True)
+# The packrat cache is bounded, and pyparsing empties it at the start of each
+# parse, so memory held by it does not grow over many parses.
+PACKRAT_CACHE_SIZE = 128
+ParserElement.enable_packrat(PACKRAT_CACHE_SIZE, force=True)
 
 pp_left = pp.opAssoc.LEFT
 pp_right = pp.opAssoc.RIGHT
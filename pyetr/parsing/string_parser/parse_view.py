@@ -18,6 +18,7 @@ from pyetr.atoms.terms.special_funcs import Summation, XBar
 from pyetr.issues import IssueStructure
 from pyetr.parsing.common import (
     ParsingError,
+    SymbolTable,
     Variable,
     get_variable_map_and_dependencies,
     merge_terms_with_opens,
@@ -133,6 +134,7 @@ def parse_predicate_atom(
     atom: parsing.Atom,
     variable_map: dict[str, ArbitraryObject],
     function_map: dict[tuple[str, int | None], Function],
+    symbols: Optional[SymbolTable] = None,
 ) -> tuple[PredicateAtom, list[tuple[Term, OpenPredicateAtom]]]:
     """
     Parse the parser atom to predicate atom form.
@@ -141,6 +143,7 @@ def parse_predicate_atom(
         atom (parsing.Atom): Parser atom representation
         variable_map (dict[str, ArbitraryObject]): The map from variable name to variable.
         function_map (dict[tuple[str,int | None], Function]): The map from function name to function.
+        symbols (Optional[SymbolTable], optional): The table to share predicates from. Defaults to None.
 
     Returns:
         tuple[PredicateAtom, list[tuple[Term, OpenPredicateAtom]]]: The parsed predicate atom
@@ -157,9 +160,14 @@ def parse_predicate_atom(
 
     new_open_terms_sets = merge_terms_with_opens(terms, open_term_sets)
 
-    predicate = Predicate(
-        name=atom.predicate_name, arity=len(atom.terms), _verifier=atom.verifier
-    )
+    if symbols is None:
+        predicate = Predicate(
+            name=atom.predicate_name, arity=len(atom.terms), _verifier=atom.verifier
+        )
+    else:
+        predicate = symbols.predicate(
+            atom.predicate_name, len(atom.terms), atom.verifier
+        )
     open_atoms = [
         (t, OpenPredicateAtom(predicate=predicate, terms=tuple(open_terms)))
         for t, open_terms in new_open_terms_sets
@@ -171,6 +179,7 @@ def parse_do_atom(
     atom: parsing.DoAtom,
     variable_map: dict[str, ArbitraryObject],
     function_map: dict[tuple[str, int | None], Function],
+    symbols: Optional[SymbolTable] = None,
 ) -> tuple[DoAtom, list[tuple[Term, OpenPredicateAtom]]]:
     """
     Converts the parser do atom to DoAtom form.
@@ -179,6 +188,7 @@ def parse_do_atom(
         atom (parsing.DoAtom): The Parser do atom
         variable_map (dict[str, ArbitraryObject]): The map from variable name to variable.
         function_map (dict[tuple[str,int | None], Function]): The map from function name to function.
+        symbols (Optional[SymbolTable], optional): The table to share predicates from. Defaults to None.
 
     Returns:
         tuple[DoAtom, list[tuple[Term, OpenPredicateAtom]]]: The parsed do atom and its associated open
@@ -188,7 +198,7 @@ def parse_do_atom(
     open_atom_sets: list[tuple[Term, OpenPredicateAtom]] = []
     for a in atom.atoms:
         parsed_a, open_atoms = parse_predicate_atom(
-            a, variable_map=variable_map, function_map=function_map
+            a, variable_map=variable_map, function_map=function_map, symbols=symbols
         )
         atoms.append(parsed_a)
         open_atom_sets += open_atoms
@@ -200,6 +210,7 @@ def parse_state(
     s: parsing.State,
     variable_map: dict[str, ArbitraryObject],
     function_map: dict[tuple[str, int | None], Function],
+    symbols: Optional[SymbolTable] = None,
 ) -> tuple[State, list[tuple[Term, OpenPredicateAtom]]]:
     """
     Parses the state from the parsing representation to the state and associated
@@ -209,6 +220,7 @@ def parse_state(
         s (parsing.State): The parsing representation of the state.
         variable_map (dict[str, ArbitraryObject]): The map from variable name to variable.
         function_map (dict[tuple[str, int | None], Function]): The map from function name to function.
+        symbols (Optional[SymbolTable], optional): The table to share predicates from. Defaults to None.
 
     Returns:
         tuple[State, list[tuple[Term, OpenPredicateAtom]]]: The parsed state and its associated open
@@ -219,11 +231,17 @@ def parse_state(
     for atom in s.atoms:
         if isinstance(atom, parsing.Atom):
             parsed_atom, new_issues = parse_predicate_atom(
-                atom, variable_map=variable_map, function_map=function_map
+                atom,
+                variable_map=variable_map,
+                function_map=function_map,
+                symbols=symbols,
             )
         else:
             parsed_atom, new_issues = parse_do_atom(
-                atom, variable_map=variable_map, function_map=function_map
+                atom,
+                variable_map=variable_map,
+                function_map=function_map,
+                symbols=symbols,
             )
         new_atoms.append(parsed_atom)
         issues += new_issues
@@ -234,6 +252,7 @@ def parse_weighted_states(
     w_states: list[parsing.WeightedState],
     variable_map: dict[str, ArbitraryObject],
     function_map: dict[tuple[str, int | None], Function],
+    symbols: Optional[SymbolTable] = None,
 ) -> tuple[Weights, list[tuple[Term, OpenPredicateAtom]]]:
     """
     Parses the weighted state from the parsing representation to the weights and associated
@@ -243,6 +262,7 @@ def parse_weighted_states(
         w_states (list[parsing.WeightedState]): The weighted states.
         variable_map (dict[str, ArbitraryObject]): The map from variable name to variable.
         function_map (dict[tuple[str,int | None], Function]): The map from function name to function.
+        symbols (Optional[SymbolTable], optional): The table to share predicates from. Defaults to None.
 
     Returns:
         tuple[Weights, list[tuple[Term, OpenPredicateAtom]]]: The weighted state in parsed form.
@@ -251,7 +271,10 @@ def parse_weighted_states(
     issues: list[tuple[Term, OpenPredicateAtom]] = []
     for state in w_states:
         parsed_state, new_issues = parse_state(
-            state.state, variable_map=variable_map, function_map=function_map
+            state.state,
+            variable_map=variable_map,
+            function_map=function_map,
+            symbols=symbols,
         )
         issues += new_issues
         if state.additive is not None:
@@ -314,6 +337,7 @@ def get_function_map(
     stage: parsing.Stage,
     supposition: Optional[parsing.Supposition],
     custom_functions: list[Function],
+    symbols: Optional[SymbolTable] = None,
 ) -> dict[tuple[str, None | int], Function]:
     """
     Get the function map from name to object.
@@ -322,6 +346,7 @@ def get_function_map(
         stage (parsing.Stage): The parser representation of the stage
         supposition (Optional[parsing.Supposition]):  The parser representation of the supposition, if there is one
         custom_functions (list[Function]): Additional "override" functions.
+        symbols (Optional[SymbolTable], optional): The table to share functions from. Defaults to None.
 
     Returns:
         dict[tuple[str,int | None], Function]: The map between function name and object.
@@ -368,6 +393,8 @@ def get_function_map(
     new_funcs: list[Function] = []
     for term in terms_to_scan:
         new_funcs += gather_funcs(term)
+    if symbols is not None:
+        new_funcs = [symbols.function(f) for f in new_funcs]
 
     for new_func in new_funcs:
         if (new_func.name, new_func.arity) not in func_map and (
@@ -379,27 +406,41 @@ def get_function_map(
     return func_map
 
 
-def parse_pv(pv: parsing.ParserView, custom_functions: list[Function]) -> ViewStorage:
+def parse_pv(
+    pv: parsing.ParserView,
+    custom_functions: list[Function],
+    symbols: Optional[SymbolTable] = None,
+) -> ViewStorage:
     """
     Parses the view from parser representation to view representation.
 
     Args:
         pv (parsing.ParserView): The parser representation of a view.
         custom_functions (list[Function]): A list of custom functions to use in the view.
+        symbols (Optional[SymbolTable], optional): The table to share predicates and
+            functions from, when parsing many views. Defaults to None.
 
     Returns:
         View: The parsed view.
     """
     variable_map, dep_rel = get_variable_map_and_dependencies(pv.quantifiers)
-    function_map = get_function_map(pv.stage, pv.supposition, custom_functions)
+    function_map = get_function_map(
+        pv.stage, pv.supposition, custom_functions, symbols=symbols
+    )
     weights, issues = parse_weighted_states(
-        pv.stage.states, variable_map=variable_map, function_map=function_map
+        pv.stage.states,
+        variable_map=variable_map,
+        function_map=function_map,
+        symbols=symbols,
     )
     if pv.supposition is not None:
         supp_states: list[State] = []
         for s in pv.supposition.states:
             parsed_state, new_issues = parse_state(
-                s, variable_map=variable_map, function_map=function_map
+                s,
+                variable_map=variable_map,
+                function_map=function_map,
+                symbols=symbols,
             )
             supp_states.append(parsed_state)
             issues += new_issues
@@ -12,10 +12,21 @@ from pyetr.atoms.terms.open_term import (
     QuestionMark,
     get_open_equivalent,
 )
-from pyetr.atoms.terms.special_funcs import multiset_product
+from pyetr.atoms.terms.special_funcs import (
+    multi_func_new,
+    multiset_product,
+    sum_func_new,
+)
 
-from .atoms import Atom, PredicateAtom, equals_predicate
-from .atoms.terms import ArbitraryObject, FunctionalTerm, Multiset, Summation, Term
+from .atoms import Atom, Predicate, PredicateAtom, equals_predicate
+from .atoms.terms import (
+    ArbitraryObject,
+    FunctionalTerm,
+    Multiset,
+    RealNumber,
+    Summation,
+    Term,
+)
 
 if TYPE_CHECKING:  # pragma: not covered
     from pyetr.weight import Weights
@@ -57,16 +68,32 @@ def get_opens(atom: PredicateAtom, search_term: Term) -> list[OpenPredicateAtom]
     return new_open_atoms
 
 
+def _numbers(terms: Multiset[Term]) -> Optional[list[float]]:
+    nums: list[float] = []
+    for term in terms:
+        if not (isinstance(term, FunctionalTerm) and isinstance(term.f, RealNumber)):
+            return None
+        nums.append(term.f.num)
+    return nums
+
+
 class State(frozenset[Atom]):
     """
     A frozen set of atoms.
     """
 
+    # States are not changed once built, so their arbitrary objects are found
+    # once, when first read, and kept
+    __slots__ = ("_arb_objects",)
+    _arb_objects: Optional[frozenset[ArbitraryObject]]
+
     def __new__(cls, __iterable: Optional[Iterable[Atom]] = None, /) -> "State":
         if __iterable is None:
-            return super().__new__(cls)
+            state = super().__new__(cls)
         else:
-            return super().__new__(cls, __iterable)
+            state = super().__new__(cls, __iterable)
+        state._arb_objects = None
+        return state
 
     def copy(self) -> "State":  # pragma: not covered
         return State(super().copy())
@@ -93,7 +120,14 @@ class State(frozenset[Atom]):
     def __or__(  # pyright: ignore [reportIncompatibleMethodOverride]
         self, __value: AbstractSet[Atom]
     ) -> "State":
-        return State(super().__or__(__value))
+        state = State(super().__or__(__value))
+        if (
+            self._arb_objects is not None
+            and isinstance(__value, State)
+            and __value._arb_objects is not None
+        ):
+            state._arb_objects = self._arb_objects | __value._arb_objects
+        return state
 
     def __sub__(self, __value: AbstractSet[Atom]) -> "State":
         return State(super().__sub__(__value))
@@ -103,18 +137,25 @@ class State(frozenset[Atom]):
     ) -> "State":  # pragma: not covered
         return State(super().__xor__(__value))
 
+    def _with_atoms(self, new_atoms: list[Atom]) -> "State":
+        if all(n is o for n, o in zip(new_atoms, self)):
+            return self
+        return State(new_atoms)
+
     @property
-    def arb_objects(self) -> set[ArbitraryObject]:
+    def arb_objects(self) -> frozenset[ArbitraryObject]:
         """
         The arbitrary objects in the state
 
         Returns:
-            set[ArbitraryObject]: The set of arbitrary objects
+            frozenset[ArbitraryObject]: The set of arbitrary objects
         """
-        arb_objects: set[ArbitraryObject] = set()
-        for atom in self:
-            arb_objects |= atom.arb_objects
-        return arb_objects
+        if self._arb_objects is None:
+            arb_objects: set[ArbitraryObject] = set()
+            for atom in self:
+                arb_objects |= atom.arb_objects
+            self._arb_objects = frozenset(arb_objects)
+        return self._arb_objects
 
     def __repr__(self) -> str:
         if len(self) == 0:
@@ -136,11 +177,13 @@ class State(frozenset[Atom]):
         Returns:
             State: The new states.
         """
-        return State([s._replace_arbs(replacements) for s in self])
+        if not replacements:
+            return self
+        return self._with_atoms([s._replace_arbs(replacements) for s in self])
 
     def replace_term(self, old_term: Term, new_term: Term) -> "State":
-        return State(
-            {i.replace_term(old_term=old_term, new_term=new_term) for i in self}
+        return self._with_atoms(
+            [i.replace_term(old_term=old_term, new_term=new_term) for i in self]
         )
 
     def is_primitive_absurd(self, absurd_states: Optional[list["State"]]) -> bool:
@@ -156,37 +199,64 @@ class State(frozenset[Atom]):
         Returns:
             bool: True if the state is primitive absurd.
         """
+        if absurd_states is not None and any(
+            absurd_state.issubset(self) for absurd_state in absurd_states
+        ):
+            return True
+        return self._breaks_absurdity_rules()
+
+    def _breaks_absurdity_rules(self) -> bool:
+        """
+        Checks the rules of definition 4.13, with the predicate atoms of the state
+        grouped by predicate, so that each rule only looks at the atoms it can
+        apply to.
+
+        Returns:
+            bool: True if the state contains {p, p̄}, {≠tt} or {=tt',x[t/?],x̄[t'/?]}
+        """
         state = self
-        if absurd_states is not None:
-            for absurd_state in absurd_states:
-                if absurd_state.issubset(state):
-                    return True
-        # LNC
-        # {p, p̄}
+        by_predicate: dict[Predicate, list[PredicateAtom]] = {}
         for atom in state:
-            if ~atom in state:
+            if isinstance(atom, PredicateAtom):
+                if atom.predicate in by_predicate:
+                    by_predicate[atom.predicate].append(atom)
+                else:
+                    by_predicate[atom.predicate] = [atom]
+            elif ~atom in state:
                 return True
 
         # Aristotle
         # {≠tt}
-        for atom in state:
-            if isinstance(atom, PredicateAtom) and (
-                atom.predicate == ~equals_predicate
-            ):
-                if atom.terms[0] == atom.terms[1]:
-                    return True
+        for atom in by_predicate.get(~equals_predicate, []):
+            if atom.terms[0] == atom.terms[1]:
+                return True
+
+        # Atoms whose predicate is negated somewhere in the state, which are the
+        # only ones that p̄ or x̄[t'/?] can be found for
+        contrary = [
+            atom
+            for predicate, atoms in by_predicate.items()
+            if ~predicate in by_predicate
+            for atom in atoms
+        ]
+
+        # LNC
+        # {p, p̄}
+        for atom in contrary:
+            if ~atom in state:
+                return True
 
         # Leibniz
         # {=tt',x[t/?],x̄[t'/?]}
-        for atom in state:
-            if isinstance(atom, PredicateAtom) and (atom.predicate == equals_predicate):
-                t = atom.terms[0]
-                t_prime = atom.terms[1]
-                for x in state:
-                    if isinstance(x, PredicateAtom) and t in x.terms:
-                        new_atoms = set([~o(t_prime) for o in get_opens(x, t)])
-                        if any((atom in state) for atom in new_atoms):
-                            return True
+        if not contrary:
+            return False
+        for atom in by_predicate.get(equals_predicate, []):
+            t = atom.terms[0]
+            t_prime = atom.terms[1]
+            for x in contrary:
+                if t in x.terms:
+                    if any(~o(t_prime) in state for o in get_opens(x, t)):
+                        return True
         return False
 
     @property
@@ -200,8 +270,8 @@ class State(frozenset[Atom]):
         return sorted(self, key=str)
 
     def match(self, old_item: "MatchItem", callback: "MatchCallback") -> "State":
-        return State(
-            {atom.match(old_item=old_item, callback=callback) for atom in self}
+        return self._with_atoms(
+            [atom.match(old_item=old_item, callback=callback) for atom in self]
         )
 
 
@@ -210,11 +280,45 @@ class SetOfStates(frozenset[State]):
     A frozen set of states.
     """
 
+    # As with State, the sets derived from the states are found when first read
+    __slots__ = ("_arb_objects", "_atoms", "_predicate_atoms", "_index")
+    _arb_objects: Optional[frozenset[ArbitraryObject]]
+    _atoms: Optional[frozenset[Atom]]
+    _predicate_atoms: Optional[frozenset[PredicateAtom]]
+    _index: Optional["_ContainmentIndex"]
+
     def __new__(cls, __iterable: Optional[Iterable[State]] = None, /) -> "SetOfStates":
         if __iterable is None:
-            return super().__new__(cls)
+            states = super().__new__(cls)
         else:
-            return super().__new__(cls, __iterable)
+            states = super().__new__(cls, __iterable)
+        states._arb_objects = None
+        states._atoms = None
+        states._predicate_atoms = None
+        states._index = None
+        return states
+
+    def _with_derived_union(
+        self, other: "SetOfStates", states: "SetOfStates"
+    ) -> "SetOfStates":
+        """
+        Gives states, whose atoms are those of self and other together, the
+        derived sets already found for both.
+
+        Args:
+            other (SetOfStates): The other set of states
+            states (SetOfStates): The set of states built from self and other
+
+        Returns:
+            SetOfStates: states
+        """
+        if self._arb_objects is not None and other._arb_objects is not None:
+            states._arb_objects = self._arb_objects | other._arb_objects
+        if self._atoms is not None and other._atoms is not None:
+            states._atoms = self._atoms | other._atoms
+        if self._predicate_atoms is not None and other._predicate_atoms is not None:
+            states._predicate_atoms = self._predicate_atoms | other._predicate_atoms
+        return states
 
     def copy(self) -> "SetOfStates":  # pragma: not covered
         return SetOfStates(super().copy())
@@ -245,7 +349,10 @@ class SetOfStates(frozenset[State]):
     def __or__(  # pyright: ignore [reportIncompatibleMethodOverride]
         self, __value: AbstractSet[State]
     ) -> "SetOfStates":
-        return SetOfStates(super().__or__(__value))
+        states = SetOfStates(super().__or__(__value))
+        if isinstance(__value, SetOfStates):
+            return self._with_derived_union(__value, states)
+        return states
 
     def __sub__(
         self, __value: AbstractSet[State]
@@ -258,17 +365,18 @@ class SetOfStates(frozenset[State]):
         return SetOfStates(super().__xor__(__value))
 
     @property
-    def arb_objects(self) -> set[ArbitraryObject]:
+    def arb_objects(self) -> frozenset[ArbitraryObject]:
         """
         The arbitrary objects in the set of states
 
         Returns:
-            set[ArbitraryObject]: The set of arbitrary objects
+            frozenset[ArbitraryObject]: The set of arbitrary objects
         """
-        arb_objects: set[ArbitraryObject] = set()
-        for state in self:
-            arb_objects |= state.arb_objects
-        return arb_objects
+        if self._arb_objects is None:
+            self._arb_objects = frozenset[ArbitraryObject]().union(
+                *(state.arb_objects for state in self)
+            )
+        return self._arb_objects
 
     def __mul__(self, other: "SetOfStates") -> "SetOfStates":
         """
@@ -279,7 +387,11 @@ class SetOfStates(frozenset[State]):
 
         Γ ⨂ Δ = {γ∪δ : γ ∈ Γ, δ ∈ Δ}
         """
-        return SetOfStates({state1 | state2 for state1 in self for state2 in other})
+        states = SetOfStates({state1 | state2 for state1 in self for state2 in other})
+        if self and other:
+            # Every atom of either appears in some state of the product
+            return self._with_derived_union(other, states)
+        return states
 
     def negation(self):
         """
@@ -333,6 +445,46 @@ class SetOfStates(frozenset[State]):
         """
         return len(self.atoms.intersection(other.atoms))
 
+    def numeric_answer_potentials(
+        self, others: Iterable["SetOfStates"], weights: "Weights"
+    ) -> list[Optional[float]]:
+        """
+        Based on definition 5.8, p204
+
+        Evaluates Δ_g[Γ]^𝔼P directly as a number for each Γ, without building
+        terms. Δ is indexed once for all of them.
+
+        Args:
+            others (Iterable[SetOfStates]): Each Γ
+            weights (Weights): g
+
+        Returns:
+            list[Optional[float]]: The potential for each Γ, or None where a weight
+                of a state in Y holds a term that is not a number, such as an
+                arbitrary object, so the potential is only expressible as a term.
+        """
+        deltas = _AnswerStates(self)
+        return [deltas.numeric_potential(other, weights) for other in others]
+
+    def numeric_answer_potential(
+        self, other: "SetOfStates", weights: "Weights"
+    ) -> Optional[float]:
+        """
+        Based on definition 5.8, p204
+
+        Evaluates Δ_g[Γ]^𝔼P directly as a number, without building terms.
+
+        Args:
+            other (SetOfStates): Γ
+            weights (Weights): g
+
+        Returns:
+            Optional[float]: The potential, or None if a weight of a state in Y
+                holds a term that is not a number, such as an arbitrary object,
+                so the potential is only expressible as a term.
+        """
+        return _AnswerStates(self).numeric_potential(other, weights)
+
     def equilibrium_answer_potential(
         self, other: "SetOfStates", weights: "Weights"
     ) -> FunctionalTerm:
@@ -342,10 +494,12 @@ class SetOfStates(frozenset[State]):
         Δ_g[Γ]^𝔼P = σ(《σ(g(δ)) | δ ∈ Y》)
         Y = {δ ∈ Δ | ∃γ ∈ Γ.γ ⊆ δ}
         """
+        deltas = _AnswerStates(self)
+        num = deltas.numeric_potential(other, weights)
+        if num is not None:
+            return FunctionalTerm(f=RealNumber(num), t=())
         # Y = {δ ∈ Δ | ∃γ ∈ Γ.γ ⊆ δ}
-        Y = SetOfStates(
-            {delta for delta in self if any([gamma.issubset(delta) for gamma in other])}
-        )
+        Y = deltas.select(other)
         # 《σ(g(δ)) | δ ∈ Y》
         expr1: Multiset[Term] = reduce(
             lambda x, y: x + y,
@@ -377,32 +531,111 @@ class SetOfStates(frozenset[State]):
         Returns:
             SetOfStates: The new set of states.
         """
+        if not replacements:
+            return self
         return SetOfStates([s._replace_arbs(replacements) for s in self])
 
     @property
-    def atoms(self) -> set[Atom]:
+    def atoms(self) -> frozenset[Atom]:
         """
         Get the set of atoms in a state.
 
         Returns:
-            set[Atom]: The atoms in a state.
+            frozenset[Atom]: The atoms in a state.
         """
-        a: set[Atom] = set()
-        for state in self:
-            a |= state.atoms
-        return a
+        if self._atoms is None:
+            self._atoms = frozenset[Atom]().union(*self)
+        return self._atoms
 
     @property
-    def predicate_atoms(self) -> set[PredicateAtom]:
-        all_atoms = self.atoms
-        p_atoms: set[PredicateAtom] = set()
-        for a in all_atoms:
-            if isinstance(a, DoAtom):
-                p_atoms |= a.atoms
-            else:
-                assert isinstance(a, PredicateAtom)
-                p_atoms.add(a)
-        return p_atoms
+    def predicate_atoms(self) -> frozenset[PredicateAtom]:
+        if self._predicate_atoms is None:
+            p_atoms: set[PredicateAtom] = set()
+            for a in self.atoms:
+                if isinstance(a, DoAtom):
+                    p_atoms |= a.atoms
+                else:
+                    assert isinstance(a, PredicateAtom)
+                    p_atoms.add(a)
+            self._predicate_atoms = frozenset(p_atoms)
+        return self._predicate_atoms
+
+    def _containment_index(self) -> "_ContainmentIndex":
+        if self._index is None:
+            self._index = _ContainmentIndex(self)
+        return self._index
+
+    def subsets_of(self, state: State) -> list[State]:
+        """
+        {ψ ∈ Ψ : ψ ⊆ γ}
+
+        Args:
+            state (State): γ
+
+        Returns:
+            list[State]: The states of the set contained in γ.
+        """
+        return self._containment_index().subsets_of(state)
+
+    def has_subset_of(self, state: State) -> bool:
+        """
+        ∃ψ ∈ Ψ.ψ ⊆ γ
+
+        Args:
+            state (State): γ
+
+        Returns:
+            bool: True if some state of the set is contained in γ.
+        """
+        return self._containment_index().has_subset_of(state)
+
+    def supersets_of(self, state: State) -> list[State]:
+        """
+        {δ ∈ Δ : γ ⊆ δ}
+
+        Args:
+            state (State): γ
+
+        Returns:
+            list[State]: The states of the set that contain γ.
+        """
+        return self._containment_index().supersets_of(state)
+
+    def containment_join(self, other: "SetOfStates") -> list[tuple[State, State]]:
+        """
+        {<γ,ψ> : γ ∈ Γ, ψ ∈ Ψ, ψ ⊆ γ}
+
+        Each γ is only compared with the ψ that share an atom with it, found from
+        an index of the atoms of Ψ that is built once and kept with Ψ.
+
+        Args:
+            other (SetOfStates): Ψ
+
+        Returns:
+            list[tuple[State, State]]: The pairs of states, where the second is
+                contained in the first.
+        """
+        return [(gamma, psi) for gamma in self for psi in other.subsets_of(gamma)]
+
+    def without_primitive_absurd(
+        self, absurd_states: Optional[list[State]]
+    ) -> "SetOfStates":
+        """
+        The states that are not primitive absurd, as with State.is_primitive_absurd,
+        indexing the custom absurd states once for every state.
+
+        Args:
+            absurd_states (Optional[list[State]]): The custom absurd states.
+
+        Returns:
+            SetOfStates: The states that are not primitive absurd.
+        """
+        custom = SetOfStates(absurd_states or [])
+        return SetOfStates(
+            state
+            for state in self
+            if not (custom.has_subset_of(state) or state._breaks_absurdity_rules())
+        )
 
     def sorted_iter(self):
         return sorted(self, key=str)
@@ -415,3 +648,125 @@ class SetOfStates(frozenset[State]):
 
 Stage = SetOfStates
 Supposition = SetOfStates
+
+
+class _AnswerStates:
+    """
+    The states Δ of an equilibrium answer potential, from which Y is found for
+    many Γ through the containment index of Δ.
+    """
+
+    def __init__(self, deltas: SetOfStates) -> None:
+        self.deltas = deltas
+        # Y is kept in the order of Δ, so that its numbers are always added in
+        # the same order
+        self._order = {delta: i for i, delta in enumerate(deltas)}
+        # The numbers in the weight of each δ, as σ(g(δ)) would add them
+        self._numbers: dict[State, Optional[list[float]]] = {}
+
+    def select(self, other: SetOfStates) -> list[State]:
+        # Y = {δ ∈ Δ | ∃γ ∈ Γ.γ ⊆ δ}
+        if State() in other:
+            return list(self._order)
+        selected: set[State] = set()
+        for gamma in other:
+            selected.update(self.deltas.supersets_of(gamma))
+        return sorted(selected, key=self._order.__getitem__)
+
+    def _weight_numbers(
+        self, delta: State, weights: "Weights"
+    ) -> Optional[list[float]]:
+        if delta not in self._numbers:
+            weight = weights[delta]
+            multiplicative = _numbers(weight.multiplicative)
+            additive = _numbers(weight.additive)
+            if multiplicative is None or additive is None:
+                self._numbers[delta] = None
+            elif not multiplicative:
+                self._numbers[delta] = additive
+            elif not additive:
+                self._numbers[delta] = multiplicative
+            else:
+                self._numbers[delta] = [
+                    multi_func_new(m, a) for m in multiplicative for a in additive
+                ]
+        return self._numbers[delta]
+
+    def numeric_potential(
+        self, other: SetOfStates, weights: "Weights"
+    ) -> Optional[float]:
+        # 《σ(g(δ)) | δ ∈ Y》
+        nums: list[float] = []
+        for delta in self.select(other):
+            weight_nums = self._weight_numbers(delta, weights)
+            if weight_nums is None:
+                return None
+            nums += weight_nums
+        # σ(EXPR1)
+        return sum_func_new(*nums)
+
+
+class _ContainmentIndex:
+    """
+    The states of a set of states indexed by atom, to find those contained in or
+    containing a given state without comparing it with each of them.
+    """
+
+    # Below this many states, comparing with each is quicker than the index
+    scan_below = 8
+
+    def __init__(self, states: Iterable[State]) -> None:
+        self.states = list(states)
+        self.scan = len(self.states) < self.scan_below
+        self.empty = [i for i, state in enumerate(self.states) if not state]
+        self.by_atom: dict[Atom, list[int]] = {}
+        if not self.scan:
+            for i, state in enumerate(self.states):
+                for atom in state:
+                    if atom in self.by_atom:
+                        self.by_atom[atom].append(i)
+                    else:
+                        self.by_atom[atom] = [i]
+
+    def _atom_counts(self, state: State) -> dict[int, int]:
+        # The number of atoms each indexed state shares with the state
+        counts: dict[int, int] = {}
+        for atom in state:
+            if atom in self.by_atom:
+                for i in self.by_atom[atom]:
+                    counts[i] = counts.get(i, 0) + 1
+        return counts
+
+    def subsets_of(self, state: State) -> list[State]:
+        if self.scan:
+            return [s for s in self.states if s.issubset(state)]
+        counts = self._atom_counts(state)
+        contained = [i for i, count in counts.items() if count == len(self.states[i])]
+        return [self.states[i] for i in sorted(self.empty + contained)]
+
+    def has_subset_of(self, state: State) -> bool:
+        if self.scan:
+            return any(s.issubset(state) for s in self.states)
+        if self.empty:
+            return True
+        counts: dict[int, int] = {}
+        for atom in state:
+            if atom in self.by_atom:
+                for i in self.by_atom[atom]:
+                    count = counts.get(i, 0) + 1
+                    if count == len(self.states[i]):
+                        return True
+                    counts[i] = count
+        return False
+
+    def supersets_of(self, state: State) -> list[State]:
+        if self.scan or not state:
+            return [s for s in self.states if state.issubset(s)]
+        postings: list[list[int]] = []
+        for atom in state:
+            if atom not in self.by_atom:
+                return []
+            postings.append(self.by_atom[atom])
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return [self.states[i] for i in sorted(candidates)]
@@ -3,7 +3,15 @@ __all__ = ["ArbitraryObjectGenerator"]
 import typing
 from abc import ABCMeta, abstractmethod
 from enum import Enum
-from typing import TYPE_CHECKING, Callable, Iterable, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+)
 
 from pyetr.atoms.predicate import Predicate
 from pyetr.atoms.terms.function import Function
@@ -31,7 +39,7 @@ class _BaseNameGen(metaclass=ABCMeta):
     """
 
     @abstractmethod
-    def __init__(self, arb_objs: set[ArbitraryObject]) -> None:
+    def __init__(self, arb_objs: AbstractSet[ArbitraryObject]) -> None:
         super().__init__()
 
     @abstractmethod
@@ -39,19 +47,19 @@ class _BaseNameGen(metaclass=ABCMeta):
 
 
 class _AlphabetGenerator(_BaseNameGen):
-    names: list[str]
+    names: set[str]
     current_letter: str
 
-    def __init__(self, arb_objs: set[ArbitraryObject]) -> None:
+    def __init__(self, arb_objs: AbstractSet[ArbitraryObject]) -> None:
         """
         A Generator used to generate arbitrary objects based on the letters of the alphabet
 
         Args:
-            arb_objs (set[ArbitraryObject]): The set of existing arbitrary objects to prevent
+            arb_objs (AbstractSet[ArbitraryObject]): The set of existing arbitrary objects to prevent
                 name clashes.
 
         """
-        self.names = [a.name for a in arb_objs]
+        self.names = {a.name for a in arb_objs}
         self.current_letter = ""
 
     @staticmethod
@@ -77,11 +85,11 @@ class _AlphabetGenerator(_BaseNameGen):
 
 
 class ArbitraryObjectGenerator:
-    gen: _BaseNameGen
+    _gen: Optional[_BaseNameGen]
 
     def __init__(
         self,
-        existing_arb_objs: set[ArbitraryObject],
+        existing_arb_objs: AbstractSet[ArbitraryObject],
         *,
         scheme: NameScheme = NameScheme.alphabet,
     ) -> None:
@@ -90,46 +98,58 @@ class ArbitraryObjectGenerator:
         new arbitrary objects.
 
         Args:
-            existing_arb_objs (set[ArbitraryObject]): The existing arbitrary objects, to exclude
+            existing_arb_objs (AbstractSet[ArbitraryObject]): The existing arbitrary objects, to exclude
                 them from generation.
             scheme (NameScheme, optional): The naming scheme set for generation. Defaults to NameScheme.alphabet.
         """
         self.i = 0
         self.scheme = scheme
-        if scheme == NameScheme.alphabet:
-            self.gen = _AlphabetGenerator(existing_arb_objs)
-        else:
-            assert False
+        self._existing_arb_objs = existing_arb_objs
+        # Built on the first draw, as many generators never draw an object
+        self._gen = None
+
+    @property
+    def gen(self) -> _BaseNameGen:
+        if self._gen is None:
+            if self.scheme == NameScheme.alphabet:
+                self._gen = _AlphabetGenerator(self._existing_arb_objs)
+            else:
+                assert False
+        return self._gen
 
     def _get_arb_obj(self) -> ArbitraryObject:
         return ArbitraryObject(name=next(self.gen))
 
     def redraw(
-        self, arb_objects: set[ArbitraryObject]
+        self, arb_objects: AbstractSet[ArbitraryObject]
     ) -> dict[ArbitraryObject, ArbitraryObject]:
         """
         Redraw the arbitrary objects provided and produce a mapping for
             their replacements.
 
         Args:
-            arb_objects (set[ArbitraryObject]): The arbitrary objects for replacement.
+            arb_objects (AbstractSet[ArbitraryObject]): The arbitrary objects for replacement.
 
         Returns:
             dict[ArbitraryObject, ArbitraryObject]: The resultant mapping.
         """
         return {arb_obj: self._get_arb_obj() for arb_obj in arb_objects}
 
-    def novelise(self, arb_objects: set[ArbitraryObject], view: "View") -> "View":
+    def novelise(
+        self, arb_objects: AbstractSet[ArbitraryObject], view: "View"
+    ) -> "View":
         """
         Redraw specified arbitrary objects within a view.
 
         Args:
-            arb_objects (set[ArbitraryObject]): The arbitrary objects to replace.
+            arb_objects (AbstractSet[ArbitraryObject]): The arbitrary objects to replace.
             view (View): The current view
 
         Returns:
             View: The new view with arbitrary objects replaced.
         """
+        if not arb_objects:
+            return view
         return view._replace_arbs(
             typing.cast(dict[ArbitraryObject, Term], self.redraw(arb_objects))
         )
@@ -150,21 +170,20 @@ class ArbitraryObjectGenerator:
 IterType = TypeVar("IterType")
 
 
-def powerset(iterable: Iterable[IterType]) -> list[set[IterType]]:
+def powerset(iterable: Iterable[IterType]) -> Iterator[set[IterType]]:
     """
-    Return the powerset of the given iterable
+    Lazily generates the powerset of the given iterable, from the smallest
+    subsets to the largest.
 
     Args:
         iterable (Iterable[IterType]): The input iterable
 
     Returns:
-        list[set[IterType]: The powersets of the iterable.
+        Iterator[set[IterType]]: The subsets of the iterable.
     """
     s = list(iterable)
-    return [
-        set(i)
-        for i in (chain.from_iterable(combinations(s, r) for r in range(len(s) + 1)))
-    ]
+    for subset in chain.from_iterable(combinations(s, r) for r in range(len(s) + 1)):
+        yield set(subset)
 
 
 MatchCallback = Callable[
@@ -0,0 +1,268 @@
+__all__ = [
+    "TraceEvent",
+    "add_listener",
+    "remove_listener",
+    "tracing",
+    "traced_operator",
+    "OperatorProfile",
+]
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Literal, NamedTuple, Optional
+
+if TYPE_CHECKING:  # pragma: not covered
+    from .view import View
+
+
+class TraceEvent(NamedTuple):
+    """
+    Emitted at the start and end of each View operator call. A call that raises
+    ends with an error event instead of an end event.
+    """
+
+    phase: Literal["start", "end", "error"]
+    operator: str
+    # The number of operator calls this call is nested in
+    depth: int
+    time: float
+    # The seconds the call took, at the end
+    elapsed: Optional[float]
+    stage_size: int
+    arb_objects: int
+    # The stage size of the view the operator was given, if any
+    other_stage_size: Optional[int]
+    output_stage_size: Optional[int]
+    output_arb_objects: Optional[int]
+    # The exception the call raised, for an error event
+    error: Optional[BaseException]
+
+
+Listener = Callable[[TraceEvent], None]
+
+# Listeners added for every thread and task, and those of the current scope
+_listeners: tuple[Listener, ...] = ()
+_scoped: ContextVar[tuple[Listener, ...]] = ContextVar("trace_listeners", default=())
+_lock = threading.Lock()
+_depth: ContextVar[int] = ContextVar("trace_depth", default=0)
+
+
+def add_listener(listener: Listener) -> None:
+    """
+    Calls the listener with the events of every View operator call from now on,
+    in any thread or task.
+
+    Args:
+        listener (Listener): The listener
+    """
+    global _listeners
+    with _lock:
+        _listeners = (*_listeners, listener)
+
+
+def remove_listener(listener: Listener) -> None:
+    """
+    Stops calling the listener.
+
+    Args:
+        listener (Listener): A listener previously added
+
+    Raises:
+        ValueError: The listener was not added
+    """
+    global _listeners
+    with _lock:
+        if listener not in _listeners:
+            raise ValueError(f"{listener} is not a listener")
+        listeners = list(_listeners)
+        listeners.remove(listener)
+        _listeners = tuple(listeners)
+
+
+@contextmanager
+def tracing(listener: Listener) -> Iterator[Listener]:
+    """
+    Calls the listener with the events of View operator calls made within the
+    scope. Calls made by other threads and tasks are not included, except for
+    those started within the scope, which copy its context, such as tasks and
+    asyncio.to_thread.
+
+    Args:
+        listener (Listener): The listener
+
+    Returns:
+        Iterator[Listener]: The listener
+    """
+    reset = _scoped.set((*_scoped.get(), listener))
+    try:
+        yield listener
+    finally:
+        _scoped.reset(reset)
+
+
+def _emit(listeners: tuple[Listener, ...], event: TraceEvent) -> None:
+    for listener in listeners:
+        listener(event)
+
+
+F = Callable[..., "View"]
+
+
+def traced_operator(func: F) -> F:
+    """
+    Decorates a View operator so that, while any listener is added, each call
+    emits a start event, and an end event or, if the operator raises, an error
+    event. Without listeners, the operator is called directly.
+
+    Args:
+        func (F): The operator
+
+    Returns:
+        F: The traced operator
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(self: "View", *args: Any, **kwargs: Any) -> "View":
+        listeners = _listeners + _scoped.get()
+        if not listeners:
+            return func(self, *args, **kwargs)
+        depth = _depth.get()
+        other = args[0] if args else kwargs.get("view", kwargs.get("other"))
+        other_stage_size = len(other.stage) if isinstance(other, type(self)) else None
+        start = time.perf_counter()
+        _emit(
+            listeners,
+            TraceEvent(
+                phase="start",
+                operator=name,
+                depth=depth,
+                time=start,
+                elapsed=None,
+                stage_size=len(self.stage),
+                arb_objects=len(self.stage_supp_arb_objects),
+                other_stage_size=other_stage_size,
+                output_stage_size=None,
+                output_arb_objects=None,
+                error=None,
+            ),
+        )
+        out: Optional["View"] = None
+        error: Optional[BaseException] = None
+        reset = _depth.set(depth + 1)
+        try:
+            out = func(self, *args, **kwargs)
+            return out
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _depth.reset(reset)
+            end = time.perf_counter()
+            _emit(
+                listeners,
+                TraceEvent(
+                    phase="end" if error is None else "error",
+                    operator=name,
+                    depth=depth,
+                    time=end,
+                    elapsed=end - start,
+                    stage_size=len(self.stage),
+                    arb_objects=len(self.stage_supp_arb_objects),
+                    other_stage_size=other_stage_size,
+                    output_stage_size=None if out is None else len(out.stage),
+                    output_arb_objects=(
+                        None if out is None else len(out.stage_supp_arb_objects)
+                    ),
+                    error=error,
+                ),
+            )
+
+    return wrapper
+
+
+class _Totals:
+    __slots__ = ("calls", "total", "own")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total = 0.0
+        self.own = 0.0
+
+
+class OperatorProfile:
+    """
+    A listener that totals the time spent in each operator, split by the chain
+    of operator calls it was made within.
+    """
+
+    def __init__(self) -> None:
+        self._totals: dict[tuple[str, ...], _Totals] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> list[list[Any]]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def __call__(self, event: TraceEvent) -> None:
+        stack = self._stack()
+        if event.phase == "start":
+            # name, time spent in nested calls
+            stack.append([event.operator, 0.0])
+            return
+        # An end or error event, either of which closes the call
+        _, nested = stack.pop()
+        assert event.elapsed is not None
+        path = tuple([frame[0] for frame in stack]) + (event.operator,)
+        if stack:
+            stack[-1][1] += event.elapsed
+        with self._lock:
+            totals = self._totals.setdefault(path, _Totals())
+            totals.calls += 1
+            totals.total += event.elapsed
+            totals.own += event.elapsed - nested
+
+    def clear(self) -> None:
+        """
+        Discards the totals so far.
+        """
+        with self._lock:
+            self._totals.clear()
+
+    def folded(self) -> str:
+        """
+        Returns:
+            str: One line per chain of calls, of the operator names separated by
+                semicolons and the microseconds spent in the last, excluding nested
+                calls. This is the input format of flame graph tools.
+        """
+        with self._lock:
+            return "\n".join(
+                f"{';'.join(path)} {round(totals.own * 1e6)}"
+                for path, totals in sorted(self._totals.items())
+            )
+
+    def summary(self) -> str:
+        """
+        Returns:
+            str: A table of each chain of calls, indented by depth, with the
+                number of calls, the total milliseconds and the milliseconds
+                excluding nested calls.
+        """
+        lines = [f"{'operator':<40} {'calls':>8} {'total ms':>12} {'own ms':>12}"]
+        with self._lock:
+            for path, totals in sorted(self._totals.items()):
+                label = "  " * (len(path) - 1) + path[-1]
+                lines.append(
+                    f"{label:<40} {totals.calls:>8} "
+                    f"{totals.total * 1e3:>12.3f} {totals.own * 1e3:>12.3f}"
+                )
+        return "\n".join(lines)
+
+    def print_summary(self) -> None:
+        print(self.summary())
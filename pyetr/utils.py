@@ -1,9 +1,19 @@
-__all__ = ["smt_lib_to_views", "views_to_smt_lib"]
+__all__ = ["smt_lib_to_views", "views_to_smt_lib", "SmtLibContext"]
 
-from typing import Optional
+from typing import Iterable, Iterator, Optional, TextIO
+
+from pysmt.environment import Environment
+from pysmt.fnode import FNode
+from pysmt.smtlib.parser import SmtLibParser
 
 from pyetr.atoms.terms.function import Function, NumFunc
-from pyetr.parsing.smt_lib_parser.view_to_smt_lib import views_to_smt_lib
+from pyetr.parsing.smt_lib_parser.smt_lib_to_view import smt_lib_to_smts
+from pyetr.parsing.smt_lib_parser.view_to_smt_lib import (
+    smts_to_smt_lib,
+    views_to_smt_lib,
+)
+from pyetr.parsing.smt_parser import smt_to_view
+from pyetr.parsing.smt_parser.unparse_smt import view_to_smt
 
 from .parsing.smt_lib_parser import smt_lib_to_view_stores
 from .view import View
@@ -29,3 +39,99 @@ def smt_lib_to_views(
         View._from_view_storage(i)
         for i in smt_lib_to_view_stores(smt_lib, custom_functions)
     ]
+
+
+class SmtLibContext:
+    """
+    Converts many views to and from pysmt and SMT Lib form in one pysmt
+    environment, so that the sort, the symbols and the parser are made once and
+    shared, rather than made again for each view.
+
+    As the symbols are shared, each predicate and function must be used with the
+    same arity in every view converted with the context.
+    """
+
+    def __init__(
+        self,
+        env: Optional[Environment] = None,
+        custom_functions: Optional[list[NumFunc | Function]] = None,
+    ) -> None:
+        """
+        Args:
+            env (Optional[Environment], optional): The pysmt environment to embed
+                parsed variables. If None will use a fresh environment. Defaults to
+                None.
+            custom_functions (Optional[list[NumFunc | Function]], optional): Custom
+                functions used in parsed views. It assumes the name of the function
+                is that used in the string. Useful for using func callers. Defaults
+                to None.
+        """
+        if env is None:
+            env = Environment()
+        self.env = env
+        self.custom_functions = custom_functions
+        self._parser = SmtLibParser(env)
+
+    def to_smt(self, v: View) -> FNode:
+        """
+        Parses from View form to first order logic pysmt form.
+
+        Args:
+            v (View): The view
+
+        Returns:
+            FNode: The pysmt formula
+        """
+        return view_to_smt(v, self.env)
+
+    def from_smt(self, fnode: FNode) -> View:
+        """
+        Parses from first order logic pysmt form to View form.
+
+        Args:
+            fnode (FNode): The pysmt formula
+
+        Returns:
+            View: The parsed view
+        """
+        return View._from_view_storage(smt_to_view(fnode, self.custom_functions))
+
+    def to_smt_lib(self, views: Iterable[View]) -> str:
+        """
+        Parses views to a single SMT Lib script, declaring the sort and each symbol
+        used once, followed by an assertion for each view.
+
+        Args:
+            views (Iterable[View]): The views
+
+        Returns:
+            str: The SMT Lib script
+        """
+        return smts_to_smt_lib([self.to_smt(v) for v in views], self.env, True)
+
+    def iter_smt_lib(self, smt_lib: str | TextIO) -> Iterator[View]:
+        """
+        Parses the assertion of each view in an SMT Lib script, in a single pass
+        as the script is read. Symbols declared by earlier scripts read with the
+        context may be used without being declared again.
+
+        Args:
+            smt_lib (str | TextIO): The script, or a file to read it from
+
+        Returns:
+            Iterator[View]: The view of each assertion, in order
+        """
+        for formula in smt_lib_to_smts(smt_lib, self._parser):
+            yield self.from_smt(formula)
+
+    def from_smt_lib(self, smt_lib: str | TextIO) -> list[View]:
+        """
+        Parses the assertion of each view in an SMT Lib script.
+
+        Args:
+            smt_lib (str | TextIO): The script, or a file to read it from
+
+        Returns:
+            list[View]: The view of each assertion, in order
+        """
+        return list(self.iter_smt_lib(smt_lib))
@@ -0,0 +1,152 @@
+__all__ = [
+    "ValidationLevel",
+    "set_validation_level",
+    "get_validation_level",
+    "validation_level",
+    "enable_validation_debug",
+    "disable_validation_debug",
+    "validation_debug_enabled",
+    "current_validation_level",
+    "validated_operator",
+]
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from functools import wraps
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+
+class ValidationLevel(Enum):
+    """
+    How thoroughly a View or DependencyRelation is checked when built.
+    """
+
+    # No checks
+    OFF = "off"
+    # The dependency relation is checked against itself, and the weights against
+    # the stage, but nothing requiring a walk over every atom
+    CHEAP = "cheap"
+    # Every check, including the arbitrary objects and issues of the states
+    FULL = "full"
+
+
+_operator_level: ValidationLevel = ValidationLevel.CHEAP
+_debug: bool = False
+_scope_level: ContextVar[Optional[ValidationLevel]] = ContextVar(
+    "validation_level", default=None
+)
+_in_operator: ContextVar[bool] = ContextVar("in_operator", default=False)
+
+
+def set_validation_level(level: ValidationLevel) -> None:
+    """
+    Sets the level used for views built by View operators. Views built outside
+    of operators, such as by parsing, are always fully checked.
+
+    Args:
+        level (ValidationLevel): The level, CHEAP by default.
+    """
+    global _operator_level
+    _operator_level = level
+
+
+def get_validation_level() -> ValidationLevel:
+    """
+    Returns:
+        ValidationLevel: The level used for views built by View operators.
+    """
+    return _operator_level
+
+
+@contextmanager
+def validation_level(level: ValidationLevel) -> Iterator[ValidationLevel]:
+    """
+    Uses the level for every view built within the scope, whether by operators
+    or not. OFF suits pipelines whose inputs are already known to be valid.
+
+    Args:
+        level (ValidationLevel): The level
+
+    Returns:
+        Iterator[ValidationLevel]: The level
+    """
+    reset = _scope_level.set(level)
+    try:
+        yield level
+    finally:
+        _scope_level.reset(reset)
+
+
+def enable_validation_debug() -> None:
+    """
+    Fully checks every view built from now on, whatever level is set, so that
+    operators can be checked to preserve the invariants of views.
+    """
+    global _debug
+    _debug = True
+
+
+def disable_validation_debug() -> None:
+    """
+    Returns to checking views at the levels set.
+    """
+    global _debug
+    _debug = False
+
+
+def validation_debug_enabled() -> bool:
+    """
+    Returns:
+        bool: True if every view built is fully checked.
+    """
+    return _debug
+
+
+def current_validation_level(
+    level: Optional[ValidationLevel] = None,
+) -> ValidationLevel:
+    """
+    Args:
+        level (Optional[ValidationLevel], optional): A level requested for a single
+            view, used unless in debug mode. Defaults to None.
+
+    Returns:
+        ValidationLevel: The level to check a view built here at.
+    """
+    if _debug:
+        return ValidationLevel.FULL
+    if level is not None:
+        return level
+    scope_level = _scope_level.get()
+    if scope_level is not None:
+        return scope_level
+    if _in_operator.get():
+        return _operator_level
+    return ValidationLevel.FULL
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def validated_operator(func: F) -> F:
+    """
+    Decorates a View operator so that the views it builds are checked at the
+    level set by set_validation_level.
+
+    Args:
+        func (F): The operator
+
+    Returns:
+        F: The decorated operator
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        reset = _in_operator.set(True)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _in_operator.reset(reset)
+
+    return wrapper  # pyright: ignore
@@ -1,8 +1,18 @@
 __all__ = ["View"]
 
 from functools import reduce
-from itertools import permutations
-from typing import TYPE_CHECKING, Callable, Optional, Self, Unpack, cast, overload
+from itertools import chain
+from math import prod
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Self,
+    Unpack,
+    overload,
+)
 
 from pysmt.environment import Environment
 from pysmt.fnode import FNode
@@ -14,21 +24,37 @@ from pyetr.atoms.terms.abstract_term import AbstractArbitraryObject
 from pyetr.atoms.terms.function import Function, NumFunc
 from pyetr.atoms.terms.open_term import OpenArbitraryObject, QuestionMark
 from pyetr.exceptions import OperationUndefinedError
+from pyetr.parsing.binary_parser import (
+    bytes_to_view,
+    bytes_to_views,
+    view_to_bytes,
+    views_to_bytes,
+)
 from pyetr.parsing.common import get_quantifiers
 from pyetr.parsing.data_parser import json_to_view, view_to_json
 from pyetr.parsing.english_parser import view_to_english
 from pyetr.parsing.fol_parser import fol_to_view, view_to_fol
 from pyetr.parsing.smt_lib_parser import smt_lib_to_view, view_to_smt_lib
 from pyetr.parsing.smt_parser import smt_to_view, view_to_smt
-from pyetr.parsing.string_parser import StringConversion, string_to_view, view_to_string
+from pyetr.parsing.string_parser import (
+    StringConversion,
+    string_to_view,
+    string_to_views,
+    view_to_string,
+)
 from pyetr.parsing.view_storage import ViewStorage
 
 from .atoms import PredicateAtom, equals_predicate
 from .atoms.terms import ArbitraryObject, FunctionalTerm, RealNumber, Term
+from .caching import cached_operator
+from .cancellation import cancellable_operator
+from .canonical import CanonicalKey, canonical_key
 from .dependency import Dependency, DependencyRelation
 from .issues import IssueStructure
 from .stateset import SetOfStates, Stage, State, Supposition
-from .tools import ArbitraryObjectGenerator, powerset
+from .tools import ArbitraryObjectGenerator
+from .tracing import traced_operator
+from .validation import ValidationLevel, current_validation_level, validated_operator
 from .weight import Weight, Weights
 
 if TYPE_CHECKING:  # pragma: not covered
@@ -48,13 +74,12 @@ def get_subset(big_gamma: SetOfStates, big_psi: SetOfStates) -> SetOfStates:
     Returns:
         SetOfStates: The subset of states that satisfy this.
     """
-    out_set: set[State] = set()
-    for gamma in big_gamma:
-        for psi in big_psi:
-            # .ψ⊆γ
-            if psi.issubset(gamma):
-                out_set.add(gamma)
-    return SetOfStates(out_set)
+    return SetOfStates(
+        # ∃ψ ∈ Ψ.ψ⊆γ
+        gamma
+        for gamma in big_gamma
+        if big_psi.has_subset_of(gamma)
+    )
 
 
 Existential = ArbitraryObject
@@ -74,17 +99,36 @@ def stage_function_product(
     big_gamma, f_gamma = stage_supposition_external
     stage_internal, big_psi, g_delta = stage_supposition_internal
 
-    gamma_new = get_subset(big_gamma, big_psi)
-    P = big_gamma.difference(gamma_new)
-    P_weights = f_gamma.in_set_of_states(P)
-
-    # f(γ).(γ∪δ)
-    f_gamma_new = f_gamma.in_set_of_states(gamma_new)
-
-    result_stage = P | (gamma_new * stage_internal)
-    final_weights = P_weights + (f_gamma_new * g_delta)
+    # P = {γ∈Γ |¬∃ψ ∈ Ψ.ψ⊆γ}, the rest being Γ＼P
+    P: list[State] = []
+    gamma_new: list[State] = []
+    for gamma in big_gamma:
+        if big_psi.has_subset_of(gamma):
+            gamma_new.append(gamma)
+        else:
+            P.append(gamma)
 
-    return result_stage, final_weights
+    if f_gamma.is_null_weights and g_delta.is_null_weights:
+        # Products of null weights are null, so only the states are needed
+        result_stage = SetOfStates(
+            {gamma | delta for gamma in gamma_new for delta in stage_internal}.union(P)
+        )
+        return result_stage, Weights.get_null_weights(result_stage)
+
+    # P + Σ_γ∈(Γ＼P) Σ_δ∈Δ {f(γ) x g(δ)).(γ∪δ)}, adding weights of repeated states
+    # as they are collected
+    internal = [(delta, g_delta[delta]) for delta in stage_internal]
+    final_weights = Weights.from_weighted_states(
+        chain(
+            ((gamma, f_gamma[gamma]) for gamma in P),
+            (
+                (gamma | delta, f_gamma[gamma] * g)
+                for gamma in gamma_new
+                for delta, g in internal
+            ),
+        )
+    )
+    return SetOfStates(final_weights.keys()), final_weights
 
 
 def Z(T: DependencyRelation, a: ArbitraryObject) -> set[ArbitraryObject]:
@@ -152,26 +196,24 @@ def substitution(
         dep_relation._replace_arbs(subs).restriction(set(subs.values()))
     )
 
+    # [ν₁]_Z(T,a) [t/a] as a single replacement
+    replacements: dict[ArbitraryObject, Term] = {
+        old: term if new == arb_obj else new for old, new in subs.items()
+    }
+    replacements[arb_obj] = term
+
     new_weights = Weights()
     for state in stage:
         # Γ[ν₁]_Z(T,a) [t/a]
-        new_state = state._replace_arbs(
-            cast(dict[ArbitraryObject, Term], subs)
-        )._replace_arbs({arb_obj: term})
+        new_state = state._replace_arbs(replacements)
         # f[ν₁]_Z(T,a) [t/a]
-        new_weight = (
-            weights[state]
-            ._replace_arbs(cast(dict[ArbitraryObject, Term], subs))
-            ._replace_arbs({arb_obj: term})
-        )
+        new_weight = weights[state]._replace_arbs(replacements)
         new_weights.adding(new_state, new_weight)
 
     new_stage = SetOfStates(new_weights.keys())
 
     # I[ν₁]_Z(T,a) [t/a]
-    new_issue_structure = issue_structure._replace_arbs(
-        cast(dict[ArbitraryObject, Term], subs)
-    )._replace_arbs({arb_obj: term})
+    new_issue_structure = issue_structure._replace_arbs(replacements)
 
     # The following restriction is in the book but should not have been
     # T_prime = T_prime.restriction(new_stage.arb_objects | supposition.arb_objects)
@@ -203,17 +245,12 @@ def division_presupposition(
         bool: True if the presupposition is satisfied
     """
 
-    def division_cond(delta: State) -> bool:
-        """
-        ∃ψ_∈Ψ ∃γ∈Γ (δ ⊆ γ ∧ ψ ⊆ γ)
-        """
-        return any(
-            delta.issubset(gamma) and psi.issubset(gamma)
-            for psi in other_supposition
-            for gamma in self_stage
-        )
-
-    return all(division_cond(delta) for delta in other_stage)
+    # {δ ∈ Δ : ∃ψ_∈Ψ ∃γ∈Γ (δ ⊆ γ ∧ ψ ⊆ γ)}, found from the γ with some ψ ⊆ γ
+    divisible: set[State] = set()
+    for gamma in self_stage:
+        if other_supposition.has_subset_of(gamma):
+            divisible.update(other_stage.subsets_of(gamma))
+    return all(delta in divisible for delta in other_stage)
 
 
 def state_division(
@@ -221,6 +258,7 @@ def state_division(
     self_stage: Stage,
     other_stage: Stage,
     other_supposition: Supposition,
+    presupposition: Optional[bool] = None,
 ) -> State:
     """
     Based on definition 4.38, p168
@@ -236,26 +274,28 @@ def state_division(
         self_stage (Stage): Γ
         other_stage (Stage): Δ
         other_supposition (Supposition): Ψ
+        presupposition (Optional[bool], optional): The result of the division
+            presupposition for Γ, Δ and Ψ, if already known. Defaults to None,
+            in which case it is computed.
 
     Returns:
         State: The divided state.
     """
-    if division_presupposition(
-        self_stage=self_stage,
-        other_stage=other_stage,
-        other_supposition=other_supposition,
-    ):
+    if presupposition is None:
+        presupposition = division_presupposition(
+            self_stage=self_stage,
+            other_stage=other_stage,
+            other_supposition=other_supposition,
+        )
+    if presupposition:
         # γ – ıδ(δ ∈ Δ ∧ δ ⊆ γ ∧ ∃ψ_∈Ψ (ψ ⊆ γ))
 
         # ıδ(δ ∈ Δ ∧ δ ⊆ γ ∧ ∃ψ_∈Ψ (ψ ⊆ γ))
-        delta_that_meet_cond: list[State] = []
-        # δ ∈ Δ
-        for delta in other_stage:
-            # δ ⊆ γ ∧ ∃ψ_∈Ψ (ψ ⊆ γ)
-            if delta.issubset(state) and any(
-                psi.issubset(state) for psi in other_supposition
-            ):
-                delta_that_meet_cond.append(delta)
+        # ∃ψ_∈Ψ (ψ ⊆ γ) does not depend on δ
+        if not other_supposition.has_subset_of(state):
+            return state
+        # δ ∈ Δ ∧ δ ⊆ γ
+        delta_that_meet_cond = other_stage.subsets_of(state)
 
         if len(delta_that_meet_cond) == 1:
             return state - delta_that_meet_cond[0]
@@ -265,6 +305,102 @@ def state_division(
         return state
 
 
+def _substitution_options(
+    m_prime: set[tuple[Term, ArbitraryObject]]
+) -> dict[ArbitraryObject, list[Term]]:
+    """
+    Groups M'ij by existential, so that an injective choice of pairs from M'ij
+    is a choice of at most one term for each existential.
+
+    Args:
+        m_prime (set[tuple[Term, ArbitraryObject]]): M'ij
+
+    Returns:
+        dict[ArbitraryObject, list[Term]]: The terms that may replace each existential.
+    """
+    options: dict[ArbitraryObject, list[Term]] = {}
+    for t, e in m_prime:
+        options.setdefault(e, []).append(t)
+    return options
+
+
+def _substitutions(
+    delta: State,
+    gamma: State,
+    exis: list[ArbitraryObject],
+    options: dict[ArbitraryObject, list[Term]],
+) -> Iterator[dict[ArbitraryObject, Term]]:
+    """
+    Lazily enumerates the substitutions [t₁/e₁,...,tₙ/eₙ] replacing each of exis
+    with at most one of its terms, such that δ[t₁/e₁,...,tₙ/eₙ] ⊆ γ. Each atom of δ
+    is checked as soon as all of its existentials in exis are decided, so that a
+    partial substitution that cannot succeed is abandoned.
+
+    Args:
+        delta (State): δ
+        gamma (State): γ
+        exis (list[ArbitraryObject]): The existentials to decide, in order.
+        options (dict[ArbitraryObject, list[Term]]): The terms that may replace
+            each existential.
+
+    Returns:
+        Iterator[dict[ArbitraryObject, Term]]: The substitutions.
+    """
+    position = {e: i for i, e in enumerate(exis)}
+    # checks[i] holds the atoms decided once the first i existentials are
+    checks: list[list[Atom]] = [[] for _ in range(len(exis) + 1)]
+    for atom in delta:
+        depth = max(
+            (position[e] + 1 for e in atom.arb_objects if e in position), default=0
+        )
+        checks[depth].append(atom)
+    if not all(atom in gamma for atom in checks[0]):
+        return
+    replacements: dict[ArbitraryObject, Term] = {}
+
+    def search(i: int) -> Iterator[dict[ArbitraryObject, Term]]:
+        if i == len(exis):
+            yield dict(replacements)
+            return
+        e = exis[i]
+        for t in [None, *options[e]]:
+            if t is None:
+                replacements.pop(e, None)
+            else:
+                replacements[e] = t
+            if all(atom._replace_arbs(replacements) in gamma for atom in checks[i + 1]):
+                yield from search(i + 1)
+        replacements.pop(e, None)
+
+    yield from search(0)
+
+
+def _ordered_exis(
+    options: dict[ArbitraryObject, list[Term]],
+    delta: State,
+    delta_weight: Optional[Weight],
+) -> list[ArbitraryObject]:
+    """
+    The existentials of M'ij that a substitution into δ and g(δ) depends on, with
+    those in δ first so that the search in _substitutions prunes early.
+
+    Args:
+        options (dict[ArbitraryObject, list[Term]]): The terms that may replace
+            each existential.
+        delta (State): δ
+        delta_weight (Optional[Weight]): g(δ), or None if it is not substituted.
+
+    Returns:
+        list[ArbitraryObject]: The existentials to decide, in order.
+    """
+    delta_arbs = delta.arb_objects
+    exis = [e for e in options if e in delta_arbs]
+    if delta_weight is not None:
+        weight_arbs = delta_weight.arb_objects
+        exis += [e for e in options if e in weight_arbs and e not in delta_arbs]
+    return exis
+
+
 def phi(
     gamma: State,
     delta: State,
@@ -289,32 +425,22 @@ def phi(
     Returns:
         bool: Φ(γ, δ)
     """
-    # ∃n≥0
-    for m_prime_set in powerset(m_prime):
-        # ∃ψ_∈Ψ
-        for psi in other_supposition:
-            # ∃<t₁,e₁>,...,<tₙ,eₙ>∈M'ij
-            exis = [e for _, e in m_prime_set]
-            # (∀i,j.e_i = e_j -> i=j)
-            first_cond = len(exis) == len(set(exis))
-
-            # [t₁/e₁,...,tₙ/eₙ]
-            replacements: dict[ArbitraryObject, Term] = {e: t for t, e in m_prime_set}
-            # δ[t₁/e₁,...,tₙ/eₙ]
-            delta_new = delta._replace_arbs(replacements)
-            # ψ∪δ[t₁/e₁,...,tₙ/eₙ]
-            x = psi | delta_new
-            # (ψ∪δ[t₁/e₁,...,tₙ/eₙ] ⊆ γ)
-            second_cond = x.issubset(gamma)
-
-            # (f(γ) = g(δ)[t₁/e₁,...] ∨ g(δ) =《》)
-            third_cond = (
-                delta_weight.is_null
-                or delta_weight._replace_arbs(replacements) == gamma_weight
-            )
-
-            if first_cond and second_cond and third_cond:
-                return True
+    # ∃ψ_∈Ψ.ψ ⊆ γ does not depend on the substitution, so is checked once
+    if not other_supposition.has_subset_of(gamma):
+        return False
+    # ∃n≥0 ∃<t₁,e₁>,...,<tₙ,eₙ>∈M'ij (∀i,j.e_i = e_j -> i=j), choosing at most
+    # one term per existential. Existentials in neither δ nor g(δ) cannot affect
+    # the result, so are left out.
+    options = _substitution_options(m_prime)
+    exis = _ordered_exis(options, delta, None if delta_weight.is_null else delta_weight)
+    # (ψ∪δ[t₁/e₁,...,tₙ/eₙ] ⊆ γ)
+    for replacements in _substitutions(delta, gamma, exis, options):
+        # (f(γ) = g(δ)[t₁/e₁,...] ∨ g(δ) =《》)
+        if (
+            delta_weight.is_null
+            or delta_weight._replace_arbs(replacements) == gamma_weight
+        ):
+            return True
     return False
 
 
@@ -374,17 +500,7 @@ def issue_matches(i: IssueStructure, j: IssueStructure) -> set[tuple[Term, Term]
     Returns:
         set[tuple[Term, Term]]: The set of term matches.
     """
-    pairs: list[tuple[Term, Term]] = []
-    for t1, open_atom_self in i:
-        # <t_1,x> ∈ I
-        for t2, open_atom_other in j:
-            if (
-                open_atom_self == open_atom_other  # <t_2,x> ∈ J
-                or open_atom_self == ~open_atom_other  # <t_2,x̄> ∈ J
-            ):
-                pairs.append((t1, t2))
-
-    return set(pairs)
+    return i.matches(j)
 
 
 class View:
@@ -403,6 +519,7 @@ class View:
         weights: Optional[Weights],
         *,
         is_pre_view: bool = False,
+        validation: Optional[ValidationLevel] = None,
     ) -> None:
         self._stage = stage
         self._supposition = supposition
@@ -414,7 +531,10 @@ class View:
             self._weights = Weights.get_null_weights(stage)
         else:
             self._weights = weights
-        self.validate(pre_view=is_pre_view)
+        self._canonical_key: Optional[CanonicalKey] = None
+        self._hash: Optional[int] = None
+        self._stage_supp_arb_objects: Optional[frozenset[ArbitraryObject]] = None
+        self.validate(pre_view=is_pre_view, level=current_validation_level(validation))
 
     @property
     def stage(self) -> Stage:
@@ -437,25 +557,49 @@ class View:
         return self._weights
 
     @property
-    def atoms(self) -> set[Atom]:
+    def atoms(self) -> frozenset[Atom]:
         return self.stage.atoms | self.supposition.atoms
 
-    def validate(self, *, pre_view: bool = False):
-        self.dependency_relation.validate_against_states(
-            (self.stage | self.supposition).arb_objects | self.weights.arb_objects,
-            pre_view=pre_view,
-        )
+    def validate(
+        self,
+        *,
+        pre_view: bool = False,
+        level: ValidationLevel = ValidationLevel.FULL,
+    ):
+        """
+        Checks that the parts of the view are consistent with each other.
+
+        Args:
+            pre_view (bool, optional): If the view is a pre-view (Incomplete view,
+                with lower restrictions on validation). Defaults to False.
+            level (ValidationLevel, optional): How thoroughly to check. CHEAP only
+                checks that the weights are of the states of the stage, and OFF
+                checks nothing. Defaults to FULL.
+
+        Raises:
+            ValueError: The view is invalid
+        """
+        if level is ValidationLevel.OFF:
+            return
+        full = level is ValidationLevel.FULL
+        if full:
+            self.dependency_relation.validate_against_states(
+                (self.stage | self.supposition).arb_objects | self.weights.arb_objects,
+                pre_view=pre_view,
+            )
 
         for s, w in self.weights.items():
             if s not in self.stage:
                 raise ValueError(f"{s} not in {self.stage}")
 
-            w.validate_against_dep_rel(self.dependency_relation)
+            if full:
+                w.validate_against_dep_rel(self.dependency_relation)
 
-        for state in self.stage:
-            if state not in self.weights:
-                raise ValueError(f"{state} not in {self.weights}")
-        if not pre_view:
+        if len(self.weights.keys()) != len(self.stage):
+            for state in self.stage:
+                if state not in self.weights:
+                    raise ValueError(f"{state} not in {self.weights}")
+        if full and not pre_view:
             self.issue_structure.validate_against_states(self.stage | self.supposition)
 
     @classmethod
@@ -602,15 +746,17 @@ class View:
         )
 
     def __hash__(self) -> int:
-        return hash(
-            (
-                self.stage,
-                self.supposition,
-                self.dependency_relation,
-                self.issue_structure,
-                self.weights,
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    self.stage,
+                    self.supposition,
+                    self.dependency_relation,
+                    self.issue_structure,
+                    self.weights,
+                )
             )
-        )
+        return self._hash
 
     @property
     def is_verum(self) -> bool:
@@ -621,8 +767,12 @@ class View:
         return self.stage.is_falsum and self.supposition.is_verum
 
     @property
-    def stage_supp_arb_objects(self) -> set[ArbitraryObject]:
-        return self.stage.arb_objects | self.supposition.arb_objects
+    def stage_supp_arb_objects(self) -> frozenset[ArbitraryObject]:
+        if self._stage_supp_arb_objects is None:
+            self._stage_supp_arb_objects = (
+                self.stage.arb_objects | self.supposition.arb_objects
+            )
+        return self._stage_supp_arb_objects
 
     def _replace_arbs(self, replacements: dict[ArbitraryObject, Term]) -> "View":
         """
@@ -634,6 +784,8 @@ class View:
         Returns:
             View: The view with replacements made.
         """
+        if not replacements:
+            return self
         new_stage_set: set[State] = set()
         new_weights: Weights = Weights()
         for state in self.stage:
@@ -799,21 +951,32 @@ class View:
             new_v = new_v.match(i, replace_item)
         return new_v
 
+    @property
+    def canonical_key(self) -> CanonicalKey:
+        """
+        A key for the view invariant under renaming of its arbitrary objects
+        (universals to universals and existentials to existentials). Computed
+        once per view.
+
+        Returns:
+            CanonicalKey: The canonical key
+        """
+        if self._canonical_key is None:
+            self._canonical_key = canonical_key(self)
+        return self._canonical_key
+
     def is_equivalent_under_arb_sub(self, other: "View") -> bool:
         """
         Checks to see if two views are equivalent when the arbitrary objects
         are changed designation.
 
-        Complexity is O((n!)^2*n) where n is average num of exi and unis
-
-        For exis and unis above 9 or 10 (of each) this becomes an issue, below is fine
+        Each view is reduced to a canonical form in which arbitrary objects are
+        labelled by their role in the view rather than by name; the views are
+        equivalent exactly when these forms are equal.
 
         Args:
             other (View): The view for comparison
 
-        Raises:
-            ValueError: Too many arbitrary objects for permutation computation.
-
         Returns:
             bool: True for is equivalent, False for is not.
         """
@@ -826,31 +989,11 @@ class View:
 
         if len(self_uni) != len(other_uni) or len(self_exi) != len(other_exi):
             return False  # pragma: not covered
-        if (
-            len(self_uni) > 9
-            or len(self_exi) > 9
-            or len(other_uni) > 9
-            or len(other_exi) > 9
-        ):  # pragma: not covered
-            raise ValueError("Too many unis or exis to feasibly compute")
-
-        for exi_perm in permutations(other_exi):
-            for uni_perm in permutations(other_uni):
-                replacements = {
-                    **dict(zip(exi_perm, self_exi)),
-                    **dict(zip(uni_perm, self_uni)),
-                }
-
-                new_view = other._replace_arbs(
-                    cast(
-                        dict[ArbitraryObject, Term],
-                        replacements,
-                    )
-                )
-                if new_view == self:
-                    return True
-        return False
+        return self.canonical_key == other.canonical_key
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
     def product(
         self, view: "View", inherited_dependencies: Optional[DependencyRelation] = None
     ) -> "View":
@@ -891,6 +1034,9 @@ class View:
             weights=weights,
         )
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
     def sum(
         self, view: "View", inherited_dependencies: Optional[DependencyRelation] = None
     ):
@@ -939,6 +1085,9 @@ class View:
             weights=new_weights,
         )
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
     def atomic_answer(self, other: "View", verbose: bool = False) -> "View":
         """
         Based on definition 5.12, p206
@@ -994,6 +1143,9 @@ class View:
                 print(f"AtomicAnswerOutput: {out}")
             return out
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
     def equilibrium_answer(self, other: "View", verbose: bool = False) -> "View":
         """
         Based on definition 5.10, p205
@@ -1016,34 +1168,31 @@ class View:
             return self
         else:
 
-            def _arg_max(ps: list[tuple[FunctionalTerm, State]]) -> list[State]:
+            def _arg_max(ps: list[tuple[float, State]]) -> list[State]:
                 if len(ps) == 0:
                     return []
-
-                nums: list[float] = []
-                for p, _ in ps:
-                    assert isinstance(p.f, RealNumber)
-                    nums.append(p.f.num)
-                max_potential = max(nums)
-
-                new_states: list[State] = []
-                for p, state in ps:
-                    assert isinstance(p.f, RealNumber)
-                    if p.f.num == max_potential:
-                        new_states.append(state)
-                return new_states
-
-            potentials: list[tuple[FunctionalTerm, State]] = []
-            for gamma in self.stage:
-                potential = other.stage.equilibrium_answer_potential(
-                    SetOfStates({State({p}) for p in gamma}), other.weights
+                max_potential = max([p for p, _ in ps])
+                return [state for p, state in ps if p == max_potential]
+
+            # Potentials are evaluated as numbers, and compared only if all are
+            gammas = list(self.stage)
+            potentials = list(
+                zip(
+                    other.stage.numeric_answer_potentials(
+                        [SetOfStates({State({p}) for p in gamma}) for gamma in gammas],
+                        other.weights,
+                    ),
+                    gammas,
                 )
-                potentials.append((potential, gamma))
+            )
             if verbose:
                 print(f"Potentials: {potentials}")
-            if not all([isinstance(ft.f, RealNumber) for ft, _ in potentials]):
+            numeric: list[tuple[float, State]] = [
+                (p, gamma) for p, gamma in potentials if p is not None
+            ]
+            if len(numeric) != len(potentials):
                 return self
-            stage = SetOfStates(_arg_max(potentials))
+            stage = SetOfStates(_arg_max(numeric))
 
             out = View.with_restriction(
                 stage=stage,
@@ -1056,6 +1205,9 @@ class View:
                 print(f"EquilibriumAnswerOutput: {out}")
             return out
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
     def answer(self, other: "View", verbose: bool = False) -> "View":
         """
         Based on definition 5.13, p206
@@ -1079,6 +1231,10 @@ class View:
             print(f"AnswerOutput: {out}")
         return out
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
+    @cached_operator
     def negation(self, verbose: bool = False) -> "View":
         """
         Based on definition 5.16, p210
@@ -1107,6 +1263,10 @@ class View:
             print(f"NegationOutput: {out}")
         return out
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
+    @cached_operator
     def merge(self, view: "View", verbose: bool = False) -> "View":
         """
         Based on Definition 5.26, p221
@@ -1205,6 +1365,10 @@ class View:
                 print(f"MergeOutput: {self}")
             return self
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
+    @cached_operator
     def update(self, view: "View", verbose: bool = False) -> "View":
         """
         Based on Definition 4.34, p163
@@ -1227,12 +1391,10 @@ class View:
         )
         shared_objs = self.stage_supp_arb_objects & view.stage_supp_arb_objects
         view = arb_gen.novelise(shared_objs, view)
-        out = (
-            self.universal_product(view, verbose=verbose)
-            .existential_sum(view, verbose=verbose)
-            .answer(view, verbose=verbose)
-            .merge(view, verbose=verbose)
-        )
+        out = self.universal_product(view, verbose=verbose)
+        out = out.existential_sum(view, verbose=verbose)
+        out = out.answer(view, verbose=verbose)
+        out = out.merge(view, verbose=verbose)
         if verbose:
             print(f"UpdateOutput: {out}")
             print()
@@ -1252,6 +1414,9 @@ class View:
         )
         return expr1 and (expr2 or expr3)
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
     def universal_product(self, view: "View", verbose: bool = False) -> "View":
         """
         Based on Definition 5.28, p223
@@ -1326,6 +1491,9 @@ class View:
                 print(f"UniProdOutput: {self}")
             return self
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
     def existential_sum(self, view: "View", verbose: bool = False) -> "View":
         """
         Based on Definition 5.34, p233
@@ -1524,6 +1692,7 @@ class View:
                     self_stage=self.stage,
                     other_stage=other.stage,
                     other_supposition=other.supposition,
+                    presupposition=True,
                 )
                 new_weight = self.weights[gamma]
                 new_weights.adding(new_state, new_weight)
@@ -1540,6 +1709,10 @@ class View:
         else:
             return self
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
+    @cached_operator
     def factor(
         self,
         other: "View",
@@ -1567,41 +1740,73 @@ class View:
         if verbose:
             print(f"FactorInput: External: {self} Internal {other}")
 
-        def big_intersection(state: State) -> Optional[State]:
+        def substituted_divisors() -> list[tuple[Stage, Supposition, bool]]:
             """
-            ∩{γ⌀_Γ(Δ^Ψ[t/a]) : <t,a> ∈ Mij ∧ a ∈ U_S}
-
-            Args:
-                state (State): γ
+            Δ^Ψ[t/a] for <t,a> ∈ Mij ∧ a ∈ U_S, each with whether its division
+            presupposition holds. Neither depends on γ, so both are found once.
 
             Returns:
-                Optional[State]: If nothing inside intersection, returns None,
-                    else returns the resultant state of the intersection.
+                list[tuple[Stage, Supposition, bool]]: Δ[t/a], Ψ[t/a] and the
+                    presupposition for each match.
             """
-            out: list[State] = []
+            out: list[tuple[Stage, Supposition, bool]] = []
             # <t,a> ∈ Mij
             for t, a in issue_matches(self.issue_structure, other.issue_structure):
                 # a ∈ U_S
                 if isinstance(
                     a, ArbitraryObject
                 ) and not other.dependency_relation.is_existential(a):
-                    # γ⌀_Γ(Δ^Ψ[t/a])
+                    new_stage = other.stage._replace_arbs({a: t})  # Δ[t/a]
+                    new_supposition = other.supposition._replace_arbs({a: t})  # Ψ[t/a]
                     out.append(
-                        state_division(
-                            state=state,
-                            self_stage=self.stage,
-                            other_stage=other.stage._replace_arbs({a: t}),  # Δ[t/a]
-                            other_supposition=other.supposition._replace_arbs(
-                                {a: t}
-                            ),  # Ψ[t/a]
+                        (
+                            new_stage,
+                            new_supposition,
+                            division_presupposition(
+                                self_stage=self.stage,
+                                other_stage=new_stage,
+                                other_supposition=new_supposition,
+                            ),
                         )
                     )
+            return out
+
+        def big_intersection(
+            state: State, divisors: list[tuple[Stage, Supposition, bool]]
+        ) -> Optional[State]:
+            """
+            ∩{γ⌀_Γ(Δ^Ψ[t/a]) : <t,a> ∈ Mij ∧ a ∈ U_S}
+
+            Args:
+                state (State): γ
+                divisors (list[tuple[Stage, Supposition, bool]]): Δ^Ψ[t/a] for
+                    each match, as produced by substituted_divisors
+
+            Returns:
+                Optional[State]: If nothing inside intersection, returns None,
+                    else returns the resultant state of the intersection.
+            """
+            out: list[State] = [
+                # γ⌀_Γ(Δ^Ψ[t/a])
+                state_division(
+                    state=state,
+                    self_stage=self.stage,
+                    other_stage=new_stage,
+                    other_supposition=new_supposition,
+                    presupposition=presupposition,
+                )
+                for new_stage, new_supposition, presupposition in divisors
+            ]
             if len(out) == 0:
                 return None
             else:
                 return reduce(lambda s1, s2: s1 & s2, out)
 
-        def state_factor(gamma: State) -> State:
+        def state_factor(
+            gamma: State,
+            presupposition: bool,
+            divisors: list[tuple[Stage, Supposition, bool]],
+        ) -> State:
             """
             Based on definition 4.39, p168
 
@@ -1609,6 +1814,9 @@ class View:
 
             Args:
                 gamma (State): γ
+                presupposition (bool): The division presupposition for Γ and Δ^Ψ
+                divisors (list[tuple[Stage, Supposition, bool]]): Δ^Ψ[t/a] for
+                    each match, as produced by substituted_divisors
 
             Returns:
                 State: The factored state.
@@ -1619,8 +1827,9 @@ class View:
                 self_stage=self.stage,
                 other_stage=other.stage,
                 other_supposition=other.supposition,
+                presupposition=presupposition,
             )
-            expr = big_intersection(gamma)
+            expr = big_intersection(gamma, divisors)
             if expr is None:
                 return gamma_prime
             else:
@@ -1671,11 +1880,7 @@ class View:
                 print("Contradiction factor")
             # {γ∈Γ : ¬∃κ ∈ 𝕂.κ ⊆ γ}^Θ_fRI
             new_weights = self.weights
-            new_stage = SetOfStates(
-                gamma
-                for gamma in self.stage
-                if not gamma.is_primitive_absurd(absurd_states)
-            )
+            new_stage = self.stage.without_primitive_absurd(absurd_states)
         elif identity_factor_condition():
             if verbose:
                 print("Identity factor")
@@ -1708,9 +1913,20 @@ class View:
                 print("Central case factor")
             # Σ_γ∈Γ {f(γ).γ[Δ^Ψ]ꟳ}
 
+            presupposition = division_presupposition(
+                self_stage=self.stage,
+                other_stage=other.stage,
+                other_supposition=other.supposition,
+            )
+            divisors = substituted_divisors()
             new_weights = Weights()
             for gamma in self.stage:
-                new_weights.adding(state_factor(gamma=gamma), self.weights[gamma])
+                new_weights.adding(
+                    state_factor(
+                        gamma=gamma, presupposition=presupposition, divisors=divisors
+                    ),
+                    self.weights[gamma],
+                )
             new_stage = SetOfStates(new_weights.keys())
 
         out = View.with_restriction(
@@ -1724,6 +1940,10 @@ class View:
             print(f"FactorOutput: {out}")
         return out
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
+    @cached_operator
     def depose(self, verbose: bool = False) -> "View":
         """
         Based on definition 5.23
@@ -1755,6 +1975,10 @@ class View:
             print(f"DeposeOutput: {out}")
         return out
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
+    @cached_operator
     def inquire(self, other: "View", *, verbose: bool = False) -> "View":
         """
         Based on definition 5.18, p210
@@ -1848,6 +2072,10 @@ class View:
             print(f"InquireOutput: {out}")
         return out
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
+    @cached_operator
     def suppose(self, other: "View", *, verbose: bool = False) -> "View":
         """
         Based on definition 5.22, p219
@@ -1967,6 +2195,10 @@ class View:
             )
         }
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
+    @cached_operator
     def query(self, other: "View", *, verbose: bool = False) -> "View":
         """
         Based on definition 5.19, p210
@@ -2142,6 +2374,10 @@ class View:
             print(f"QueryOutput: {out}")
         return out
 
+    @traced_operator
+    @validated_operator
+    @cancellable_operator
+    @cached_operator
     def which(self, other: "View", *, verbose: bool = False) -> "View":
         """
         Based on definition 5.33, p232
@@ -2166,6 +2402,7 @@ class View:
             self.dependency_relation.universals
         ):
             m_prime = self._query_m_prime(other)
+            options = _substitution_options(m_prime)
 
             def new_weights_induced_by_gamma(gamma: State) -> Weights:
                 """
@@ -2179,20 +2416,24 @@ class View:
                     Weights:《ω.ξ : Ξ(γ,ω.ξ)》
                 """
                 weights: Weights = Weights()
-                for m_prime_set in powerset(m_prime):
-                    replacements: dict[ArbitraryObject, Term] = {
-                        e_n: t_n for t_n, e_n in m_prime_set
-                    }
-                    if len({e_n for _, e_n in m_prime_set}) == len(m_prime_set):
-                        for p in other.supposition:
-                            for delta in other.stage:
-                                xi = delta._replace_arbs(replacements)
-                                if (xi | p).issubset(gamma):
-                                    w = other.weights[delta]._replace_arbs(replacements)
-                                    # NOTE: This is not exactly what's in the book, because here we count
-                                    # each w.xi possibly multiple times, whereas the book (a little ambiguously,
-                                    # but interpreted strictly) collapses the multiplicities to 1.
-                                    weights.adding(xi, w)
+                for _ in other.supposition.subsets_of(gamma):
+                    for delta in other.stage:
+                        delta_weight = other.weights[delta]
+                        exis = _ordered_exis(options, delta, delta_weight)
+                        # Each substitution is counted once for every choice over
+                        # the existentials it leaves out, which cannot change w.ξ
+                        multiplicity = prod(
+                            1 + len(terms)
+                            for e, terms in options.items()
+                            if e not in exis
+                        )
+                        for replacements in _substitutions(delta, gamma, exis, options):
+                            xi = delta._replace_arbs(replacements)
+                            w = delta_weight._replace_arbs(replacements)
+                            # NOTE: This is not exactly what's in the book, because here we count
+                            # each w.xi possibly multiple times, whereas the book (a little ambiguously,
+                            # but interpreted strictly) collapses the multiplicities to 1.
+                            weights.adding(xi, Weight.sum([w] * multiplicity))
                 return weights
 
             # H
@@ -2254,9 +2495,62 @@ class View:
         """
         return view_to_json(self)
 
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """
+        Parses from binary form to View form
+
+        Args:
+            data (bytes): The bytes of a single view
+
+        Returns:
+            View: The parsed view
+        """
+        return cls._from_view_storage(bytes_to_view(data))
+
+    def to_bytes(self) -> bytes:
+        """
+        Parses from View form to binary form, a compact alternative to json in
+        which each symbol is stored once and referred to by number.
+
+        Returns:
+            bytes: The output bytes
+        """
+        return view_to_bytes(self)
+
+    @classmethod
+    def from_bytes_many(cls, data: bytes) -> list[Self]:
+        """
+        Parses from the binary form of a series of views to View form
+
+        Args:
+            data (bytes): The bytes of the views
+
+        Returns:
+            list[View]: The parsed views, in order
+        """
+        return [cls._from_view_storage(v) for v in bytes_to_views(data)]
+
+    @staticmethod
+    def to_bytes_many(views: Iterable["View"]) -> bytes:
+        """
+        Parses from View form to the binary form of a series of views, storing
+        each symbol once for all of the views.
+
+        Args:
+            views (Iterable[View]): The input views
+
+        Returns:
+            bytes: The output bytes
+        """
+        return views_to_bytes(views)
+
     @classmethod
     def from_str(
-        cls, s: str, custom_functions: list[NumFunc | Function] | None = None
+        cls,
+        s: str,
+        custom_functions: list[NumFunc | Function] | None = None,
+        fast: bool = False,
     ) -> Self:
         """
         Parses from view string form to view form.
@@ -2266,11 +2560,56 @@ class View:
             custom_functions (list[NumFunc | Function] | None, optional): Custom functions used in the
                 string. It assumes the name of the function is that used in the string. Useful
                 for using func callers. Defaults to None.
+            fast (bool, optional): If True, uses the hand written parser rather than
+                the pyparsing grammar. Errors are still reported by the pyparsing
+                grammar. Defaults to False.
 
         Returns:
             View: The output view
         """
-        return cls._from_view_storage(string_to_view(s, custom_functions))
+        return cls._from_view_storage(string_to_view(s, custom_functions, fast))
+
+    @classmethod
+    def from_strs(
+        cls,
+        strings: Iterable[str],
+        custom_functions: list[NumFunc | Function] | None = None,
+        max_workers: int = 1,
+        chunksize: int = 64,
+        fast: bool = False,
+    ) -> list[Self]:
+        """
+        Parses many strings from view string form to view form, sharing predicates
+        and functions between the views.
+
+        Args:
+            strings (Iterable[str]): The view strings
+            custom_functions (list[NumFunc | Function] | None, optional): Custom functions used in the
+                strings. It assumes the name of the function is that used in the string. Useful
+                for using func callers. Defaults to None.
+            max_workers (int, optional): The number of processes to parse in. Defaults to 1,
+                parsing in this process.
+            chunksize (int, optional): The number of strings sent to a process at once.
+                Defaults to 64.
+            fast (bool, optional): If True, uses the hand written parser rather than
+                the pyparsing grammar. Defaults to False.
+
+        Raises:
+            ValueError: max_workers or chunksize is less than 1
+
+        Returns:
+            list[View]: The output views, in the order of the strings
+        """
+        return [
+            cls._from_view_storage(v)
+            for v in string_to_views(
+                strings,
+                custom_functions,
+                max_workers=max_workers,
+                chunksize=chunksize,
+                fast=fast,
+            )
+        ]
 
     def to_str(self, **string_conversion_args: Unpack[StringConversion]) -> str:
         """
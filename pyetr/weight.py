@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AbstractSet, Iterable, Optional
 
 from pyetr.atoms.terms.special_funcs import multiset_product
 
@@ -46,7 +46,9 @@ class Weight:
             set[ArbitraryObject]: The set of arbitrary objects
         """
         arbs: set[ArbitraryObject] = set()
-        for multiset in self.multiplicative + self.additive:
+        for multiset in self.multiplicative:
+            arbs |= multiset.arb_objects
+        for multiset in self.additive:
             arbs |= multiset.arb_objects
         return arbs
 
@@ -56,6 +58,27 @@ class Weight:
             additive=self.additive + other.additive,
         )
 
+    @classmethod
+    def sum(cls, weights: list["Weight"]) -> "Weight":
+        """
+        Adds a list of weights together, building each multiset only once.
+
+        Args:
+            weights (list[Weight]): The weights to add, of which there must be
+                at least one.
+
+        Returns:
+            Weight: The sum of the weights
+        """
+        if len(weights) == 1:
+            return weights[0]
+        return cls(
+            multiplicative=Multiset(
+                [t for weight in weights for t in weight.multiplicative]
+            ),
+            additive=Multiset([t for weight in weights for t in weight.additive]),
+        )
+
     def __mul__(self, other: "Weight") -> "Weight":
         v_cross_w = multiset_product(self.multiplicative, other.multiplicative)
         return Weight(multiplicative=v_cross_w, additive=self.additive + other.additive)
@@ -83,14 +106,17 @@ class Weight:
                 "Arb objects in weights not present in dependency relation"
             )
 
-    def restriction(self, arb_objects: set[ArbitraryObject]) -> "Weight":
+    def restriction(self, arb_objects: AbstractSet[ArbitraryObject]) -> "Weight":
+        multiplicative = [
+            t for t in self.multiplicative if t.arb_objects.issubset(arb_objects)
+        ]
+        additive = [t for t in self.additive if t.arb_objects.issubset(arb_objects)]
+        # Weights are not changed once built, so one left whole can be reused
+        unchanged = len(multiplicative) == len(self.multiplicative)
+        if unchanged and len(additive) == len(self.additive):
+            return self
         return Weight(
-            multiplicative=Multiset(
-                [t for t in self.multiplicative if t.arb_objects.issubset(arb_objects)]
-            ),
-            additive=Multiset(
-                [t for t in self.additive if t.arb_objects.issubset(arb_objects)]
-            ),
+            multiplicative=Multiset(multiplicative), additive=Multiset(additive)
         )
 
     @property
@@ -147,11 +173,14 @@ class Weight:
 
 class Weights:
     _weights: dict[State, Weight]
+    _arb_objects: Optional[frozenset[ArbitraryObject]]
 
     def __init__(self, weights_dict: Optional[dict[State, Weight]] = None) -> None:
         if weights_dict is None:
             weights_dict = {}
         self._weights = weights_dict
+        # Found when first read, and forgotten when a weight is added
+        self._arb_objects = None
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Weights):
@@ -159,31 +188,29 @@ class Weights:
         return self._weights == other._weights
 
     def __hash__(self) -> int:
-        return hash(tuple([(k, v) for k, v in self._weights.items()]))
+        return hash(frozenset(self._weights.items()))
 
     @property
-    def arb_objects(self) -> set[ArbitraryObject]:
+    def arb_objects(self) -> frozenset[ArbitraryObject]:
         """
         The arbitrary objects in the set of states
 
         Returns:
-            set[ArbitraryObject]: The set of arbitrary objects
+            frozenset[ArbitraryObject]: The set of arbitrary objects
         """
-        arbs: set[ArbitraryObject] = set()
-        for weight in self.values():
-            arbs |= weight.arb_objects
-        return arbs
+        if self._arb_objects is None:
+            arbs: set[ArbitraryObject] = set()
+            for weight in self.values():
+                arbs |= weight.arb_objects
+            self._arb_objects = frozenset(arbs)
+        return self._arb_objects
 
     def __add__(self, other: "Weights") -> "Weights":
-        new_weights: dict[State, Weight] = {}
-        for k, x in self._weights.items():
-            if k not in other._weights:
-                new_weights[k] = x
-            else:
-                new_weights[k] = x + other._weights[k]
-
+        new_weights = dict(self._weights)
         for k, x in other._weights.items():
-            if k not in new_weights:
+            if k in new_weights:
+                new_weights[k] = new_weights[k] + x
+            else:
                 new_weights[k] = x
         return Weights(new_weights)
 
@@ -202,6 +229,7 @@ class Weights:
     def adding(self, state: State, weight: Weight):
         # This is to build up a weights dictionary, by adding a weighted state
         # (formed of a state and a weight) one at a time.
+        self._arb_objects = None
         if state in self:
             self._weights[state] += weight
         else:
@@ -227,11 +255,44 @@ class Weights:
         return all(w.is_null for w in self.values())
 
     def __mul__(self, other: "Weights") -> "Weights":
-        new_weights: Weights = Weights()
-        for state1, weight1 in self._weights.items():
-            for state2, weight2 in other._weights.items():
-                new_weights.adding(state1 | state2, weight1 * weight2)
-        return new_weights
+        if self.is_null_weights and other.is_null_weights:
+            return Weights.get_null_weights(
+                SetOfStates(
+                    {
+                        state1 | state2
+                        for state1 in self.keys()
+                        for state2 in other.keys()
+                    }
+                )
+            )
+        return Weights.from_weighted_states(
+            (state1 | state2, weight1 * weight2)
+            for state1, weight1 in self._weights.items()
+            for state2, weight2 in other._weights.items()
+        )
+
+    @classmethod
+    def from_weighted_states(
+        cls, weighted_states: Iterable[tuple[State, Weight]]
+    ) -> "Weights":
+        """
+        Builds weights from a series of weighted states. Where a state appears more
+        than once its weights are added, as with `adding`, but all at once rather
+        than one pair at a time.
+
+        Args:
+            weighted_states (Iterable[tuple[State, Weight]]): The weighted states
+
+        Returns:
+            Weights: The new weights
+        """
+        grouped: dict[State, list[Weight]] = {}
+        for state, weight in weighted_states:
+            if state in grouped:
+                grouped[state].append(weight)
+            else:
+                grouped[state] = [weight]
+        return cls({state: Weight.sum(weights) for state, weights in grouped.items()})
 
     @classmethod
     def get_null_weights(cls, states: SetOfStates) -> "Weights":
@@ -258,7 +319,7 @@ class Weights:
         Returns:
             Weights: The new subset weights.
         """
-        assert set_of_states.issubset(SetOfStates(self.keys()))
+        assert all(state in self._weights for state in set_of_states)
         return Weights({k: v for k, v in self.items() if k in set_of_states})
 
     def __repr__(self) -> str:
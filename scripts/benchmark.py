@@ -0,0 +1,331 @@
+"""
+Times the worked examples of pyetr.cases and a series of generated problems that
+grow in size, writing the results as JSON and optionally comparing them with a
+baseline written by an earlier run.
+"""
+
+import argparse
+import json
+import platform
+import re
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Iterable, NamedTuple, Optional
+
+import pyetr
+import pyetr.cases
+from pyetr import View
+from pyetr.caching import (
+    disable_operator_cache,
+    enable_operator_cache,
+    operator_cache_info,
+)
+from pyetr.canonical import canonical_key
+from pyetr.inference import default_inference_procedure
+
+
+class Benchmark(NamedTuple):
+    name: str
+    func: Callable[[], object]
+
+
+def case_benchmarks() -> list[Benchmark]:
+    """
+    Returns:
+        list[Benchmark]: A benchmark for the test of each case in pyetr.cases
+    """
+    benchmarks: list[Benchmark] = []
+    for name in pyetr.cases.__all__:
+        case = getattr(pyetr.cases, name)
+        benchmarks.append(
+            Benchmark(f"cases.{name}", lambda case=case: case.test(False))
+        )
+    return benchmarks
+
+
+def product_views(width: int) -> tuple[View, View]:
+    """
+    Args:
+        width (int): The number of states in each view
+
+    Returns:
+        tuple[View, View]: Two disjunctions, whose product has width² states
+    """
+    v1 = View.from_str(
+        "{" + ",".join(f"P{i}(a())Q{i}(b())" for i in range(width)) + "}"
+    )
+    v2 = View.from_str("{" + ",".join(f"R{i}(c())" for i in range(width)) + "}")
+    return v1, v2
+
+
+def query_views(size: int) -> tuple[View, View]:
+    """
+    Args:
+        size (int): The number of existentials in the question
+
+    Returns:
+        tuple[View, View]: A view of size related objects, and a question about
+            size existentials, each of which may stand for any of them
+    """
+    v = View.from_str(
+        "{"
+        + "".join(f"P(c{i}()*)R(c{i}(),c{(i + 1) % size}())" for i in range(size))
+        + "}"
+    )
+    question = View.from_str(
+        "".join(f"∃y{i} " for i in range(size))
+        + "{"
+        + "".join(f"P(y{i}*)" for i in range(size))
+        + "}"
+    )
+    return v, question
+
+
+def equivalent_views(size: int) -> tuple[View, View]:
+    """
+    Args:
+        size (int): The number of existentials in each view
+
+    Returns:
+        tuple[View, View]: Two views of a cycle of size existentials, equal up to
+            the names of the existentials
+    """
+
+    def cycle(name: str) -> View:
+        return View.from_str(
+            "".join(f"∃{name}{i} " for i in range(size))
+            + "{"
+            + "".join(f"P({name}{i},{name}{(i + 1) % size})" for i in range(size))
+            + "}"
+        )
+
+    return cycle("x"), cycle("z")
+
+
+def chain_premises(count: int) -> tuple[View, ...]:
+    """
+    Args:
+        count (int): The number of premises
+
+    Returns:
+        tuple[View, ...]: A chain of count - 1 conditionals, each supposing the
+            conclusion of the one before, followed by the first supposition.
+    """
+    conditionals = [
+        View.from_str(f"{{P{i}(a())P{i + 1}(a())}}^{{P{i}(a())}}")
+        for i in range(count - 1)
+    ]
+    return (*conditionals, View.from_str("{P0(a())}"))
+
+
+def scaling_benchmarks(sizes: Iterable[int]) -> list[Benchmark]:
+    """
+    Args:
+        sizes (Iterable[int]): The sizes to generate each problem at
+
+    Returns:
+        list[Benchmark]: A benchmark of each generated problem at each size
+    """
+    benchmarks: list[Benchmark] = []
+    for n in sizes:
+        v1, v2 = product_views(n)
+        benchmarks.append(
+            Benchmark(f"product.width_{n}", lambda v1=v1, v2=v2: v1.product(v2))
+        )
+        v, question = query_views(n)
+        benchmarks.append(
+            Benchmark(f"query.existentials_{n}", lambda v=v, q=question: v.query(q))
+        )
+        v1, v2 = equivalent_views(n)
+        # Views keep their canonical keys, so the comparison is timed directly
+        benchmarks.append(
+            Benchmark(
+                f"is_equivalent_under_arb_sub.existentials_{n}",
+                lambda v1=v1, v2=v2: canonical_key(v1) == canonical_key(v2),
+            )
+        )
+        premises = chain_premises(n)
+        benchmarks.append(
+            Benchmark(
+                f"default_inference_procedure.premises_{n}",
+                lambda p=premises: default_inference_procedure(p),
+            )
+        )
+    return benchmarks
+
+
+def measure(func: Callable[[], object], repeat: int, min_time: float) -> dict[str, Any]:
+    """
+    Times a function, running it enough times per repeat to take at least
+    min_time seconds, and measures its peak memory use over one further run.
+
+    Args:
+        func (Callable[[], object]): The function
+        repeat (int): The number of timings to take
+        min_time (float): The fewest seconds each timing takes
+
+    Returns:
+        dict[str, Any]: The fastest and median seconds per run, the runs per
+            timing, and the peak bytes allocated during a run.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    times = sorted(
+        [elapsed / number] + [t / number for t in timer.repeat(repeat - 1, number)]
+    )
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "best": times[0],
+        "median": times[len(times) // 2],
+        "number": number,
+        "peak_bytes": peak,
+    }
+
+
+def run(
+    benchmarks: Iterable[Benchmark],
+    repeat: int = 5,
+    min_time: float = 0.05,
+    verbose: bool = False,
+) -> dict[str, Any]:
+    """
+    Runs the benchmarks with the operator cache disabled, so each run does the
+    full work, restoring the cache afterwards.
+
+    Args:
+        benchmarks (Iterable[Benchmark]): The benchmarks
+        repeat (int, optional): The number of timings of each. Defaults to 5.
+        min_time (float, optional): The fewest seconds each timing takes.
+            Defaults to 0.05.
+        verbose (bool, optional): Print each result as it is measured. Defaults
+            to False.
+
+    Returns:
+        dict[str, Any]: The environment and the results by benchmark name
+    """
+    info = operator_cache_info()
+    disable_operator_cache()
+    results: dict[str, dict[str, Any]] = {}
+    try:
+        for benchmark in benchmarks:
+            result = measure(benchmark.func, repeat, min_time)
+            results[benchmark.name] = result
+            if verbose:
+                print(
+                    f"{benchmark.name:<60} {result['best'] * 1e3:>10.3f} ms "
+                    f"{result['peak_bytes'] / 1024:>10.1f} KiB"
+                )
+    finally:
+        if info is not None:
+            enable_operator_cache(info.maxsize)
+    return {
+        "pyetr": pyetr.__version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """
+    Compares the fastest times of benchmarks present in both runs.
+
+    Args:
+        results (dict[str, Any]): The output of run
+        baseline (dict[str, Any]): The output of an earlier run
+        threshold (float): The fraction a benchmark may slow by before it counts
+            as a regression
+
+    Returns:
+        list[str]: A description of each regression
+    """
+    regressions: list[str] = []
+    for name, result in results["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before = baseline["results"][name]["best"]
+        after = result["best"]
+        if before > 0 and after > before * (1 + threshold):
+            regressions.append(
+                f"{name}: {before * 1e3:.3f} ms -> {after * 1e3:.3f} ms "
+                f"({after / before:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--suite",
+        choices=["all", "cases", "scaling"],
+        default="all",
+        help="the benchmarks to run",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default=None,
+        help="only run benchmarks whose names match this regular expression",
+    )
+    parser.add_argument(
+        "--sizes",
+        default="2,4,8,16",
+        help="comma separated sizes of the generated problems",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("-o", "--output", default=None, help="JSON file to write")
+    parser.add_argument(
+        "--baseline", default=None, help="JSON file of an earlier run to compare to"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="the fraction a benchmark may slow by before failing",
+    )
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    benchmarks: list[Benchmark] = []
+    if args.suite in ("all", "cases"):
+        benchmarks += case_benchmarks()
+    if args.suite in ("all", "scaling"):
+        benchmarks += scaling_benchmarks(int(s) for s in args.sizes.split(","))
+    if args.filter is not None:
+        pattern = re.compile(args.filter)
+        benchmarks = [b for b in benchmarks if pattern.search(b.name)]
+
+    results = run(benchmarks, repeat=args.repeat, min_time=args.min_time, verbose=True)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regressions over {args.threshold:.0%}:")
+            for regression in regressions:
+                print("  " + regression)
+            sys.exit(1)
+        print(f"\nNo regressions over {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
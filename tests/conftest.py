@@ -11,6 +11,7 @@ from pyetr.cases import BaseExample
 from pyetr.exceptions import OperationUndefinedError
 from pyetr.parsing.common import ParsingError
 from pyetr.parsing.fol_items.view_to_items import FOLNotSupportedError
+from pyetr.validation import ValidationLevel, validation_level
 from pyetr.view import View
 
 
@@ -77,6 +78,20 @@ class ParseCompareViaJson(BaseParseItem):
             )
 
 
+class ParseCompareViaBytes(BaseParseItem):
+    def runtest(self):
+        parsed_view = View.from_str(self.view_string)
+        out_view = View.from_bytes(parsed_view.to_bytes())
+        if (
+            parsed_view != out_view
+            or parsed_view.weights != out_view.weights
+            or parsed_view.issue_structure != out_view.issue_structure
+        ):
+            raise ValueError(
+                f"View lost in binary conversion, start: {parsed_view}, end: {out_view}"
+            )
+
+
 class ParseCompareViaString(BaseParseItem):
     def runtest(self):
         parsed_view = View.from_str(self.view_string)
@@ -170,6 +185,12 @@ class OperationTest(pytest.Item):
         )
 
     def runtest(self):
+        # Operator outputs are fully checked, to test that operators keep the
+        # invariants of views
+        with validation_level(ValidationLevel.FULL):
+            self._run_operations()
+
+    def _run_operations(self):
         parsed_view1 = self.view1
         parsed_view2 = self.view2
 
@@ -195,6 +216,7 @@ class OperationTest(pytest.Item):
 parse_test_set: list[type[BaseParseItem]] = [
     ParseTestItem,
     ParseCompareViaJson,
+    ParseCompareViaBytes,
     ParseCompareViaString,
     ParseCompareViaFOL,
     ParseCompareViaSMT,
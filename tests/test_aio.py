@@ -0,0 +1,143 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from pyetr import View
+from pyetr.aio import AsyncReasoner
+from pyetr.caching import disable_operator_cache, enable_operator_cache
+from pyetr.cancellation import CancelToken, cancel_scope
+from pyetr.exceptions import OperationCancelledError
+from pyetr.inference import (
+    default_inference_procedure,
+    default_procedure_does_it_follow,
+)
+
+stopped = threading.Event()
+
+
+def spin(v: View) -> View:
+    # Repeats an update until cancelled
+    try:
+        while True:
+            v.update(v)
+    finally:
+        stopped.set()
+
+
+class TestCancellation:
+    def test_update_checks_token(self):
+        v = View.from_str("{P(a())Q(b())}")
+        token = CancelToken()
+        with cancel_scope(token):
+            v.update(v)
+            token.cancel()
+            with pytest.raises(OperationCancelledError):
+                v.update(v)
+        # Outside the scope the token no longer applies
+        assert v.update(v) == v
+
+    def test_every_operator_checks_token(self):
+        v = View.from_str("{P(a())Q(b())}")
+        token = CancelToken()
+        token.cancel()
+        enable_operator_cache()
+        try:
+            v.update(v)
+            with cancel_scope(token):
+                # Neither an operator without caching nor a cache hit runs
+                with pytest.raises(OperationCancelledError):
+                    v.product(v)
+                with pytest.raises(OperationCancelledError):
+                    v.update(v)
+        finally:
+            disable_operator_cache()
+
+
+class TestAsyncReasoner:
+    def test_matches_sync(self):
+        v1 = View.from_str("{P(a())Q(b()),R(c())}")
+        v2 = View.from_str("{P(a())}")
+
+        async def run():
+            async with AsyncReasoner() as reasoner:
+                return await asyncio.gather(
+                    reasoner.update(v1, v2),
+                    reasoner.apply(v1, "factor", v2, verbose=False),
+                    reasoner.infer([v1, v2]),
+                    reasoner.infer(
+                        [v1, v2], v2, procedure=default_procedure_does_it_follow
+                    ),
+                )
+
+        assert asyncio.run(run()) == [
+            v1.update(v2),
+            v1.factor(v2),
+            default_inference_procedure([v1, v2]),
+            default_procedure_does_it_follow([v1, v2], v2),
+        ]
+
+    def test_cancel_stops_operation(self):
+        v = View.from_str("{P(a())Q(b())}")
+        stopped.clear()
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        async def run():
+            async with AsyncReasoner() as reasoner:
+                tick_task = asyncio.create_task(ticker())
+                task = asyncio.create_task(reasoner.run(spin, v))
+                await asyncio.sleep(0.3)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                tick_task.cancel()
+
+        asyncio.run(run())
+        assert stopped.is_set()
+        # The event loop kept running while the operation did
+        assert ticks > 5
+
+    def test_backpressure(self):
+        running = 0
+        most_running = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal running, most_running
+            with lock:
+                running += 1
+                most_running = max(most_running, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        async def run():
+            reasoner = AsyncReasoner(max_in_flight=2)
+            await asyncio.gather(*[reasoner.run(work) for _ in range(6)])
+            reasoner.close()
+
+        asyncio.run(run())
+        assert most_running == 2
+
+    def test_process_executor(self):
+        v1 = View.from_str("{P(a())Q(b()),R(c())}")
+        v2 = View.from_str("{P(a())}")
+
+        async def run():
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                reasoner = AsyncReasoner(executor)
+                return await reasoner.update(v1, v2)
+
+        assert asyncio.run(run()) == v1.update(v2)
+
+    def test_invalid_max_in_flight(self):
+        with pytest.raises(ValueError, match="max_in_flight must be at least 1"):
+            AsyncReasoner(max_in_flight=0)
@@ -0,0 +1,139 @@
+import os
+
+import pytest
+
+from pyetr import View
+from pyetr.archive import ViewArchive
+
+strings = [
+    "∀x ∃y {0.3=* P(x*)Q(f(y))}^{P(x*)}",
+    "{2=+ do(S(a()))~T(b()), ~do(S(a()))}",
+    "{P(a())Q(b())}",
+]
+
+
+@pytest.fixture
+def views():
+    return [View.from_str(s) for s in strings]
+
+
+class TestViewArchive:
+    def test_round_trip(self, tmp_path, views):
+        path = tmp_path / "views.petr"
+        with ViewArchive(path, "w") as archive:
+            assert archive.extend(views) == [0, 1, 2]
+            assert archive.append(views[0], key="premise") == "premise"
+            assert archive[1] == views[1]
+        with ViewArchive(path) as archive:
+            assert len(archive) == 4
+            assert archive.keys() == [0, 1, 2, "premise"]
+            assert [archive[k] for k in archive] == [*views, views[0]]
+            assert archive[0].weights == views[0].weights
+            assert archive[0].issue_structure == views[0].issue_structure
+            assert "premise" in archive and 4 not in archive
+            assert archive.get(4) is None
+            with pytest.raises(KeyError):
+                archive[4]
+
+    def test_lazy_decoding(self, tmp_path, views):
+        path = tmp_path / "views.petr"
+        with ViewArchive(path, "w") as archive:
+            archive.extend(views)
+        with ViewArchive(path) as archive:
+            assert archive[2] == views[2]
+            # Only P, Q, a, b, a(), b(), P(a()) and Q(b()) are decoded
+            assert len(archive._decoder._objects) == 8
+            assert archive._symbol_count > 8
+
+    def test_append_shares_symbols(self, tmp_path, views):
+        path = tmp_path / "views.petr"
+        with ViewArchive(path, "a") as archive:
+            archive.extend(views)
+            symbol_count = archive._symbol_count
+        size = os.path.getsize(path)
+        with ViewArchive(path, "a") as archive:
+            archive.extend(views)
+        with ViewArchive(path) as archive:
+            assert archive.keys() == list(range(6))
+            assert archive[5] == views[2]
+            assert archive._symbol_count == symbol_count
+        assert os.path.getsize(path) < 2 * size
+
+    def test_index(self, tmp_path, views):
+        path = tmp_path / "views.petr"
+        with ViewArchive(path, "w") as archive:
+            archive.extend(views)
+        with ViewArchive(path, "a") as archive:
+            # Opened from the index, without reading the view frames
+            assert len(archive._segments) == 1 and not archive._recent
+            archive.append(views[1], key="b")
+            archive.append(views[0], key="a")
+            assert archive.keys() == [0, 1, 2, "b", "a"]
+        with ViewArchive(path) as archive:
+            assert len(archive._segments) == 2 and not archive._recent
+            assert len(archive) == 5
+            assert archive.keys() == [0, 1, 2, "b", "a"]
+            assert archive["a"] == views[0] and archive[1] == views[1]
+            assert "c" not in archive and 3 not in archive and 1.5 not in archive
+
+    def test_not_closed(self, tmp_path, views):
+        path = tmp_path / "views.petr"
+        with ViewArchive(path, "w") as archive:
+            archive.extend(views)
+        archive = ViewArchive(path, "a")
+        archive.append(views[2], key="c")
+        # As if the program stopped before closing the archive
+        archive._close_file()
+        with ViewArchive(path, "a") as archive:
+            assert list(archive._recent) == ["c"]
+            assert archive.keys() == [0, 1, 2, "c"]
+            assert archive["c"] == views[2]
+        with ViewArchive(path) as archive:
+            assert len(archive._segments) == 2 and not archive._recent
+            assert archive.keys() == [0, 1, 2, "c"]
+
+    def test_bounded_caches(self, tmp_path):
+        path = tmp_path / "views.petr"
+        views = View.from_strs([f"{{P(a{i}())Q(b())}}" for i in range(100)], fast=True)
+        with ViewArchive(path, "w") as archive:
+            for i, view in enumerate(views):
+                archive.append(view, key=f"view {i}")
+        with ViewArchive(path, cache_size=4) as archive:
+            assert [archive[f"view {i}"] for i in range(100)] == views
+            assert len(archive._decoder._objects) == 4
+            assert len(archive._loaded) == 64
+        with pytest.raises(ValueError, match="cache_size must be at least 1"):
+            ViewArchive(path, cache_size=0)
+
+    def test_incomplete_frame(self, tmp_path, views):
+        path = tmp_path / "views.petr"
+        with ViewArchive(path, "w") as archive:
+            archive.extend(views)
+        size = os.path.getsize(path)
+        with open(path, "ab") as f:
+            f.write(b"\x01\xff\x00\x00\x00partial")
+        with pytest.raises(ValueError, match="incomplete frame"):
+            ViewArchive(path)
+        with ViewArchive(path, "a") as archive:
+            assert len(archive) == 3
+            archive.append(views[0])
+            assert archive[3] == views[0]
+        assert os.path.getsize(path) > size
+
+    def test_errors(self, tmp_path, views):
+        path = tmp_path / "views.petr"
+        with ViewArchive(path, "w") as archive:
+            archive.append(views[0], key="a")
+            with pytest.raises(ValueError, match="already in the archive"):
+                archive.append(views[1], key="a")
+            with pytest.raises(ValueError, match="int or str"):
+                archive.append(views[1], key=1.5)  # type: ignore
+        with ViewArchive(path) as archive:
+            with pytest.raises(ValueError, match="read mode"):
+                archive.append(views[0])
+        with pytest.raises(ValueError, match="Invalid mode"):
+            ViewArchive(path, "x")  # type: ignore
+        other = tmp_path / "other"
+        other.write_bytes(b"not an archive")
+        with pytest.raises(ValueError, match="not a view archive"):
+            ViewArchive(other)
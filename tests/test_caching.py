@@ -0,0 +1,92 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyetr.caching import (
+    OperatorCache,
+    clear_operator_cache,
+    disable_operator_cache,
+    enable_operator_cache,
+    operator_cache_info,
+)
+from pyetr.view import View
+
+
+@pytest.fixture
+def operator_cache():
+    enable_operator_cache(maxsize=2)
+    yield
+    disable_operator_cache()
+
+
+class TestOperatorCache:
+    def test_lru_eviction(self):
+        cache = OperatorCache(maxsize=2)
+        cache.store("a", 1)
+        cache.store("b", 2)
+        assert cache.lookup("a") == (True, 1)
+        cache.store("c", 3)
+        assert cache.lookup("b") == (False, None)
+        assert cache.lookup("a") == (True, 1)
+        assert cache.lookup("c") == (True, 3)
+        assert cache.info() == (3, 1, 2, 2)
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError, match="maxsize must be at least 1"):
+            OperatorCache(maxsize=0)
+
+    def test_shared_between_threads(self):
+        cache = OperatorCache(maxsize=2)
+
+        class SlowKey(int):
+            # Gives up the GIL on each hash, so that the threads interleave
+            # within the dictionary operations of the cache
+            def __hash__(self) -> int:
+                time.sleep(0)
+                return int(self)
+
+        def work(offset: int) -> None:
+            for i in range(500):
+                key = SlowKey((offset + i) % 8)
+                found, value = cache.lookup(key)
+                if found:
+                    assert value == key
+                else:
+                    cache.store(key, int(key))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for result in [pool.submit(work, offset) for offset in range(4)]:
+                result.result()
+        info = cache.info()
+        assert info.hits + info.misses == 2000
+        assert info.currsize == 2
+
+    def test_disabled_by_default(self):
+        assert operator_cache_info() is None
+
+
+class TestCachedOperators:
+    def test_update_hit(self, operator_cache):
+        v1 = View.from_str("{P(a()),Q(b())}")
+        v2 = View.from_str("{P(a())}")
+        out1 = v1.update(v2)
+        out2 = View.from_str("{P(a()),Q(b())}").update(View.from_str("{P(a())}"))
+        assert out1 is out2
+        assert out1 == View.from_str("{P(a())}")
+        info = operator_cache_info()
+        assert info is not None and info.hits >= 1
+
+    def test_options_in_key(self, operator_cache):
+        v = View.from_str("{P(a()),Q(b())}")
+        assert v.update(v, False) is v.update(v, verbose=False)
+        clear_operator_cache()
+        info = operator_cache_info()
+        assert info is not None and info.currsize == 0
+
+    def test_verbose_bypasses_cache(self, operator_cache, capsys):
+        v1 = View.from_str("{P(a()),Q(b())}")
+        v2 = View.from_str("{P(a())}")
+        v1.merge(v2)
+        v1.merge(v2, verbose=True)
+        assert "MergeInput" in capsys.readouterr().out
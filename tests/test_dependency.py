@@ -0,0 +1,69 @@
+import pytest
+
+from pyetr import ArbitraryObject, Dependency, DependencyRelation
+from pyetr.dependency import transitive_closure
+
+u1, u2, e1, e2 = (ArbitraryObject(n) for n in ("u1", "u2", "e1", "e2"))
+
+
+def relation(*deps: tuple[ArbitraryObject, ArbitraryObject], validate: bool = True):
+    return DependencyRelation(
+        [u1, u2],
+        [e1, e2],
+        [Dependency(existential=e, universal=u) for e, u in deps],
+        validate=validate,
+    )
+
+
+class TestDependencyRelation:
+    def test_matryoshka(self):
+        relation((e1, u1), (e1, u2), (e2, u2))
+        with pytest.raises(ValueError, match="Matryoshka"):
+            relation((e1, u1), (e2, u2))
+
+    def test_skip_validation(self):
+        r = relation((e1, u1), (e2, u2), validate=False)
+        assert r.related_existentials(u1) == {e1}
+
+    def test_related(self):
+        r = relation((e1, u1), (e1, u2), (e2, u2))
+        assert r.related_universals(e1) == {u1, u2}
+        assert r.related_universals(e2) == {u2}
+        assert r.related_existentials(u1) == {e1}
+
+    def test_triangle(self):
+        r = relation((e1, u1), (e1, u2), (e2, u2))
+        assert r.triangle(e1, u1)
+        assert not r.triangle(u1, e1)
+        assert r.triangle(u1, e2)
+        assert r.triangle(e1, e2)
+        assert not r.triangle(e2, e1)
+        assert r.triangle(u1, u2)
+        assert not r.triangle(u2, u1)
+        assert not r.triangle(e1, ArbitraryObject("x"))
+
+    def test_less_sim(self):
+        r = relation((e1, u1), (e1, u2), (e2, u2))
+        assert r.less_sim(e1, e2)
+        assert not r.less_sim(e2, e1)
+        assert r.less_sim(e1, e1)
+
+    def test_negation(self):
+        r = relation((e1, u1), (e1, u2), (e2, u2))
+        assert r.negation() == DependencyRelation(
+            [e1, e2], [u1, u2], [Dependency(existential=u1, universal=e2)]
+        )
+
+
+class TestTransitiveClosure:
+    def test_chain(self):
+        pairs = {(u1, u2), (u2, e1), (e1, e2)}
+        assert transitive_closure(pairs, frozenset([u1, u2, e1, e2])) == pairs | {
+            (u1, e1),
+            (u1, e2),
+            (u2, e2),
+        }
+
+    def test_restricted_targets(self):
+        pairs = {(u1, u2), (u2, e1)}
+        assert transitive_closure(pairs, frozenset([u2])) == pairs
@@ -0,0 +1,169 @@
+import asyncio
+import os
+import pickle
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from typing import Sequence
+
+import pytest
+
+import pyetr.cases
+from pyetr.inference import (
+    StreamingReasoner,
+    basic_step,
+    batch_inference,
+    default_inference_procedure,
+    default_procedure_does_it_follow,
+)
+from pyetr.view import View
+
+
+def slow_procedure(v: Sequence[View]) -> View:
+    time.sleep(5)
+    return v[0]
+
+
+def dying_procedure(v: Sequence[View]) -> View:
+    if len(v) == 2:
+        os._exit(1)
+    return v[0]
+
+
+def problems():
+    return [
+        ((View.from_str("{P(a())}"), View.from_str("{Q(b())}")), None),
+        ((View.from_str("{P(a()),Q(b())}"), View.from_str("{P(a())}")), None),
+        ((View.from_str("{R(c())}"),), None),
+    ]
+
+
+class TestBatchInference:
+    def test_serial_matches_procedure(self):
+        results = list(batch_inference(problems(), max_workers=1))
+        assert [r.position for r in results] == [0, 1, 2]
+        for result, (premises, _) in zip(results, problems()):
+            assert result.ok
+            assert result.value == default_inference_procedure(premises)
+
+    def test_pool_matches_serial(self):
+        serial = list(batch_inference(problems(), max_workers=1))
+        pooled = list(batch_inference(problems(), max_workers=2, chunksize=1))
+        assert pooled == serial
+
+    def test_unordered(self):
+        results = list(
+            batch_inference(problems(), max_workers=2, chunksize=2, ordered=False)
+        )
+        assert sorted(r.position for r in results) == [0, 1, 2]
+
+    def test_failure_isolated(self):
+        target = View.from_str("{P(a())}")
+        items = [
+            ((View.from_str("{P(a()),Q(b())}"),), target),
+            ((View.from_str("{P(a())}"),), None),
+        ]
+        results = list(
+            batch_inference(
+                items, procedure=default_procedure_does_it_follow, max_workers=2
+            )
+        )
+        assert results[0].ok
+        assert results[0].value == default_procedure_does_it_follow(*items[0])
+        assert isinstance(results[1].error, TypeError)
+        assert results[1].value is None
+
+    def test_dead_worker(self):
+        p, q = View.from_str("{P(a())}"), View.from_str("{Q(b())}")
+        # The procedure kills its worker on the problem with two premises
+        items = [((p, q) if i == 17 else (p,), None) for i in range(41)]
+        for ordered in (True, False):
+            results = list(
+                batch_inference(
+                    items,
+                    procedure=dying_procedure,
+                    max_workers=2,
+                    chunksize=2,
+                    ordered=ordered,
+                )
+            )
+            assert sorted(r.position for r in results) == list(range(41))
+            assert [r.position for r in results if not r.ok] == [17]
+            (failed,) = [r for r in results if not r.ok]
+            assert isinstance(failed.error, BrokenProcessPool)
+
+    def test_timeout(self):
+        results = list(
+            batch_inference(
+                problems()[:1], procedure=slow_procedure, max_workers=1, timeout=0.1
+            )
+        )
+        assert isinstance(results[0].error, TimeoutError)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="chunksize must be at least 1"):
+            list(batch_inference(problems(), chunksize=0))
+        with pytest.raises(ValueError, match="max_workers must be at least 1"):
+            list(batch_inference(problems(), max_workers=0))
+
+
+def default_inference_cases() -> list[type[pyetr.cases.DefaultInference]]:
+    return [
+        case
+        for name in pyetr.cases.__all__
+        if isinstance(case := getattr(pyetr.cases, name), type)
+        and issubclass(case, pyetr.cases.DefaultInference)
+    ]
+
+
+class TestStreamingReasoner:
+    @pytest.mark.parametrize("case", default_inference_cases())
+    def test_matches_default_inference(self, case):
+        reasoner = StreamingReasoner(keep_premises=True)
+        for i, g_prime in enumerate(reasoner.consume(case.v)):
+            assert g_prime == basic_step(case.v[: i + 1])
+        assert reasoner.conclusion() == default_inference_procedure(case.v)
+
+    def test_premises_not_kept(self):
+        v = pyetr.cases.e1.v
+        reasoner = StreamingReasoner(v)
+        assert reasoner.premises is None
+        assert reasoner.steps == len(v)
+        with pytest.raises(ValueError, match="must be passed"):
+            reasoner.conclusion()
+        with pytest.raises(ValueError, match="Expected 2 premises"):
+            reasoner.conclusion(v[:1])
+        assert reasoner.conclusion(v) == default_inference_procedure(v)
+
+    def test_checkpoint_restore(self):
+        v = pyetr.cases.e3.v
+        reasoner = StreamingReasoner(v[:1], keep_premises=True)
+        state = pickle.loads(pickle.dumps(reasoner.checkpoint()))
+        restored = StreamingReasoner.restore(state)
+        assert restored.steps == 1
+        for premise in v[1:]:
+            restored.add(premise)
+        assert restored.g_prime == basic_step(v)
+        assert restored.conclusion() == default_inference_procedure(v)
+
+    def test_async(self):
+        v = pyetr.cases.e2.v
+
+        async def premises():
+            for premise in v:
+                yield premise
+
+        threads: set[int] = set()
+
+        class Reasoner(StreamingReasoner):
+            def add(self, premise: View) -> View:
+                threads.add(threading.get_ident())
+                return super().add(premise)
+
+        async def run():
+            reasoner = Reasoner()
+            return [g async for g in reasoner.aconsume(premises())]
+
+        assert asyncio.run(run())[-1] == basic_step(v)
+        # The updates run off the thread of the event loop
+        assert threading.get_ident() not in threads
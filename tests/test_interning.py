@@ -0,0 +1,70 @@
+import pickle
+
+from pyetr import ArbitraryObject, Function, FunctionalTerm, Predicate, PredicateAtom
+from pyetr.atoms import DoAtom
+from pyetr.interning import disable_interning, enable_interning, interning_enabled
+from pyetr.stateset import State
+
+
+class TestInterning:
+    def test_arb_shared(self):
+        assert ArbitraryObject("x") is ArbitraryObject("x")
+
+    def test_functional_term_shared(self):
+        f = Function("f", 1)
+        t1 = FunctionalTerm(f, (ArbitraryObject("x"),))
+        t2 = FunctionalTerm(Function("f", 1), (ArbitraryObject("x"),))
+        assert t1 is t2
+
+    def test_func_caller_distinguished(self):
+        f1 = Function("f", 1, func_caller=lambda x: x)
+        f2 = Function("f", 1, func_caller=lambda x: x + 1)
+        t1 = FunctionalTerm(f1, (ArbitraryObject("x"),))
+        t2 = FunctionalTerm(f2, (ArbitraryObject("x"),))
+        assert t1 == t2
+        assert t1 is not t2
+        assert t2.f is f2
+
+    def test_atoms_shared(self):
+        p = Predicate("P", 1)
+        a1 = PredicateAtom(p, (ArbitraryObject("x"),))
+        a2 = PredicateAtom(Predicate("P", 1), (ArbitraryObject("x"),))
+        assert a1 is a2
+        assert DoAtom([a1]) is DoAtom([a2])
+
+    def test_disabled(self):
+        assert interning_enabled()
+        disable_interning()
+        try:
+            x1 = ArbitraryObject("x")
+            x2 = ArbitraryObject("x")
+            assert x1 is not x2
+            assert x1 == x2
+            assert hash(x1) == hash(x2)
+        finally:
+            enable_interning()
+
+    def test_pickle(self):
+        atom = PredicateAtom(
+            Predicate("P", 1),
+            (FunctionalTerm(Function("f", 1), (ArbitraryObject("x"),)),),
+        )
+        new_atom = pickle.loads(pickle.dumps(atom))
+        assert new_atom is atom
+
+    def test_replace_unchanged(self):
+        x = ArbitraryObject("x")
+        term = FunctionalTerm(Function("f", 1), (x,))
+        atom = PredicateAtom(Predicate("P", 1), (term,))
+        state = State([atom])
+        y = ArbitraryObject("y")
+        assert term._replace_arbs({y: x}) is term
+        assert atom.replace_term(y, x) is atom
+        assert state._replace_arbs({}) is state
+
+    def test_doatom_replace_keeps_polarity(self):
+        x = ArbitraryObject("x")
+        atom = PredicateAtom(Predicate("P", 1), (x,))
+        do_atom = DoAtom([atom], polarity=False)
+        new_do_atom = do_atom._replace_arbs({x: ArbitraryObject("y")})
+        assert new_do_atom.polarity is False
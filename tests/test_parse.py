@@ -1,8 +1,17 @@
+import ast
+import inspect
+from io import StringIO
+
 import pytest
 
-from pyetr import View
-from pyetr.func_library import log, power
+import pyetr.cases
+from pyetr import Function, FunctionalTerm, PredicateAtom, View
+from pyetr.func_library import div, log, power
+from pyetr.interning import disable_interning, enable_interning
 from pyetr.parsing.common import ParsingError
+from pyetr.parsing.string_parser.fast_parse_string import fast_parse_string
+from pyetr.parsing.string_parser.parse_string import parse_string
+from pyetr.utils import SmtLibContext, smt_lib_to_views, views_to_smt_lib
 
 
 class TestFunction:
@@ -69,3 +78,226 @@ class TestFunction:
         v1 = View.from_str("{A(++(1,2*))}")
         v2 = View.from_str("{A(3)}")
         assert v1 == v2
+
+
+class TestBulkParse:
+    strings = [
+        "∀x {P(x)Q(f(x))}^{P(x)}",
+        "{0.3=* P(a())R(b()), ~P(a())}",
+        "∀x {P(x)Q(f(x))}^{P(x)}",
+        "∃y {do(S(y)), Q(f(y))}",
+    ]
+
+    def test_matches_from_str(self):
+        views = View.from_strs(self.strings)
+        assert views == [View.from_str(s) for s in self.strings]
+
+    def test_shared_symbols(self):
+        disable_interning()
+        try:
+            v1, v2 = View.from_strs(["{P(f(a()))}", "{Q(a())P(a())}"])
+        finally:
+            enable_interning()
+        (s1,) = v1.stage
+        (s2,) = v2.stage
+        atoms = {
+            a.predicate.name: a for a in [*s1, *s2] if isinstance(a, PredicateAtom)
+        }
+        (p1,) = s1
+        assert isinstance(p1, PredicateAtom)
+        assert p1 is not atoms["P"]
+        assert p1.predicate is atoms["P"].predicate
+        (f_term,) = p1.terms
+        (q_term,) = atoms["Q"].terms
+        assert isinstance(f_term, FunctionalTerm)
+        assert isinstance(q_term, FunctionalTerm)
+        (a_term,) = f_term.t
+        assert isinstance(a_term, FunctionalTerm)
+        assert a_term.f is q_term.f
+
+    def test_custom_functions(self):
+        views = View.from_strs(["{P(power(2,3))}"], custom_functions=[power])
+        assert views[0] == View.from_str("{P(8)}")
+
+    def test_pool_matches_serial(self):
+        strings = self.strings * 3
+        pooled = View.from_strs(strings, max_workers=2, chunksize=1)
+        assert pooled == View.from_strs(strings)
+
+    def test_invalid_chunksize(self):
+        with pytest.raises(ValueError, match="chunksize must be at least 1"):
+            View.from_strs(self.strings, chunksize=0)
+
+    def test_invalid_string(self):
+        with pytest.raises(ParsingError):
+            View.from_strs(["{P(a())}", "{P(a()"])
+
+
+def case_strings() -> list[str]:
+    """
+    Gathers the view strings written in pyetr.cases.
+    """
+    strings: list[str] = []
+    for node in ast.walk(ast.parse(inspect.getsource(pyetr.cases))):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "ps"
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ):
+            strings.append(node.args[0].value)
+    return strings
+
+
+class TestFastParser:
+    @pytest.mark.parametrize("s", case_strings())
+    def test_matches_pyparsing(self, s: str):
+        expected = parse_string(s).to_string()
+        assert fast_parse_string(s).to_string() == expected
+        assert View.from_str(s, fast=True) == View.from_str(s)
+
+    @pytest.mark.parametrize(
+        "s",
+        [
+            "{}",
+            "{0}",
+            "{P()}^{ }",
+            "Ax Ey {P(x y)}",
+            "∀x ∀y {P(x***y)}",
+            "∀x ∀y ∀z {P(x**y**z)}",
+            "∀x ∀y {P(x* x̄ y)}",
+            "∀x {P(x**)}",
+            "{P(**(1,2))}",
+            "{P(++(1, 2))}",
+            "{P(- 3 . 5)}",
+            "{0.3 0.5=* 2=+ P()}",
+            "{do(P())~do(Q())}",
+            "{dog(a())DO (P())}",
+            "{==(a(),b())}",
+            "∀x {P((x)*)}",
+        ],
+    )
+    def test_edge_cases(self, s: str):
+        assert fast_parse_string(s).to_string() == parse_string(s).to_string()
+
+    @pytest.mark.parametrize(
+        "s", ["{ }", "{P(a()),}", "{P(a(),)}", "{P(3.)}", "{2=+ 0.3=* P()}", "{P(a()"]
+    )
+    def test_errors_from_pyparsing(self, s: str):
+        with pytest.raises(ParsingError) as expected:
+            parse_string(s)
+        with pytest.raises(ParsingError) as fast:
+            fast_parse_string(s)
+        assert str(fast.value) == str(expected.value)
+
+    @pytest.mark.parametrize("s", ["{P(**())}", "{P(**(a()))}"])
+    def test_xbar_arity(self, s: str):
+        with pytest.raises(ParsingError, match="x̄ takes two terms"):
+            fast_parse_string(s)
+
+
+class TestBinary:
+    strings = [
+        "∀x ∃y {0.3=* P(x*)Q(f(y))}^{P(x*)}",
+        "{2=+ do(S(a()))~T(b()), ~do(S(a()))}",
+        "∀z {P(z**)R(1.5,-2)}",
+    ]
+
+    def test_round_trip(self):
+        for s in self.strings:
+            v = View.from_str(s)
+            new_view = View.from_bytes(v.to_bytes())
+            assert new_view == v
+            assert new_view.weights == v.weights
+            assert new_view.issue_structure == v.issue_structure
+            assert new_view.to_str() == v.to_str()
+
+    def test_custom_func(self):
+        v = View.from_str(
+            "Ax {power(++(1, log(++(1, x))), -1)=+ 0} ^ {D(x*)}",
+            custom_functions=[power, log],
+        )
+        new_view = View.from_bytes(v.to_bytes())
+        assert new_view == v
+        ((_, weight),) = new_view.weights.items()
+        (term,) = weight.additive
+        assert isinstance(term, FunctionalTerm)
+        assert term.f.func_caller is not None
+        assert term.f.func_caller(2, 3) == 8
+
+    def test_many_shares_symbols(self):
+        views = [View.from_str(s) for s in self.strings]
+        data = View.to_bytes_many(views * 10)
+        assert len(data) < sum(len(v.to_bytes()) for v in views) * 5
+        disable_interning()
+        try:
+            new_views = View.from_bytes_many(data)
+        finally:
+            enable_interning()
+        assert new_views == views * 10
+        atom_ids = [{id(a) for a in v.stage.atoms} for v in new_views]
+        assert atom_ids[0] == atom_ids[len(views)]
+
+    def test_many_func_callers(self):
+        views = [
+            View.from_str(
+                "{P(f(x(),y()))}", custom_functions=[Function.numeric(c, "f")]
+            )
+            for c in [power, div]
+        ]
+        new_views = View.from_bytes_many(View.to_bytes_many(views))
+        for new_view, c in zip(new_views, [power, div]):
+            ((atom,),) = new_view.stage
+            assert isinstance(atom, PredicateAtom)
+            (term,) = atom.terms
+            assert isinstance(term, FunctionalTerm)
+            assert term.f.func_caller is not None
+            assert term.f.func_caller(8, 2) == c(8, 2)
+
+    def test_invalid_data(self):
+        data = View.from_str("{P(a())}").to_bytes()
+        with pytest.raises(ValueError, match="not in the binary view format"):
+            View.from_bytes(b"{P(a())}")
+        with pytest.raises(ValueError, match="Unsupported binary view format"):
+            View.from_bytes(data[:5] + b"\xff" + data[6:])
+        with pytest.raises(ValueError, match="Malformed"):
+            View.from_bytes(data[:-3])
+        with pytest.raises(ValueError, match="Expected a single view"):
+            View.from_bytes(View.to_bytes_many([]))
+
+
+class TestSmtLibContext:
+    strings = [
+        "{A(a())B(b())}",
+        "∀x {P(x)Q(x)}^{P(x)}",
+        "{A(a()),B(c())}",
+        "∃y {R(y,a())}",
+    ]
+
+    def test_round_trip(self):
+        views = [View.from_str(s) for s in self.strings]
+        context = SmtLibContext()
+        new_views = context.from_smt_lib(context.to_smt_lib(views))
+        assert len(new_views) == len(views)
+        for new_view, v in zip(new_views, views):
+            assert new_view.is_equivalent_under_arb_sub(v)
+
+    def test_declares_used_symbols(self):
+        context = SmtLibContext()
+        context.to_smt_lib([View.from_str("{A(a())B(b())}")])
+        smt_lib = context.to_smt_lib([View.from_str("{R(c(),a())}")])
+        assert "(declare-fun R (U U) Bool)" in smt_lib
+        assert "(declare-fun A" not in smt_lib
+        assert smt_lib.count("declare-sort") == 1
+
+    def test_shared_declarations(self):
+        context = SmtLibContext()
+        context.from_smt_lib(context.to_smt_lib([View.from_str("{A(a())}")]))
+        (v,) = context.iter_smt_lib(StringIO("(assert (not (A a)))"))
+        assert v == View.from_str("{~A(a())}")
+
+    def test_single_view_conjunction(self):
+        v = View.from_str("{A(a())B(b())}")
+        (new_view,) = smt_lib_to_views(views_to_smt_lib([v]))
+        assert new_view == v
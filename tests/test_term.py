@@ -1,6 +1,8 @@
 import pytest
 
 from pyetr import ArbitraryObject, Function, FunctionalTerm
+from pyetr.atoms.terms import Multiset, RealNumber, Term
+from pyetr.atoms.terms.special_funcs import XBar, multiset_product
 
 
 class TestFunction:
@@ -56,3 +58,37 @@ class TestFunctionalTerm:
             t.detailed
             == "<FunctionalTerm f=Function(func, 1) t=(<ArbitraryObject name=x1>)>"
         )
+
+
+class TestMultisetProduct:
+    def test_numbers_folded(self):
+        m1 = Multiset[Term]([FunctionalTerm(RealNumber(0.5), ())])
+        m2 = Multiset[Term](
+            [FunctionalTerm(RealNumber(3), ()), FunctionalTerm(RealNumber(0.2), ())]
+        )
+        expected = Multiset[Term](
+            [FunctionalTerm(XBar, (s, t)) for s in m1 for t in m2]
+        )
+        assert multiset_product(m1, m2) == expected
+        assert {
+            t.f for t in multiset_product(m1, m2) if isinstance(t, FunctionalTerm)
+        } == {
+            RealNumber(1.5),
+            RealNumber(0.1),
+        }
+
+    def test_symbolic_kept(self):
+        x = ArbitraryObject(name="x")
+        m1 = Multiset[Term]([FunctionalTerm(RealNumber(0.5), ())])
+        m2 = Multiset[Term]([x])
+        (product,) = multiset_product(m1, m2)
+        assert isinstance(product, FunctionalTerm)
+        assert product.f == XBar
+        assert product.arb_objects == {x}
+
+    def test_empty_side(self):
+        m1 = Multiset[Term]([FunctionalTerm(RealNumber(2), ())])
+        empty = Multiset[Term]([])
+        assert multiset_product(m1, empty) is m1
+        assert m1 + empty is m1
+        assert empty + m1 is m1
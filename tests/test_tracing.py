@@ -0,0 +1,102 @@
+import asyncio
+import threading
+
+import pytest
+
+from pyetr import View
+from pyetr.exceptions import OperationUndefinedError
+from pyetr.tracing import (
+    OperatorProfile,
+    TraceEvent,
+    add_listener,
+    remove_listener,
+    tracing,
+)
+
+v1 = View.from_str("∀x {P(x)Q(a()), R(b())}")
+v2 = View.from_str("{Q(a())}")
+
+
+class TestTracing:
+    def test_update_events(self):
+        events: list[TraceEvent] = []
+        with tracing(events.append):
+            out = v1.update(v2)
+        assert (events[0].phase, events[0].operator, events[0].depth) == (
+            "start",
+            "update",
+            0,
+        )
+        nested = {e.operator for e in events if e.depth == 1}
+        assert {"universal_product", "existential_sum", "merge"} <= nested
+        end = events[-1]
+        assert (end.phase, end.operator, end.depth) == ("end", "update", 0)
+        assert end.stage_size == 2 and end.arb_objects == 1
+        assert end.other_stage_size == 1
+        assert end.output_stage_size == len(out.stage)
+        assert end.output_arb_objects == len(out.stage_supp_arb_objects)
+        assert end.elapsed is not None and end.elapsed >= 0
+        starts = [e for e in events if e.phase == "start"]
+        assert len(starts) * 2 == len(events)
+
+    def test_scoping(self):
+        events: list[TraceEvent] = []
+        with tracing(events.append):
+            v1.negation()
+        count = len(events)
+        v1.negation()
+        assert count > 0 and len(events) == count
+
+    def test_scoped_to_context(self):
+        events: list[TraceEvent] = []
+        with tracing(events.append):
+            # A thread has a context of its own, so its calls are not traced
+            thread = threading.Thread(target=v1.negation)
+            thread.start()
+            thread.join()
+            assert events == []
+            asyncio.run(asyncio.to_thread(v1.negation))
+            assert events[0].operator == "negation"
+
+    def test_add_remove(self):
+        events: list[TraceEvent] = []
+        add_listener(events.append)
+        try:
+            v1.factor(v2)
+        finally:
+            remove_listener(events.append)
+        assert events[0].operator == "factor"
+        with pytest.raises(ValueError, match="is not a listener"):
+            remove_listener(events.append)
+
+    def test_profile(self):
+        profile = OperatorProfile()
+        with tracing(profile):
+            v1.update(v2)
+            v1.update(v2)
+        folded = dict(line.rsplit(" ", 1) for line in profile.folded().split("\n"))
+        assert "update" in folded
+        assert "update;merge" in folded
+        summary = profile.summary().split("\n")
+        assert summary[1].split()[:2] == ["update", "2"]
+        assert any(line.startswith("  merge") for line in summary)
+        profile.clear()
+        assert profile.folded() == ""
+
+    def test_operator_raises(self):
+        events: list[TraceEvent] = []
+        profile = OperatorProfile()
+        # The sum of views with different suppositions is undefined
+        supposing = View.from_str("{P(a())}^{Q(b())}")
+        with tracing(events.append), tracing(profile):
+            with pytest.raises(OperationUndefinedError):
+                v2.sum(supposing)
+            v1.product(v2)
+        error = next(e for e in events if e.phase == "error")
+        assert error.operator == "sum"
+        assert isinstance(error.error, OperationUndefinedError)
+        assert error.output_stage_size is None
+        folded = dict(line.rsplit(" ", 1) for line in profile.folded().split("\n"))
+        assert "sum" in folded
+        assert "product" in folded
+        assert not any(path.startswith("sum;") for path in folded)
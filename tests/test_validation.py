@@ -0,0 +1,144 @@
+import pytest
+
+from pyetr import (
+    ArbitraryObject,
+    Dependency,
+    DependencyRelation,
+    PredicateAtom,
+    SetOfStates,
+    State,
+    View,
+)
+from pyetr.atoms import Predicate
+from pyetr.caching import (
+    disable_operator_cache,
+    enable_operator_cache,
+    operator_cache_info,
+)
+from pyetr.issues import IssueStructure
+from pyetr.tracing import TraceEvent, tracing
+from pyetr.validation import (
+    ValidationLevel,
+    current_validation_level,
+    disable_validation_debug,
+    enable_validation_debug,
+    get_validation_level,
+    set_validation_level,
+    validation_level,
+)
+
+x = ArbitraryObject("x")
+y = ArbitraryObject("y")
+
+
+def invalid_view(validation: ValidationLevel | None = None) -> View:
+    # x is in the stage but not the dependency relation
+    return View(
+        stage=SetOfStates({State({PredicateAtom(Predicate("P", 1), (x,))})}),
+        supposition=SetOfStates({State()}),
+        dependency_relation=DependencyRelation(set(), set(), set()),
+        issue_structure=IssueStructure(),
+        weights=None,
+        validation=validation,
+    )
+
+
+def non_matryoshka() -> DependencyRelation:
+    u1, u2 = ArbitraryObject("u1"), ArbitraryObject("u2")
+    return DependencyRelation(
+        [u1, u2],
+        [x, y],
+        [
+            Dependency(existential=x, universal=u1),
+            Dependency(existential=y, universal=u2),
+        ],
+    )
+
+
+class TestValidation:
+    def test_user_views_fully_checked(self):
+        with pytest.raises(ValueError, match="not the same as those"):
+            invalid_view()
+        with pytest.raises(ValueError, match="Matryoshka"):
+            non_matryoshka()
+
+    def test_per_call(self):
+        assert invalid_view(ValidationLevel.CHEAP).stage_supp_arb_objects == {x}
+        view = invalid_view(ValidationLevel.OFF)
+        with pytest.raises(ValueError, match="not the same as those"):
+            view.validate()
+
+    def test_scope(self):
+        with validation_level(ValidationLevel.CHEAP):
+            invalid_view()
+            with pytest.raises(ValueError, match="Matryoshka"):
+                non_matryoshka()
+        with validation_level(ValidationLevel.OFF):
+            non_matryoshka()
+        with pytest.raises(ValueError):
+            invalid_view()
+
+    def test_debug(self):
+        enable_validation_debug()
+        try:
+            with validation_level(ValidationLevel.OFF):
+                with pytest.raises(ValueError, match="not the same as those"):
+                    invalid_view(ValidationLevel.OFF)
+        finally:
+            disable_validation_debug()
+        invalid_view(ValidationLevel.OFF)
+
+    def test_debug_skips_cache(self):
+        v1 = View.from_str("∀x {P(x)Q(a()), R(b())}")
+        v2 = View.from_str("{Q(a())}")
+        enable_operator_cache()
+        try:
+            v1.update(v2)
+            enable_validation_debug()
+            try:
+                v1.update(v2)
+            finally:
+                disable_validation_debug()
+            info = operator_cache_info()
+            assert info is not None and info.hits == 0
+            v1.update(v2)
+            info = operator_cache_info()
+            assert info is not None and info.hits == 1
+        finally:
+            disable_operator_cache()
+
+    def test_operator_level(self):
+        levels: list[tuple[int, ValidationLevel]] = []
+
+        def listener(event: TraceEvent):
+            if event.phase == "start":
+                levels.append((event.depth, current_validation_level()))
+
+        v1 = View.from_str("∀x {P(x)Q(a()), R(b())}")
+        v2 = View.from_str("{Q(a())}")
+        assert get_validation_level() == ValidationLevel.CHEAP
+        with tracing(listener):
+            v1.update(v2)
+        assert levels[0] == (0, ValidationLevel.FULL)
+        assert all(level == ValidationLevel.CHEAP for _, level in levels[1:])
+
+        levels.clear()
+        set_validation_level(ValidationLevel.OFF)
+        try:
+            with tracing(listener):
+                v1.merge(v2)
+        finally:
+            set_validation_level(ValidationLevel.CHEAP)
+        assert all(level == ValidationLevel.OFF for d, level in levels if d > 0)
+
+    def test_levels_agree(self):
+        v1 = View.from_str("∀x ∃a {P(x)E(x,a),~P(x*)}")
+        v2 = View.from_str("{P(j()*)}")
+        results = []
+        for level in ValidationLevel:
+            set_validation_level(level)
+            try:
+                results.append(v1.update(v2))
+            finally:
+                set_validation_level(ValidationLevel.CHEAP)
+        assert results[0] == results[1] == results[2]
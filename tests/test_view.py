@@ -1,7 +1,16 @@
-import pytest
-
+from pyetr.atoms.terms import ArbitraryObject, FunctionalTerm, RealNumber, Summation
 from pyetr.atoms.terms.function import Function, NumFunc
-from pyetr.view import View
+from pyetr.stateset import SetOfStates, State
+from pyetr.tools import ArbitraryObjectGenerator, powerset
+from pyetr.view import (
+    View,
+    get_subset,
+    issue_matches,
+    phi,
+    stage_function_product,
+    state_division,
+)
+from pyetr.weight import Weight, Weights
 
 
 def ps(s: str, custom_functions: list[NumFunc | Function] | None = None) -> View:
@@ -24,7 +33,301 @@ class TestView:
         )
 
         result = v[0].universal_product(v[1])
-        with pytest.raises(
-            ValueError, match="Too many unis or exis to feasibly compute"
+        assert result.is_equivalent_under_arb_sub(c)
+
+    def test_equivalent_symmetric(self):
+        v1 = ps("∃a ∃b ∃c {P(a,b)P(b,c)P(c,a)}")
+        v2 = ps("∃x ∃y ∃z {P(y,z)P(z,x)P(x,y)}")
+        v3 = ps("∃x ∃y ∃z {P(y,z)P(z,x)P(y,x)}")
+        assert v1.is_equivalent_under_arb_sub(v2)
+        assert not v1.is_equivalent_under_arb_sub(v3)
+
+    def test_equivalent_respects_quantifier(self):
+        v1 = ps("∀a ∃b {P(a,b)}")
+        v2 = ps("∀b ∃a {P(b,a)}")
+        v3 = ps("∃a ∀b {P(b,a)}")
+        assert v1.is_equivalent_under_arb_sub(v2)
+        assert not v1.is_equivalent_under_arb_sub(v3)
+
+    def test_equivalent_many_exis(self):
+        n = 14
+        v1 = ps(
+            " ".join(f"∃x{i}" for i in range(n))
+            + " {"
+            + ",".join(f"P(x{i},x{(i+1)%n})" for i in range(n))
+            + "}"
+        )
+        v2 = ps(
+            " ".join(f"∃y{i}" for i in range(n))
+            + " {"
+            + ",".join(f"P(y{(i+5)%n},y{(i+6)%n})" for i in range(n))
+            + "}"
+        )
+        assert v1.is_equivalent_under_arb_sub(v2)
+        assert v1.canonical_key == v2.canonical_key
+
+
+class TestSubsetOperators:
+    def test_get_subset(self):
+        gamma = ps("{P(a())Q(b()),P(a()),R(c())}").stage
+        psi = ps("{P(a()),S(d())}").stage
+        assert get_subset(gamma, psi) == ps("{P(a())Q(b()),P(a())}").stage
+
+    def test_state_division_known_presupposition(self):
+        v1 = ps("{P(a())Q(b()),R(c())}")
+        v2 = ps("{Q(b())}")
+        gamma = next(s for s in v1.stage if len(s) == 2)
+        args = (gamma, v1.stage, v2.stage, v2.supposition)
+        assert state_division(*args) == state_division(*args, presupposition=True)
+        assert state_division(*args, presupposition=False) == gamma
+
+    def test_stage_function_product_adds_repeated_states(self):
+        v1 = ps("{2=* P(a()),3=* Q(b())}")
+        v2 = ps("{P(a())Q(b())}")
+        stage, weights = stage_function_product(
+            (v1.stage, v1.weights), (v2.stage, v2.supposition, v2.weights)
+        )
+        assert stage == v2.stage
+        (state,) = stage
+        assert len(weights[state].multiplicative) == 2
+
+
+def _phi_by_powerset(
+    gamma, delta, m_prime, other_supposition, gamma_weight, delta_weight
+):
+    # Φ(γ, δ) checked over every subset of M'ij, as in the definition
+    if not any(psi.issubset(gamma) for psi in other_supposition):
+        return False
+    for m_prime_set in powerset(m_prime):
+        exis = [e for _, e in m_prime_set]
+        if len(exis) != len(set(exis)):
+            continue
+        replacements = {e: t for t, e in m_prime_set}
+        if delta._replace_arbs(replacements).issubset(gamma) and (
+            delta_weight.is_null
+            or delta_weight._replace_arbs(replacements) == gamma_weight
         ):
-            result.is_equivalent_under_arb_sub(c)
+            return True
+    return False
+
+
+class TestSubstitutionSearch:
+    def test_powerset_is_lazy(self):
+        subsets = powerset(range(1000))
+        assert next(subsets) == set()
+        assert next(subsets) == {0}
+
+    def test_powerset_complete(self):
+        assert sorted(map(sorted, powerset("abc"))) == sorted(
+            [
+                [],
+                ["a"],
+                ["b"],
+                ["c"],
+                ["a", "b"],
+                ["a", "c"],
+                ["b", "c"],
+                ["a", "b", "c"],
+            ]
+        )
+
+    def test_phi_matches_powerset(self):
+        other = ps("∃x ∃y {P(x,y)Q(y)}")
+        (delta,) = other.stage
+        x, y = sorted(delta.arb_objects, key=lambda e: e.name)
+        z = ArbitraryObject(name="z")
+        a, b, c = (FunctionalTerm(Function(n, 0), ()) for n in "abc")
+        gammas = [
+            s
+            for s in ps(
+                "{P(a(),b())Q(b())R(c()),P(a(),b())Q(a()),P(b(),b())Q(b())}"
+            ).stage
+        ]
+        terms = [(t, e) for t in (a, b, c) for e in (x, y, z)]
+        for m_prime in map(set, [terms, terms[:4], terms[2:], terms[::2], []]):
+            for gamma in gammas:
+                args = (
+                    gamma,
+                    delta,
+                    m_prime,
+                    other.supposition,
+                    Weight(),
+                    Weight(),
+                )
+                assert phi(*args) == _phi_by_powerset(*args)
+
+    def test_which_counts_unused_existentials(self):
+        # y is in neither P(x*) nor its weight, but each of its 3 choices is counted
+        v1 = ps("{P(a()*)Q(b()*)Q(c()*)}")
+        v2 = ps("∃x ∃y {f(x*)=* P(x*),Q(y*)}")
+        assert v1.which(v2) == ps("{f(a())|f(a())|f(a())=* P(a()*),Q(b()*),Q(c()*)}")
+
+
+class TestNumericAnswerPotential:
+    def test_matches_symbolic(self):
+        v = View.from_str("{2|3=* A()B(), 4=* A()C(), B()C(), 0.5=* D()}")
+        questions = [
+            "{A()}",
+            "{B(),D()}",
+            "{A()B(),C()}",
+            "{E()}",
+            "{0}",
+            "{}",
+        ]
+        stages = [View.from_str(q).stage for q in questions]
+        nums = v.stage.numeric_answer_potentials(stages, v.weights)
+        for stage, num in zip(stages, nums):
+            assert num == v.stage.numeric_answer_potential(stage, v.weights)
+            assert num is not None
+            potential = v.stage.equilibrium_answer_potential(stage, v.weights)
+            assert potential == FunctionalTerm(RealNumber(num), ())
+        assert nums[0] == 9.0
+        assert nums[3] == 0
+
+    def test_symbolic_weights(self):
+        v = View.from_str("∃e {f(e)=* A(e*), 2=* B()}")
+        stages = [View.from_str("{A(a())}").stage, View.from_str("{B()}").stage]
+        # A(e*) is not a superset of A(a()), so only B() is selected for the first
+        nums = v.stage.numeric_answer_potentials(stages, v.weights)
+        assert nums == [0, 2.0]
+        everything = View.from_str("{0}").stage
+        assert v.stage.numeric_answer_potential(everything, v.weights) is None
+        potential = v.stage.equilibrium_answer_potential(everything, v.weights)
+        assert potential.f == Summation
+
+
+class TestIssueMatches:
+    def test_matches_negated_issues(self):
+        v1 = View.from_str("{P(a()*)Q(b()*),R(c()*)}")
+        v2 = View.from_str("{~P(a()*),~Q(d()*)}")
+        assert issue_matches(v1.issue_structure, v2.issue_structure) == {
+            (
+                FunctionalTerm(Function("a", 0), ()),
+                FunctionalTerm(Function("a", 0), ()),
+            ),
+            (
+                FunctionalTerm(Function("b", 0), ()),
+                FunctionalTerm(Function("d", 0), ()),
+            ),
+        }
+
+    def test_restriction(self):
+        v = View.from_str("{P(a()*)Q(b()*)}")
+        issues = v.issue_structure
+        assert issues.restriction(v.stage.atoms) is issues
+        (remaining,) = issues.restriction(View.from_str("{P(a())}").stage.atoms)
+        assert str(remaining[0]) == "a"
+        do_view = View.from_str("{DO(Q(b()*))}")
+        assert len(do_view.issue_structure.restriction(do_view.stage.atoms)) == 1
+
+
+class TestDerivedSets:
+    def test_kept(self):
+        v = View.from_str("∀x {P(x)Q(a()),DO(R(b()))}^{P(x)}")
+        assert v.stage.arb_objects is v.stage.arb_objects
+        assert v.stage.atoms is v.stage.atoms
+        assert v.stage_supp_arb_objects is v.stage_supp_arb_objects
+        assert {str(a) for a in v.stage.predicate_atoms} == {"P(x)", "Q(a)", "R(b)"}
+
+    def test_union_and_product(self):
+        v1 = View.from_str("∀x {P(x),Q(a())}")
+        v2 = View.from_str("∃y {R(y)}")
+        for s1, s2 in [(v1.stage, v2.stage), (v1.stage, SetOfStates())]:
+            # Found before combining, so that they are composed
+            for s in s1, s2:
+                assert s.atoms == s.predicate_atoms == frozenset().union(*s)
+                assert s.arb_objects <= v1.stage.arb_objects | v2.stage.arb_objects
+            for combined in s1 | s2, s1 * s2:
+                fresh = SetOfStates(State(state) for state in combined)
+                assert combined.arb_objects == fresh.arb_objects
+                assert combined.atoms == fresh.atoms
+                assert combined.predicate_atoms == fresh.predicate_atoms
+
+    def test_weights_adding(self):
+        v = View.from_str("∀x {f(x)=* P(x)}")
+        weights = Weights()
+        assert weights.arb_objects == frozenset()
+        for state, weight in v.weights.items():
+            weights.adding(state, weight)
+        assert weights.arb_objects == v.stage.arb_objects
+
+
+class TestPrimitiveAbsurd:
+    def test_rules(self):
+        def absurd(s: str) -> bool:
+            (state,) = View.from_str(s).stage
+            return state.is_primitive_absurd(None)
+
+        assert absurd("{P(a())~P(a())}")
+        assert absurd("{~==(a(),a())}")
+        assert absurd("{P(a(),c())~P(b(),c())==(a(),b())}")
+        assert not absurd("{P(a())~P(c())==(a(),b())==(b(),c())}")
+        assert not absurd("{P(a())Q(b())==(a(),b())}")
+
+    def test_custom_absurd_states(self):
+        stage = View.from_str("{P(a())Q(b()),P(a())R(c()),Q(b())}").stage
+        (pattern,) = View.from_str("{P(a())Q(b())}").stage
+        (empty,) = View.from_str("{0}").stage
+        remaining = stage.without_primitive_absurd([pattern])
+        assert remaining == stage - SetOfStates([pattern])
+        assert all(s.is_primitive_absurd([pattern]) for s in stage - remaining)
+        assert stage.without_primitive_absurd([empty]) == SetOfStates()
+        assert stage.without_primitive_absurd(None) == stage
+
+    def test_many_custom_absurd_states(self):
+        absurd = list(
+            View.from_str(
+                "{" + ",".join(f"P{i}(a())Q{i}(b())" for i in range(10)) + "}"
+            ).stage
+        )
+        stage = View.from_str("{P3(a())Q3(b())R(c()),P3(a())Q4(b()),R(c())}").stage
+        remaining = View.from_str("{P3(a())Q4(b()),R(c())}").stage
+        assert stage.without_primitive_absurd(absurd) == remaining
+        assert stage.without_primitive_absurd(absurd + [State()]) == SetOfStates()
+
+
+class TestContainmentJoin:
+    def test_small_and_indexed_sets(self):
+        (gamma,) = View.from_str("{P(a())Q(b())R(c())}").stage
+        small = View.from_str("{0,P(a()),P(a())S(d()),Q(b())R(c())}").stage
+        large = View.from_str(
+            "{0,P(a()),S(d()),P(a())S(d()),Q(b())R(c()),Q(b()),R(c())S(d()),"
+            "T(e()),P(a())Q(b())R(c()),P(a())Q(b())R(c())S(d())}"
+        ).stage
+        for states in (small, large):
+            assert states.subsets_of(gamma) == [s for s in states if s.issubset(gamma)]
+            assert states.supersets_of(gamma) == [
+                s for s in states if gamma.issubset(s)
+            ]
+            assert states.has_subset_of(gamma)
+            assert states.containment_join(SetOfStates([gamma])) == [
+                (s, gamma) for s in states if gamma.issubset(s)
+            ]
+
+    def test_no_subset(self):
+        (gamma,) = View.from_str("{T(e())}").stage
+        stage = View.from_str(
+            "{P(a()),Q(b()),R(c()),S(d()),P(a())T(e()),Q(b())T(e()),"
+            "R(c())T(e()),S(d())T(e())}"
+        ).stage
+        assert not stage.has_subset_of(gamma)
+        assert stage.subsets_of(gamma) == []
+        assert not SetOfStates().has_subset_of(gamma)
+
+
+class TestArbitraryObjectGenerator:
+    def test_fresh_names(self):
+        existing = {ArbitraryObject(name=n) for n in ("a", "b", "d")}
+        arb_gen = ArbitraryObjectGenerator(existing)
+        assert [arb_gen._get_arb_obj().name for _ in range(3)] == ["c", "e", "f"]
+
+    def test_novelise_nothing(self):
+        v = ps("∀x {P(x*)}")
+        arb_gen = ArbitraryObjectGenerator(v.stage_supp_arb_objects)
+        assert arb_gen.novelise(set(), v) is v
+        assert v._replace_arbs({}) is v
+
+    def test_update_renames_shared_objects(self):
+        v1 = ps("∀x {P(x*)}")
+        v2 = ps("∀x {Q(x*)}")
+        assert v1.update(v2) == ps("∀x ∀a {P(x*)Q(a*)}")